@@ -0,0 +1,72 @@
+"""Compare the memory held by parsed `InitData` objects with an
+`InitDataBatch` of the same query strings.
+
+Usage:
+    python benchmarks/batch.py
+"""
+
+import gc
+import time
+import tracemalloc
+
+from init_data_py import InitData, types
+from init_data_py.batch import InitDataBatch
+
+BOT_TOKEN = "7244657541:AAEgqk0HDC3WD5cdbnGMdd6L0TJ74FDp97Y"
+
+
+def make_query_strings(number: int):
+    return [
+        InitData(
+            query_id=f"AAF03wc0AgAAAHTfBzRO{i:06d}",
+            user=types.User(
+                id=5167898484 + i,
+                first_name=f"xin{i}",
+                username=f"pvnimaxin{i}",
+                language_code=("en", "fa", "ru")[i % 3],
+                allows_write_to_pm=True,
+            ),
+            chat_type=("sender", "private", "group")[i % 3],
+        )
+        .sign(BOT_TOKEN, auth_date=1722938610 + i)
+        .to_query_string()
+        for i in range(number)
+    ]
+
+
+def measure(factory):
+    """Returns the seconds taken by `factory` and the bytes it retained."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    result = factory()
+    seconds = time.perf_counter() - start
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+
+    return seconds, after - before
+
+
+def main(number: int = 100_000) -> None:
+    query_strings = make_query_strings(number)
+    columns = ["user.id", "auth_date", "chat_type", "user.language_code"]
+
+    cases = {
+        "list[InitData]": lambda: [InitData.parse(qs) for qs in query_strings],
+        "InitDataBatch": lambda: InitDataBatch.parse(query_strings),
+        "InitDataBatch(4 columns)": lambda: InitDataBatch.parse(
+            query_strings, columns
+        ),
+    }
+    for name, factory in cases.items():
+        seconds, size = measure(factory)
+        print(
+            f"{name:<26} {size / number:8.1f} bytes/row"
+            f" {number / seconds:12,.0f} rows/sec"
+        )
+
+
+if __name__ == "__main__":
+    main()
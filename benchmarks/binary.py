@@ -0,0 +1,48 @@
+"""Compare storing init data as JSON or a query string against the binary
+format of `InitData.to_bytes`, by size and round-trip speed.
+
+Usage:
+    python benchmarks/binary.py
+"""
+
+import json
+import timeit
+
+import profiles
+from init_data_py import InitData
+
+
+def from_json(json_string: str) -> InitData:
+    """Restore init data from `to_json`, as a JSON session store would."""
+    fields = json.loads(json_string)
+    for name, field in InitData._object_fields.items():
+        if name in fields:
+            fields[name] = field.type._from_dict(fields[name])
+
+    return InitData(**fields)
+
+
+def main(number: int = 20_000) -> None:
+    for profile, init_data in profiles.build().items():
+        json_string = init_data.to_json()
+        query_string = init_data.to_query_string()
+        data = init_data.to_bytes()
+        print(
+            f"{profile}: json {len(json_string.encode())} B, "
+            f"query string {len(query_string)} B, binary {len(data)} B"
+        )
+
+        cases = {
+            "to_json": init_data.to_json,
+            "to_bytes": init_data.to_bytes,
+            "from json": lambda: from_json(json_string),
+            "parse": lambda: InitData.parse(query_string),
+            "from_bytes": lambda: InitData.from_bytes(data),
+        }
+        for name, func in cases.items():
+            seconds = min(timeit.repeat(func, number=number, repeat=3))
+            print(f"  {name:<12} {number / seconds:12,.0f} ops/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""Compare parsing and validating session-style traffic with and without a
+`ValidationCache`.
+
+Every session sends the same init data on each of its requests.
+
+Usage:
+    python benchmarks/cache.py
+"""
+
+import time
+
+from init_data_py import InitData, types
+from init_data_py.cache import ValidationCache
+
+BOT_TOKEN = "7244657541:AAEgqk0HDC3WD5cdbnGMdd6L0TJ74FDp97Y"
+
+
+def make_traffic(sessions: int, requests: int):
+    query_strings = [
+        InitData(
+            query_id=f"AAF03wc0AgAAAHTfBzRO{i:04d}",
+            user=types.User(
+                id=5167898484 + i,
+                first_name="xin",
+                username="pvnimaxin",
+                language_code="en",
+                allows_write_to_pm=True,
+            ),
+        )
+        .sign(BOT_TOKEN)
+        .to_query_string()
+        for i in range(sessions)
+    ]
+
+    return [qs for _ in range(requests) for qs in query_strings]
+
+
+def main(sessions: int = 100, requests: int = 500) -> None:
+    traffic = make_traffic(sessions, requests)
+    cache = ValidationCache(BOT_TOKEN, lifetime=3600)
+
+    def uncached():
+        for query_string in traffic:
+            InitData.parse(query_string).validate(BOT_TOKEN, 3600)
+
+    def cached():
+        for query_string in traffic:
+            cache.validate(query_string)
+
+    for name, func in (("parse + validate", uncached), ("cache", cached)):
+        start = time.perf_counter()
+        func()
+        seconds = time.perf_counter() - start
+        print(f"{name:<20} {len(traffic) / seconds:12,.0f} ops/sec")
+
+    print(f"hits={cache.hits} misses={cache.misses}")
+
+
+if __name__ == "__main__":
+    main()
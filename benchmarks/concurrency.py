@@ -0,0 +1,71 @@
+"""Measure how the throughput of a shared `ConcurrentValidator` scales
+with the number of threads.
+
+With the GIL, threads take turns, so expect flat numbers. On a free-threaded
+build (`python3.13t`) with enough cores, throughput should grow close to
+linearly, as threads share no locks on the hot path.
+
+Usage:
+    python benchmarks/concurrency.py [--threads 1 2 4 8] [--number 20000]
+"""
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+import profiles
+from init_data_py.concurrency import ConcurrentValidator
+
+
+def run(func, threads: int, number: int) -> float:
+    """Returns the calls per second of `func` over all threads."""
+    barrier = threading.Barrier(threads + 1)
+
+    def work() -> None:
+        barrier.wait()
+        for _ in range(number):
+            func()
+
+    workers = [threading.Thread(target=work) for _ in range(threads)]
+    for worker in workers:
+        worker.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for worker in workers:
+        worker.join()
+
+    return threads * number / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--number", type=int, default=20_000)
+    args = parser.parse_args()
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"GIL enabled: {gil}, CPUs: {os.cpu_count()}")
+
+    validator = ConcurrentValidator(profiles.BOT_TOKEN)
+    init_data = profiles.build()["full"]
+    query_string = init_data.to_query_string()
+
+    cases = {
+        "validate": lambda: validator.validate(init_data),
+        "authenticate": lambda: validator.authenticate(query_string),
+    }
+    for name, func in cases.items():
+        baseline = None
+        for threads in args.threads:
+            rate = run(func, threads, args.number)
+            baseline = baseline or rate
+            print(
+                f"{name:<14} {threads:>3} threads {rate:12,.0f} ops/sec "
+                f"{rate / baseline:6.2f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Compare repeatedly validating and serializing `InitData` against a
+`FrozenInitData`, which caches its serialized forms.
+
+Usage:
+    python benchmarks/frozen.py
+"""
+
+import timeit
+
+from init_data_py import InitData, Validator
+
+BOT_TOKEN = "7244657541:AAEgqk0HDC3WD5cdbnGMdd6L0TJ74FDp97Y"
+QUERY_STRING = "query_id=AAF03wc0AgAAAHTfBzROOCVW&user=%7B%22id%22%3A5167898484%2C%22first_name%22%3A%22xin%22%2C%22last_name%22%3A%22%22%2C%22username%22%3A%22pvnimaxin%22%2C%22language_code%22%3A%22en%22%2C%22allows_write_to_pm%22%3Atrue%7D&auth_date=1722938610&hash=8654c8c617c143abf656f4f159be2539880a56f58c2d9be622f90c0346aa162b"
+
+
+def main(number: int = 100_000) -> None:
+    validator = Validator(BOT_TOKEN)
+    init_data = InitData.parse(QUERY_STRING)
+    frozen = init_data.freeze()
+    sessions = {frozen: "session"}
+
+    def use(init_data):
+        validator.validate(init_data)
+        init_data.to_query_string()
+        init_data.to_json()
+
+    cases = {
+        "InitData": lambda: use(init_data),
+        "FrozenInitData": lambda: use(frozen),
+        "FrozenInitData dict lookup": lambda: sessions[frozen],
+    }
+    for name, func in cases.items():
+        seconds = min(timeit.repeat(func, number=number, repeat=5))
+        print(f"{name:<28} {seconds / number * 1e6:8.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""Measure the speed and peak memory of `calculate_hash`, which feeds the
+data-check string to the HMAC field by field, against building the whole
+data-check string from `to_dict` first.
+
+Usage:
+    python benchmarks/hashing.py
+"""
+
+import timeit
+import tracemalloc
+
+import profiles
+from init_data_py import InitData, Validator, types
+
+
+def peak(func, number: int = 100) -> float:
+    """Returns the peak bytes allocated by a single call of `func`."""
+    func()
+    tracemalloc.start()
+    peaks = []
+    for _ in range(number):
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        func()
+        peaks.append(tracemalloc.get_traced_memory()[1] - before)
+    tracemalloc.stop()
+
+    return min(peaks)
+
+
+def joined(validator: Validator, init_data: InitData) -> str:
+    """Hash the data-check string the way `calculate_hash` used to."""
+    pairs = init_data.to_dict(nested=False)
+    pairs.pop("hash", None)
+    data_check_string = "\n".join(f"{k}={v}" for k, v in sorted(pairs.items()))
+
+    return validator._hexdigest(data_check_string.encode())
+
+
+def padded(size: int) -> InitData:
+    """Returns init data with a `start_param` of `size` bytes."""
+    return InitData(
+        user=types.User(id=5167898484, first_name="xin"),
+        start_param="s" * size,
+        auth_date=profiles.AUTH_DATE,
+    )
+
+
+def main(number: int = 20_000) -> None:
+    validator = Validator(profiles.BOT_TOKEN)
+    payloads = {
+        **profiles.build(),
+        **{f"padded {size}": padded(size) for size in (1024, 16384, 65536)},
+    }
+
+    for profile, init_data in payloads.items():
+        cases = {
+            "joined": lambda: joined(validator, init_data),
+            "streamed": lambda: validator.calculate_hash(init_data),
+        }
+        print(f"{profile}: {len(init_data._data_check_string())} B")
+        for name, func in cases.items():
+            seconds = min(timeit.repeat(func, number=number, repeat=3))
+            print(
+                f"  {name:<10} {number / seconds:12,.0f} ops/sec "
+                f"{peak(func):10,.0f} B peak"
+            )
+
+
+if __name__ == "__main__":
+    main()
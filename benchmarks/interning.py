@@ -0,0 +1,73 @@
+"""Compare parsing group-chat traffic with and without an
+`interning.InternPool`, in time and retained memory.
+
+Many sessions share the same `chat` and a few `user` JSON strings.
+
+Usage:
+    python benchmarks/interning.py
+"""
+
+import gc
+import time
+import tracemalloc
+
+from init_data_py import InitData, interning, types
+
+BOT_TOKEN = "7244657541:AAEgqk0HDC3WD5cdbnGMdd6L0TJ74FDp97Y"
+
+
+def make_traffic(sessions: int, users: int):
+    chat = types.Chat(id=-1001, type="supergroup", title="xin", username="x")
+    return [
+        InitData(
+            query_id=f"AAF03wc0AgAAAHTfBzRO{i:06d}",
+            user=types.User(
+                id=5167898484 + i % users,
+                first_name="xin",
+                username="pvnimaxin",
+                language_code="en",
+                allows_write_to_pm=True,
+            ),
+            chat=chat,
+        )
+        .sign(BOT_TOKEN)
+        .to_query_string()
+        for i in range(sessions)
+    ]
+
+
+def measure(traffic):
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    start = time.perf_counter()
+    parsed = [InitData.parse(query_string) for query_string in traffic]
+    seconds = time.perf_counter() - start
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del parsed
+
+    return seconds, after - before
+
+
+def main(sessions: int = 50_000, users: int = 500) -> None:
+    traffic = make_traffic(sessions, users)
+
+    seconds, size = measure(traffic)
+    print(
+        f"{'no pool':<10} {sessions / seconds:10,.0f} parses/sec"
+        f" {size / sessions:8.1f} bytes/init data"
+    )
+
+    pool = interning.enable()
+    seconds, size = measure(traffic)
+    interning.disable()
+    print(
+        f"{'pool':<10} {sessions / seconds:10,.0f} parses/sec"
+        f" {size / sessions:8.1f} bytes/init data"
+        f"  hit rate {pool.hit_rate:.1%}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""Compare the JSON backends on user/chat-heavy payloads.
+
+Usage:
+    python benchmarks/json_backend.py
+"""
+
+import timeit
+
+import profiles
+from init_data_py import InitData, json_backend, types
+
+
+def main(number: int = 20_000) -> None:
+    init_data = profiles.max_size()
+    query_string = init_data.sign(profiles.BOT_TOKEN).to_query_string()
+    user_json = init_data.user.to_json()
+    chat_json = init_data.chat.to_json()
+
+    cases = {
+        "User.from_json": lambda: types.User.from_json(user_json),
+        "Chat.from_json": lambda: types.Chat.from_json(chat_json),
+        "User.to_json": init_data.user.to_json,
+        "parse": lambda: InitData.parse(query_string),
+        "calculate_hash": lambda: init_data.calculate_hash(profiles.BOT_TOKEN),
+    }
+
+    for backend in ("json", "orjson", "msgspec"):
+        try:
+            json_backend.set_backend(backend)
+        except ImportError:
+            print(f"{backend}: not installed")
+            continue
+
+        for name, func in cases.items():
+            seconds = min(timeit.repeat(func, number=number, repeat=3))
+            print(f"{backend:<8} {name:<16} {number / seconds:12,.0f} ops/sec")
+
+
+if __name__ == "__main__":
+    main()
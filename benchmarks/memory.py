@@ -0,0 +1,42 @@
+"""Measure the memory held by parsed `InitData` objects.
+
+Usage:
+    python benchmarks/memory.py
+"""
+
+import gc
+import tracemalloc
+
+from init_data_py import InitData, types
+
+QUERY_STRING = "query_id=AAF03wc0AgAAAHTfBzROOCVW&user=%7B%22id%22%3A5167898484%2C%22first_name%22%3A%22xin%22%2C%22last_name%22%3A%22%22%2C%22username%22%3A%22pvnimaxin%22%2C%22language_code%22%3A%22en%22%2C%22allows_write_to_pm%22%3Atrue%7D&auth_date=1722938610&hash=8654c8c617c143abf656f4f159be2539880a56f58c2d9be622f90c0346aa162b"
+
+
+def measure(factory, number: int) -> float:
+    """Returns the bytes retained per object created by `factory`."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory() for _ in range(number)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+
+    return (after - before) / number
+
+
+def main(number: int = 10_000) -> None:
+    cases = {
+        "types.User": lambda: types.User(id=5167898484, first_name="xin"),
+        "types.Chat": lambda: types.Chat(id=1, type="group", title="xin"),
+        "InitData.parse": lambda: InitData.parse(QUERY_STRING),
+        "InitData.parse(lazy)": lambda: InitData.parse(
+            QUERY_STRING, lazy=True
+        ),
+    }
+    for name, factory in cases.items():
+        print(f"{name:<24} {measure(factory, number):8.1f} bytes/object")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""Compare the throughput of authenticating requests with `WSGIMiddleware`
+and `ASGIMiddleware` against the usual hand-written glue code, which
+parses and validates with a fresh key per request.
+
+The WSGI apps are served by a local `wsgiref` server. The ASGI apps are
+called in-process, which isolates the cost of authentication.
+
+Usage:
+    python benchmarks/middleware.py
+"""
+
+import asyncio
+import http.client
+import threading
+import time
+from wsgiref.simple_server import WSGIRequestHandler, make_server
+
+from init_data_py import InitData, errors
+from init_data_py.middleware import ASGIMiddleware, WSGIMiddleware
+
+BOT_TOKEN = "7244657541:AAEgqk0HDC3WD5cdbnGMdd6L0TJ74FDp97Y"
+QUERY_STRING = "query_id=AAF03wc0AgAAAHTfBzROOCVW&user=%7B%22id%22%3A5167898484%2C%22first_name%22%3A%22xin%22%2C%22last_name%22%3A%22%22%2C%22username%22%3A%22pvnimaxin%22%2C%22language_code%22%3A%22en%22%2C%22allows_write_to_pm%22%3Atrue%7D&auth_date=1722938610&hash=8654c8c617c143abf656f4f159be2539880a56f58c2d9be622f90c0346aa162b"
+AUTHORIZATION = f"tma {QUERY_STRING}"
+
+
+def wsgi_app(environ, start_response):
+    start_response("200 OK", [("Content-Type", "text/plain")])
+    return [b"ok"]
+
+
+def wsgi_glue(environ, start_response):
+    try:
+        init_data = InitData.parse(environ["HTTP_AUTHORIZATION"][4:])
+        init_data.validate(BOT_TOKEN)
+    except errors.InitDataPyError:
+        start_response("401 Unauthorized", [])
+        return [b""]
+    environ["init_data"] = init_data
+
+    return wsgi_app(environ, start_response)
+
+
+async def asgi_app(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200})
+    await send({"type": "http.response.body", "body": b"ok"})
+
+
+async def asgi_glue(scope, receive, send):
+    headers = dict(scope["headers"])
+    try:
+        init_data = InitData.parse(headers[b"authorization"][4:].decode())
+        init_data.validate(BOT_TOKEN)
+    except errors.InitDataPyError:
+        await send({"type": "http.response.start", "status": 401})
+        await send({"type": "http.response.body", "body": b""})
+        return
+    scope["state"] = {"init_data": init_data}
+
+    await asgi_app(scope, receive, send)
+
+
+class QuietHandler(WSGIRequestHandler):
+    def log_message(self, *args):
+        pass
+
+
+def serve(app, requests: int) -> float:
+    server = make_server("127.0.0.1", 0, app, handler_class=QuietHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        connection = http.client.HTTPConnection(*server.server_address)
+        connection.request(
+            "GET", "/", headers={"Authorization": AUTHORIZATION}
+        )
+        response = connection.getresponse()
+        assert response.status == 200, response.status
+        response.read()
+        connection.close()
+    seconds = time.perf_counter() - start
+
+    server.shutdown()
+    server.server_close()
+
+    return requests / seconds
+
+
+def call_asgi(app, requests: int) -> float:
+    scope = {
+        "type": "http",
+        "path": "/",
+        "headers": [(b"authorization", AUTHORIZATION.encode())],
+    }
+
+    async def send(message):
+        pass
+
+    async def run():
+        for _ in range(requests):
+            await app(dict(scope), None, send)
+
+    start = time.perf_counter()
+    asyncio.run(run())
+
+    return requests / (time.perf_counter() - start)
+
+
+def main(requests: int = 2_000, calls: int = 50_000) -> None:
+    wsgi = {
+        "no authentication": wsgi_app,
+        "parse + validate glue": wsgi_glue,
+        "WSGIMiddleware": WSGIMiddleware(wsgi_app, BOT_TOKEN),
+    }
+    for name, app in wsgi.items():
+        print(f"WSGI server  {name:<24} {serve(app, requests):10,.0f} req/sec")
+
+    asgi = {
+        "no authentication": asgi_app,
+        "parse + validate glue": asgi_glue,
+        "ASGIMiddleware": ASGIMiddleware(asgi_app, BOT_TOKEN),
+    }
+    for name, app in asgi.items():
+        print(
+            f"ASGI calls   {name:<24} {call_asgi(app, calls):10,.0f} req/sec"
+        )
+
+
+if __name__ == "__main__":
+    main()
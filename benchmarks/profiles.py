@@ -0,0 +1,110 @@
+"""Realistic init data payloads used by the benchmark suite."""
+
+from typing import Dict
+
+from init_data_py import InitData, types
+
+BOT_TOKEN = "7244657541:AAEgqk0HDC3WD5cdbnGMdd6L0TJ74FDp97Y"
+AUTH_DATE = 1722938610
+
+
+def minimal() -> InitData:
+    return InitData(user=types.User(id=5167898484, first_name="xin"))
+
+
+def full() -> InitData:
+    return InitData(
+        query_id="AAF03wc0AgAAAHTfBzROOCVW",
+        user=types.User(
+            id=5167898484,
+            first_name="xin",
+            last_name="",
+            username="pvnimaxin",
+            language_code="en",
+            is_premium=True,
+            allows_write_to_pm=True,
+            photo_url="https://t.me/i/userpic/320/Ypcd.svg",
+        ),
+        receiver=types.User(
+            id=7387289974,
+            is_bot=True,
+            first_name="bot",
+            username="typexinbot",
+            photo_url="https://t.me/i/userpic/320/Xbot.svg",
+        ),
+        chat=types.Chat(
+            id=-1001234567890,
+            type="supergroup",
+            title="init-data-py",
+            username="initdatapy",
+            photo_url="https://t.me/i/userpic/320/Chat.svg",
+        ),
+        chat_type="supergroup",
+        chat_instance="-7372855463629395234",
+        start_param="ref_5167898484",
+        can_send_after=10,
+        signature="f" * 86,
+    )
+
+
+def unicode_heavy() -> InitData:
+    return InitData(
+        query_id="AAF2GVE4AwAAAHYZUTgHczdc",
+        user=types.User(
+            id=7387289974,
+            first_name="Артём 🚀✨ 東京",
+            last_name="Онуфрий 𝓧𝓲𝓷 عربى",
+            username="typexin",
+            language_code="ru",
+        ),
+        chat=types.Chat(
+            id=-1001234567890,
+            type="group",
+            title="Группа 🧪 テスト ελληνικά " * 4,
+        ),
+    )
+
+
+def max_size() -> InitData:
+    return InitData(
+        query_id="A" * 64,
+        user=types.User(
+            id=2**52,
+            first_name="x" * 64,
+            last_name="y" * 64,
+            username="z" * 32,
+            language_code="en-US",
+            is_premium=True,
+            added_to_attachment_menu=True,
+            allows_write_to_pm=True,
+            photo_url="https://t.me/i/userpic/320/" + "p" * 200 + ".svg",
+        ),
+        receiver=types.User(
+            id=2**52 - 1,
+            is_bot=True,
+            first_name="b" * 64,
+            last_name="c" * 64,
+            username="d" * 32,
+            photo_url="https://t.me/i/userpic/320/" + "q" * 200 + ".svg",
+        ),
+        chat=types.Chat(
+            id=-(2**52),
+            type="supergroup",
+            title="t" * 128,
+            username="u" * 32,
+            photo_url="https://t.me/i/userpic/320/" + "r" * 200 + ".svg",
+        ),
+        chat_type="supergroup",
+        chat_instance="-" + "9" * 19,
+        start_param="s" * 512,
+        can_send_after=2**31,
+        signature="f" * 86,
+    )
+
+
+def build() -> Dict[str, InitData]:
+    """Returns every profile, signed with `BOT_TOKEN`."""
+    return {
+        func.__name__: func().sign(BOT_TOKEN, AUTH_DATE)
+        for func in (minimal, full, unicode_heavy, max_size)
+    }
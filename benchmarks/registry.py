@@ -0,0 +1,67 @@
+"""Compare a `ValidatorRegistry` with trying a `Validator` per bot in turn,
+as the number of bots grows.
+
+Most traffic belongs to a few bots, which the registry learns to try first.
+
+Usage:
+    python benchmarks/registry.py
+"""
+
+import random
+import time
+
+from init_data_py import InitData, Validator, errors, types
+from init_data_py.registry import ValidatorRegistry
+
+
+def make_traffic(bot_tokens, requests: int):
+    query_strings = [
+        InitData(user=types.User(id=5167898484, first_name="xin"))
+        .sign(bot_token)
+        .to_query_string()
+        for bot_token in bot_tokens
+    ]
+    # NOTE: Skewed towards the last bots, the worst case for a fixed order.
+    weights = [i + 1 for i in range(len(bot_tokens))]
+    weights[-1] *= len(bot_tokens) * 10
+
+    return random.Random(0).choices(query_strings, weights, k=requests)
+
+
+def main(requests: int = 2_000) -> None:
+    for fleet in (1, 10, 100, 500):
+        bot_tokens = [
+            f"{i}:AAEgqk0HDC3WD5cdbnGMdd6L0TJ74FDp97Y" for i in range(fleet)
+        ]
+        traffic = make_traffic(bot_tokens, requests)
+        validators = [Validator(bot_token) for bot_token in bot_tokens]
+        registry = ValidatorRegistry(bot_tokens)
+
+        def naive():
+            for query_string in traffic:
+                for validator in validators:
+                    try:
+                        validator.validate_raw(query_string)
+                        break
+                    except errors.SignInvalidError:
+                        pass
+
+        def adaptive():
+            for query_string in traffic:
+                registry.validate_raw(query_string)
+
+        for name, func in (
+            ("per-bot validators", naive),
+            ("registry", adaptive),
+        ):
+            start = time.perf_counter()
+            func()
+            seconds = time.perf_counter() - start
+            print(
+                f"{fleet:>5} bots  {name:<20}"
+                f" {requests / seconds:12,.0f} ops/sec"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+"""Benchmark the hot paths of `InitData` across payload profiles.
+
+Reports operations per second and the peak memory allocated by a single
+operation, and can save the results as a baseline to compare later runs
+against.
+
+Usage:
+    python benchmarks/suite.py [--save FILE] [--compare FILE] [--quick]
+"""
+
+import argparse
+import json
+import sys
+import timeit
+import tracemalloc
+from typing import Callable, Dict
+
+import profiles
+from init_data_py import InitData, Validator
+
+
+def operations(init_data: InitData) -> Dict[str, Callable[[], object]]:
+    query_string = init_data.to_query_string()
+    query_bytes = query_string.encode()
+    validator = Validator(profiles.BOT_TOKEN)
+
+    return {
+        "parse": lambda: InitData.parse(query_string),
+        "parse_lazy": lambda: InitData.parse(query_string, lazy=True),
+        "parse_bytes": lambda: InitData.parse(query_bytes),
+        "validate": lambda: init_data.validate(profiles.BOT_TOKEN),
+        "validator.validate": lambda: validator.validate(init_data),
+        "validator.validate_raw": lambda: validator.validate_raw(query_string),
+        "validator.validate_raw_bytes": lambda: validator.validate_raw(
+            query_bytes
+        ),
+        "sign": lambda: init_data.sign(profiles.BOT_TOKEN, profiles.AUTH_DATE),
+        "to_json": init_data.to_json,
+        "to_query_string": init_data.to_query_string,
+    }
+
+
+def ops_per_sec(func: Callable[[], object], repeat: int) -> float:
+    timer = timeit.Timer(func)
+    number, _ = timer.autorange()
+
+    return number / min(timer.repeat(repeat=repeat, number=number))
+
+
+def peak_bytes(func: Callable[[], object]) -> int:
+    func()
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    return peak
+
+
+def run(repeat: int) -> Dict[str, Dict[str, float]]:
+    results = {}
+    for profile, init_data in profiles.build().items():
+        for name, func in operations(init_data).items():
+            results[f"{profile}/{name}"] = {
+                "ops_per_sec": ops_per_sec(func, repeat),
+                "peak_bytes": peak_bytes(func),
+            }
+
+    return results
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    threshold: float,
+) -> bool:
+    """Print the change against a baseline, returning False on regressions."""
+    ok = True
+    print(f"{'benchmark':<48} {'ops/sec':>12} {'change':>8}")
+    for key, result in results.items():
+        base = baseline.get(key)
+        if base is None:
+            print(f"{key:<48} {result['ops_per_sec']:12,.0f} {'new':>8}")
+            continue
+
+        change = result["ops_per_sec"] / base["ops_per_sec"] - 1
+        marker = ""
+        if change < -threshold:
+            marker = "  REGRESSION"
+            ok = False
+        print(
+            f"{key:<48} {result['ops_per_sec']:12,.0f} {change:+8.1%}{marker}"
+        )
+
+    return ok
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--save", help="write the results to a JSON file")
+    parser.add_argument("--compare", help="compare against a saved JSON file")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="slowdown reported as a regression (default: 0.1)",
+    )
+    parser.add_argument(
+        "--quick", action="store_true", help="repeat each benchmark once"
+    )
+    args = parser.parse_args()
+
+    results = run(repeat=1 if args.quick else 5)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=4)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        return 0 if compare(results, baseline, args.threshold) else 1
+
+    print(f"{'benchmark':<48} {'ops/sec':>12} {'peak bytes':>12}")
+    for key, result in results.items():
+        print(
+            f"{key:<48} {result['ops_per_sec']:12,.0f} "
+            f"{result['peak_bytes']:12,}"
+        )
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""Compare third-party Ed25519 `signature` validation with HMAC `hash`
+validation, per call and in bulk across a process pool.
+
+A generated key pair stands in for Telegram's key.
+
+Usage:
+    python benchmarks/third_party.py
+"""
+
+import base64
+import concurrent.futures
+import os
+import time
+import timeit
+
+from cryptography.hazmat.primitives.asymmetric.ed25519 import (
+    Ed25519PrivateKey,
+)
+from cryptography.hazmat.primitives.serialization import Encoding, PublicFormat
+from init_data_py import InitData, Validator, third_party, types, validate_many
+
+BOT_TOKEN = "7244657541:AAEgqk0HDC3WD5cdbnGMdd6L0TJ74FDp97Y"
+BOT_ID = 7244657541
+
+
+def make_query_string(private_key) -> str:
+    init_data = InitData(
+        query_id="AAF03wc0AgAAAHTfBzROOCVW",
+        user=types.User(
+            id=5167898484,
+            first_name="xin",
+            username="pvnimaxin",
+            language_code="en",
+            allows_write_to_pm=True,
+        ),
+    ).sign(BOT_TOKEN)
+    pairs = init_data.to_dict(nested=False)
+    del pairs["hash"]
+    data_check_string = f"{BOT_ID}:WebAppData\n" + "\n".join(
+        f"{k}={v}" for k, v in sorted(pairs.items())
+    )
+    signature = private_key.sign(data_check_string.encode())
+    init_data.signature = (
+        base64.urlsafe_b64encode(signature).rstrip(b"=").decode()
+    )
+
+    # NOTE: The hash covers the signature, so sign again.
+    return init_data.sign(BOT_TOKEN, init_data.auth_date).to_query_string()
+
+
+def main(number: int = 20_000, bulk: int = 200_000) -> None:
+    private_key = Ed25519PrivateKey.generate()
+    public_key = private_key.public_key().public_bytes(
+        Encoding.Raw, PublicFormat.Raw
+    )
+    query_string = make_query_string(private_key)
+
+    validator = Validator(BOT_TOKEN)
+    third_party_validator = third_party.ThirdPartyValidator(
+        BOT_ID, public_key=public_key
+    )
+    cases = {
+        "Validator.validate_raw": lambda: validator.validate_raw(query_string),
+        "ThirdPartyValidator.validate_raw": lambda: (
+            third_party_validator.validate_raw(query_string)
+        ),
+    }
+    for name, func in cases.items():
+        seconds = min(timeit.repeat(func, number=number, repeat=5))
+        print(f"{name:<36} {number / seconds:12,.0f} ops/sec")
+
+    query_strings = [query_string] * bulk
+    with concurrent.futures.ProcessPoolExecutor() as executor:
+        for name, results in (
+            (
+                "validate_many",
+                lambda: validate_many(query_strings, BOT_TOKEN),
+            ),
+            (
+                f"third_party.validate_many ({os.cpu_count()} procs)",
+                lambda: third_party.validate_many(
+                    query_strings,
+                    BOT_ID,
+                    executor=executor,
+                    chunksize=1024,
+                    public_key=public_key,
+                ),
+            ),
+        ):
+            start = time.perf_counter()
+            assert all(result.valid for result in results())
+            seconds = time.perf_counter() - start
+            print(f"{name:<36} {bulk / seconds:12,.0f} ops/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+"""Compare `InitData.validate` against a reused `Validator` and the raw
+query string fast path.
+
+Usage:
+    python benchmarks/validator.py
+"""
+
+import timeit
+
+from init_data_py import InitData, Validator
+
+BOT_TOKEN = "7244657541:AAEgqk0HDC3WD5cdbnGMdd6L0TJ74FDp97Y"
+QUERY_STRING = "query_id=AAF03wc0AgAAAHTfBzROOCVW&user=%7B%22id%22%3A5167898484%2C%22first_name%22%3A%22xin%22%2C%22last_name%22%3A%22%22%2C%22username%22%3A%22pvnimaxin%22%2C%22language_code%22%3A%22en%22%2C%22allows_write_to_pm%22%3Atrue%7D&auth_date=1722938610&hash=8654c8c617c143abf656f4f159be2539880a56f58c2d9be622f90c0346aa162b"
+
+
+def main(number: int = 100_000) -> None:
+    init_data = InitData.parse(QUERY_STRING)
+    validator = Validator(BOT_TOKEN)
+
+    cases = {
+        "InitData.validate": lambda: init_data.validate(BOT_TOKEN),
+        "Validator.validate": lambda: validator.validate(init_data),
+        "parse + validate": lambda: validator.validate(
+            InitData.parse(QUERY_STRING)
+        ),
+        "Validator.validate_raw": lambda: validator.validate_raw(QUERY_STRING),
+    }
+    results = {}
+    for name, func in cases.items():
+        seconds = min(timeit.repeat(func, number=number, repeat=5))
+        results[name] = seconds / number * 1e6
+        print(f"{name:<24} {results[name]:8.2f} us/call")
+
+    saving = results["InitData.validate"] - results["Validator.validate"]
+    print(f"{'saving':<24} {saving:8.2f} us/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,14 @@
-from .init_data import InitData
+from .bulk import ValidationResult, avalidate_many, validate_many
+from .init_data import FrozenInitData, InitData
+from .validator import Validator
 
 __version__ = "0.2.7"
 
-__all__ = ["InitData"]
+__all__ = [
+    "FrozenInitData",
+    "InitData",
+    "ValidationResult",
+    "Validator",
+    "avalidate_many",
+    "validate_many",
+]
@@ -0,0 +1,5 @@
+import sys
+
+from init_data_py.cli import main
+
+sys.exit(main())
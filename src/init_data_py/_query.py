@@ -0,0 +1,39 @@
+import urllib.parse
+from typing import Dict, Union
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+def parse_qsl_bytes(
+    query_string: BytesLike,
+    keep_blank_values: bool = False,
+) -> Dict[bytes, bytes]:
+    """Split and unquote a query string without decoding it to `str`.
+
+    Mirrors `urllib.parse.parse_qsl`, but keys and values stay `bytes`. Only `bytearray` and `memoryview` input is copied, and fields without escapes are not copied again while unquoting.
+    """
+    if not isinstance(query_string, bytes):
+        query_string = bytes(query_string)
+
+    parsed_qs = {}
+    for field in query_string.split(b"&"):
+        if not field:
+            continue
+
+        k, _, v = field.partition(b"=")
+        if v or keep_blank_values:
+            # NOTE: Both return their argument as is when there is nothing
+            # to replace or unquote.
+            parsed_qs[urllib.parse.unquote_to_bytes(k.replace(b"+", b" "))] = (
+                urllib.parse.unquote_to_bytes(v.replace(b"+", b" "))
+            )
+
+    return parsed_qs
+
+
+def decode_pairs(parsed_qs: Dict[bytes, bytes]) -> Dict[str, str]:
+    """Decode query string pairs the way `urllib.parse.parse_qsl` does."""
+    return {
+        k.decode(errors="replace"): v.decode(errors="replace")
+        for k, v in parsed_qs.items()
+    }
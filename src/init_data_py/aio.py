@@ -0,0 +1,70 @@
+import asyncio
+import concurrent.futures
+import functools
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+# NOTE: hashlib releases the GIL for data above 2047 bytes, so offloading
+# smaller payloads only adds the cost of a thread hop.
+OFFLOAD_THRESHOLD = 4096
+
+
+class Offloader:
+    """Run CPU-bound work inline or in an executor, depending on payload size.
+
+    Small payloads are processed directly on the event loop, as handing them to an executor costs more than the work itself. Larger payloads are sent to the executor, and a semaphore bounds how many of them are in flight at a time.
+
+    Parameters:
+        executor (`concurrent.futures.Executor`, optional):
+            The executor to offload work to. If not provided, the event loop's default executor is used.
+
+        threshold (`int`, optional):
+            Payload size from which work is offloaded. Default is `OFFLOAD_THRESHOLD`.
+
+        concurrency (`int`, optional):
+            Maximum number of offloaded calls in flight on each event loop. If not provided, offloaded calls are not limited.
+    """
+
+    def __init__(
+        self,
+        executor: Optional[concurrent.futures.Executor] = None,
+        threshold: int = OFFLOAD_THRESHOLD,
+        concurrency: Optional[int] = None,
+    ) -> None:
+        self.executor = executor
+        self.threshold = threshold
+        self.concurrency = concurrency
+        # NOTE: Semaphores are bound to the loop they are first used on, so
+        # there is one per loop. They refer to their loop, so a weak mapping
+        # would keep them alive; those of closed loops are dropped instead.
+        self._semaphores: Dict[asyncio.AbstractEventLoop, asyncio.Semaphore]
+        self._semaphores = {}
+
+    async def run(self, func: Callable[..., T], *args: Any, size: int) -> T:
+        """Call `func(*args)`, offloading it if `size` reaches the threshold."""
+        if size < self.threshold:
+            return func(*args)
+
+        loop = asyncio.get_running_loop()
+        call = functools.partial(func, *args)
+
+        if self.concurrency is None:
+            return await loop.run_in_executor(self.executor, call)
+
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            self._semaphores = {
+                other: value
+                for other, value in self._semaphores.items()
+                if not other.is_closed()
+            }
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(
+                self.concurrency
+            )
+
+        async with semaphore:
+            return await loop.run_in_executor(self.executor, call)
+
+
+default_offloader = Offloader()
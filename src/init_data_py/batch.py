@@ -0,0 +1,483 @@
+import abc
+import sys
+import urllib.parse
+from array import array
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from init_data_py import errors, json_backend, types
+from init_data_py._query import BytesLike, decode_pairs, parse_qsl_bytes
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            "NumPy is required for to_numpy(), install it with "
+            "`pip install numpy`."
+        ) from None
+
+    return numpy
+
+
+class Bitmap:
+    """A growable bitmap, least significant bit first as in Apache Arrow."""
+
+    __slots__ = ("data", "_size")
+
+    def __init__(self) -> None:
+        self.data = bytearray()
+        self._size = 0
+
+    def append(self, bit: bool) -> None:
+        offset = self._size & 7
+        if offset == 0:
+            self.data.append(0)
+        if bit:
+            self.data[-1] |= 1 << offset
+        self._size += 1
+
+    def __getitem__(self, index: int) -> bool:
+        return bool(self.data[index >> 3] & (1 << (index & 7)))
+
+    def truncate(self, size: int) -> None:
+        if size >= self._size:
+            return
+
+        del self.data[(size + 7) >> 3 :]
+        if size & 7:
+            self.data[-1] &= (1 << (size & 7)) - 1
+        self._size = size
+
+    def __len__(self) -> int:
+        return self._size
+
+    def to_numpy(self):
+        """Returns the bits as a NumPy `bool` array (a copy)."""
+        numpy = _numpy()
+        bits = numpy.unpackbits(
+            numpy.frombuffer(self.data, dtype=numpy.uint8), bitorder="little"
+        )
+
+        return bits[: self._size].astype(bool)
+
+
+class Column(abc.ABC):
+    """A column of an `InitDataBatch`, with a validity bitmap marking the rows that hold a value."""
+
+    __slots__ = ("validity",)
+
+    def __init__(self) -> None:
+        self.validity = Bitmap()
+
+    @abc.abstractmethod
+    def append(self, value: Any) -> None:
+        """Add a row, `None` for a missing value."""
+
+    @abc.abstractmethod
+    def _get(self, index: int) -> Any:
+        """Returns the value of a row known to hold one."""
+
+    def truncate(self, size: int) -> None:
+        """Drop the rows from `size` on."""
+        del self.values[size:]
+        self.validity.truncate(size)
+
+    def __getitem__(self, index: int) -> Any:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("column index out of range")
+
+        return self._get(index) if self.validity[index] else None
+
+    def __len__(self) -> int:
+        return len(self.validity)
+
+    def __iter__(self) -> Iterator[Any]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def to_list(self) -> List[Any]:
+        """Returns the values, with `None` for missing ones."""
+        return list(self)
+
+    @abc.abstractmethod
+    def to_numpy(self):
+        """Returns the values as a NumPy array, see the column types."""
+
+
+class Int64Column(Column):
+    """Integers stored in an `array` of int64, missing values hold 0."""
+
+    __slots__ = ("values",)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.values = array("q")
+
+    def append(self, value: Optional[int]) -> None:
+        if value is None:
+            self.values.append(0)
+            self.validity.append(False)
+        else:
+            self.values.append(value)
+            self.validity.append(True)
+
+    def _get(self, index: int) -> int:
+        return self.values[index]
+
+    def to_numpy(self):
+        """Returns an `int64` array sharing memory with the column.
+
+        The column can't grow while the array is alive.
+        """
+        numpy = _numpy()
+
+        return numpy.frombuffer(self.values, dtype=numpy.int64)
+
+
+class BoolColumn(Column):
+    """Booleans stored in a bitmap."""
+
+    __slots__ = ("values",)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.values = Bitmap()
+
+    def append(self, value: Optional[bool]) -> None:
+        self.values.append(bool(value))
+        self.validity.append(value is not None)
+
+    def _get(self, index: int) -> bool:
+        return self.values[index]
+
+    def truncate(self, size: int) -> None:
+        self.values.truncate(size)
+        self.validity.truncate(size)
+
+    def to_numpy(self):
+        """Returns a `bool` array (a copy), missing values are False."""
+        return self.values.to_numpy()
+
+
+class CategoryColumn(Column):
+    """Strings with few distinct values, dictionary encoded.
+
+    Each distinct string is stored once in `categories`, and rows hold its index in an `array` of int32, missing values hold -1.
+    """
+
+    __slots__ = ("codes", "categories", "_index")
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.codes = array("i")
+        self.categories: List[str] = []
+        self._index: Dict[str, int] = {}
+
+    def append(self, value: Optional[str]) -> None:
+        if value is None:
+            self.codes.append(-1)
+            self.validity.append(False)
+            return
+
+        code = self._index.get(value)
+        if code is None:
+            code = self._index[value] = len(self.categories)
+            self.categories.append(sys.intern(value))
+        self.codes.append(code)
+        self.validity.append(True)
+
+    def _get(self, index: int) -> str:
+        return self.categories[self.codes[index]]
+
+    def truncate(self, size: int) -> None:
+        del self.codes[size:]
+        self.validity.truncate(size)
+
+    def to_numpy(self):
+        """Returns the `int32` codes, sharing memory with the column.
+
+        The column can't grow while the array is alive.
+        """
+        numpy = _numpy()
+
+        return numpy.frombuffer(self.codes, dtype=numpy.int32)
+
+
+class StrColumn(Column):
+    """Free-form strings, kept in a list."""
+
+    __slots__ = ("values",)
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.values: List[Optional[str]] = []
+
+    def append(self, value: Optional[str]) -> None:
+        self.values.append(value)
+        self.validity.append(value is not None)
+
+    def _get(self, index: int) -> str:
+        return self.values[index]  # type: ignore
+
+    def to_numpy(self):
+        """Returns an `object` array (a copy)."""
+        numpy = _numpy()
+
+        return numpy.array(self.values, dtype=object)
+
+
+_OBJECT_TYPES = {
+    "user": types.User,
+    "receiver": types.User,
+    "chat": types.Chat,
+}
+
+
+def _schema() -> Dict[str, type]:
+    """Map each column name to its column type."""
+    schema: Dict[str, type] = {
+        "query_id": StrColumn,
+        "chat_type": CategoryColumn,
+        "chat_instance": StrColumn,
+        "start_param": CategoryColumn,
+        "can_send_after": Int64Column,
+        "auth_date": Int64Column,
+        "hash": StrColumn,
+        "signature": StrColumn,
+    }
+
+    kinds = {
+        "id": Int64Column,
+        "is_bot": BoolColumn,
+        "is_premium": BoolColumn,
+        "added_to_attachment_menu": BoolColumn,
+        "allows_write_to_pm": BoolColumn,
+        "language_code": CategoryColumn,
+        "type": CategoryColumn,
+    }
+    for name, object_type in _OBJECT_TYPES.items():
+        for field in object_type._fields:
+            schema[f"{name}.{field}"] = kinds.get(field, StrColumn)
+
+    return schema
+
+
+_SCHEMA = _schema()
+_INT_FIELDS = frozenset(("auth_date", "can_send_after"))
+_VALUE_TYPES = {
+    Int64Column: int,
+    BoolColumn: bool,
+    CategoryColumn: str,
+    StrColumn: str,
+}
+
+
+class Row:
+    """A view of a single row of an `InitDataBatch`."""
+
+    __slots__ = ("batch", "index")
+
+    def __init__(self, batch: "InitDataBatch", index: int) -> None:
+        self.batch = batch
+        self.index = index
+
+    def __getitem__(self, column: str) -> Any:
+        return self.batch.columns[column][self.index]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the values of the row by column name, without missing values."""
+        return {
+            name: value
+            for name, column in self.batch.columns.items()
+            if (value := column[self.index]) is not None
+        }
+
+
+class InitDataBatch:
+    """Many init data stored column by column.
+
+    Query strings are parsed straight into typed columns, without building `InitData`, `types.User` or `types.Chat` objects: integers are kept in int64 arrays, categorical strings such as `chat_type` and `user.language_code` are dictionary encoded, and each column has a validity bitmap. Nested fields are named `"user.id"`, `"chat.type"` and so on.
+
+    Parameters:
+        columns (`Sequence[str]`, optional):
+            The columns to keep. JSON objects whose columns are not kept are not decoded at all. Defaults to all columns.
+    """
+
+    def __init__(self, columns: Optional[Sequence[str]] = None) -> None:
+        if columns is None:
+            columns = list(_SCHEMA)
+
+        unknown = set(columns) - _SCHEMA.keys()
+        if unknown:
+            raise ValueError(f"unknown columns: {sorted(unknown)}.")
+
+        self.columns: Dict[str, Column] = {
+            name: _SCHEMA[name]() for name in columns
+        }
+        self._size = 0
+
+        self._objects: Dict[str, List[Tuple[str, Column]]] = {}
+        for name, column in self.columns.items():
+            object, _, field = name.partition(".")
+            if field:
+                self._objects.setdefault(object, []).append((field, column))
+
+    @classmethod
+    def parse(
+        cls,
+        query_strings: Iterable[Union[str, BytesLike]],
+        columns: Optional[Sequence[str]] = None,
+        raise_error: bool = True,
+    ):
+        """Create a batch from query strings.
+
+        Parameters:
+            query_strings (`Iterable[str | bytes | bytearray | memoryview]`):
+                The query strings from `window.WebApp.initData` to parse.
+
+            columns (`Sequence[str]`, optional):
+                The columns to keep. Defaults to all columns.
+
+            raise_error (`bool`, optional):
+                In case True, raises an exception on a malformed query string, If False, adds a row without any values instead.
+
+        Returns:
+            `InitDataBatch`:
+                A batch with a row per query string.
+
+        Raises:
+            `errors.UnexpectedFormatError`: In case the the format of a query string is unexpected.
+        """
+        batch = cls(columns)
+        batch.extend(query_strings, raise_error)
+
+        return batch
+
+    def append(
+        self,
+        query_string: Union[str, BytesLike],
+        raise_error: bool = True,
+    ) -> None:
+        """Parse a query string into a new row, see `parse`."""
+        try:
+            values = self._parse_row(query_string)
+        except errors.UnexpectedFormatError:
+            if raise_error:
+                raise
+            values = {}
+
+        try:
+            for name, column in self.columns.items():
+                column.append(values.get(name))
+        except BaseException:
+            # NOTE: e.g. a BufferError while a column is exported to NumPy,
+            # drop the partial row so the columns stay in step.
+            for column in self.columns.values():
+                column.truncate(self._size)
+            raise
+        self._size += 1
+
+    def extend(
+        self,
+        query_strings: Iterable[Union[str, BytesLike]],
+        raise_error: bool = True,
+    ) -> None:
+        """Parse query strings into new rows, see `parse`."""
+        for query_string in query_strings:
+            self.append(query_string, raise_error)
+
+    def _parse_row(
+        self, query_string: Union[str, BytesLike]
+    ) -> Dict[str, Any]:
+        """Returns the values of a row by column name.
+
+        A row is only appended once it parsed entirely, so the columns never get out of step.
+        """
+        if isinstance(query_string, str):
+            parsed_qs = dict(urllib.parse.parse_qsl(query_string))
+        else:
+            parsed_qs = decode_pairs(parse_qsl_bytes(query_string))
+
+        if "hash" not in parsed_qs or "auth_date" not in parsed_qs:
+            raise errors.UnexpectedFormatError()
+
+        values: Dict[str, Any] = {}
+        try:
+            for k, v in parsed_qs.items():
+                if k in _OBJECT_TYPES:
+                    fields = self._objects.get(k)
+                    if fields is not None:
+                        self._parse_object(k, v, fields, values)
+                elif k not in _SCHEMA:
+                    raise errors.UnexpectedFormatError()
+                elif k in _INT_FIELDS:
+                    values[k] = int(v)
+                else:
+                    values[k] = v
+
+            for name, value in values.items():
+                if _SCHEMA[name] is Int64Column and not (
+                    -(2**63) <= value < 2**63
+                ):
+                    raise ValueError(f"{name} out of int64 range.")
+        except (TypeError, ValueError):
+            raise errors.UnexpectedFormatError()
+
+        return values
+
+    @staticmethod
+    def _parse_object(
+        name: str,
+        raw: str,
+        fields: List[Tuple[str, Column]],
+        values: Dict[str, Any],
+    ) -> None:
+        data = json_backend.loads(raw)
+        if not isinstance(data, dict):
+            raise TypeError(f"expected a JSON object, got {type(data)}.")
+
+        for field in _OBJECT_TYPES[name]._required:
+            if field not in data:
+                raise TypeError(f"missing required field {field!r}.")
+
+        for field, column in fields:
+            value = data.get(field)
+            if value is None:
+                continue
+
+            if type(value) is not _VALUE_TYPES[type(column)]:
+                raise TypeError(f"unexpected type for {name}.{field}.")
+
+            values[f"{name}.{field}"] = value
+
+    def row(self, index: int) -> Row:
+        """Returns a view of a row."""
+        if index < 0:
+            index += self._size
+        if not 0 <= index < self._size:
+            raise IndexError("batch index out of range")
+
+        return Row(self, index)
+
+    def __getitem__(self, column: str) -> Column:
+        return self.columns[column]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __iter__(self) -> Iterator[Row]:
+        for i in range(self._size):
+            yield Row(self, i)
@@ -0,0 +1,275 @@
+"""A compact binary encoding of `InitData`, for session stores.
+
+Layout, version 1, all integers little-endian:
+
+- header: the magic `b"ID"`, a `uint8` version, and four `uint16` presence bitmaps: over the fields of `_INIT_DATA`, and over the fields of `_USER` (`user`, `receiver`) and `_CHAT` (`chat`) plus one bit for `extra` and one last bit for raw JSON.
+- values: each present field of the init data and then of its `user`, `receiver` and `chat` in order, ids and timestamps as `int64`, booleans as one byte, and strings as their `uint16` length in code points. `extra` is a string holding JSON. An object whose hashed JSON differs from its serialization, e.g. in the order of its fields, is stored as that raw JSON string alone, with only the raw bit set.
+- text: all strings concatenated, encoded as UTF-8 once.
+
+The format of the values only depends on the bitmaps, so it is compiled into a `struct.Struct` once per combination and unpacked in a single call, and the text is decoded in one go and sliced. The layouts are fixed per version, independently of the order of the `_fields` of the classes, so stored data stays readable across releases.
+"""
+
+import struct
+from typing import Any, Dict, List, Tuple, Union
+
+from init_data_py import errors, json_backend, types
+from init_data_py._query import BytesLike
+
+MAGIC = b"ID"
+VERSION = 1
+
+_HEADER = struct.Struct("<2sB4H")
+
+# NOTE: Struct format characters, strings are stored as their length.
+_INT, _BOOL, _STR = "q", "?", "H"
+
+Layout = Tuple[Tuple[str, str], ...]
+
+_USER: Layout = (
+    ("id", _INT),
+    ("is_bot", _BOOL),
+    ("first_name", _STR),
+    ("last_name", _STR),
+    ("username", _STR),
+    ("language_code", _STR),
+    ("is_premium", _BOOL),
+    ("added_to_attachment_menu", _BOOL),
+    ("allows_write_to_pm", _BOOL),
+    ("photo_url", _STR),
+)
+_CHAT: Layout = (
+    ("id", _INT),
+    ("type", _STR),
+    ("title", _STR),
+    ("username", _STR),
+    ("photo_url", _STR),
+)
+# NOTE: Objects have no format, their fields follow those of the init data.
+_INIT_DATA: Layout = (
+    ("query_id", _STR),
+    ("user", ""),
+    ("receiver", ""),
+    ("chat", ""),
+    ("chat_type", _STR),
+    ("chat_instance", _STR),
+    ("start_param", _STR),
+    ("can_send_after", _INT),
+    ("auth_date", _INT),
+    ("hash", _STR),
+    ("signature", _STR),
+)
+# NOTE: The name, bit in the init data bitmap, type and layout of objects.
+_OBJECTS = (
+    ("user", 1, types.User, _USER),
+    ("receiver", 2, types.User, _USER),
+    ("chat", 3, types.Chat, _CHAT),
+)
+
+
+class _Plan:
+    """The format and order of the values of one combination of bitmaps."""
+
+    __slots__ = ("struct", "fields", "objects")
+
+    def __init__(self, bitmaps: Tuple[int, ...]) -> None:
+        init_bitmap = bitmaps[0]
+        if init_bitmap >> len(_INIT_DATA):
+            raise ValueError("unknown init data fields.")
+
+        # NOTE: Fields are (name, is string) pairs, in the order of values.
+        fields = []
+        formats = []
+        for bit, (name, kind) in enumerate(_INIT_DATA):
+            if kind and init_bitmap >> bit & 1:
+                fields.append((name, kind == _STR))
+                formats.append(kind)
+
+        objects = []
+        for (name, bit, cls, layout), bitmap in zip(_OBJECTS, bitmaps[1:]):
+            present = init_bitmap >> bit & 1
+            raw = 1 << (len(layout) + 1)
+            if bitmap > raw or (bitmap and not present):
+                raise ValueError(f"unknown {name} fields.")
+            if not present:
+                continue
+            if bitmap == raw:
+                formats.append(_STR)
+                objects.append((name, cls, (), (), False, True))
+                continue
+
+            object_fields = []
+            absent = []
+            for bit, (field, kind) in enumerate(layout):
+                if bitmap >> bit & 1:
+                    object_fields.append((field, kind == _STR))
+                    formats.append(kind)
+                else:
+                    absent.append(field)
+
+            extra = bool(bitmap >> len(layout))
+            if extra:
+                formats.append(_STR)
+            objects.append(
+                (name, cls, tuple(object_fields), tuple(absent), extra, False)
+            )
+
+        self.fields = tuple(fields)
+        self.objects = tuple(objects)
+        self.struct = struct.Struct("<" + "".join(formats))
+
+
+# NOTE: Only a handful of combinations show up in practice, e.g. with and
+# without `chat`, the limit only guards against unusual data.
+_plans: Dict[Tuple[int, ...], _Plan] = {}
+_MAX_PLANS = 1024
+
+
+def _plan(bitmaps: Tuple[int, ...]) -> _Plan:
+    plan = _plans.get(bitmaps)
+    if plan is None:
+        plan = _Plan(bitmaps)
+        if len(_plans) < _MAX_PLANS:
+            _plans[bitmaps] = plan
+
+    return plan
+
+
+def _bitmap(obj: Any, layout: Layout) -> int:
+    bitmap = 0
+    for bit, (name, _) in enumerate(layout):
+        if getattr(obj, name) is not None:
+            bitmap |= 1 << bit
+
+    return bitmap
+
+
+def _add(values: List[Any], strings: List[str], value: Any, is_str: bool):
+    if is_str:
+        value = str(value)
+        strings.append(value)
+        values.append(len(value))
+    else:
+        values.append(value)
+
+
+def pack(init_data: Any) -> bytes:
+    """Encode an `InitData` object, see `InitData.to_bytes`.
+
+    Raises:
+        `ValueError`: In case a string is longer than 65535 code points, or an integer does not fit in 64 bits.
+    """
+    bitmaps = [_bitmap(init_data, _INIT_DATA)]
+    raw: Dict[str, str] = {}
+    for name, _, _, layout in _OBJECTS:
+        obj = getattr(init_data, name)
+        if obj is None:
+            bitmaps.append(0)
+            continue
+
+        # NOTE: The hash covers the JSON as received, which serializing the
+        # decoded fields does not reproduce if they were reordered.
+        raw_json = type(init_data)._object_fields[name].to_json(init_data)
+        if raw_json != obj.to_json().replace("/", r"\/"):
+            raw[name] = raw_json
+            bitmaps.append(1 << (len(layout) + 1))
+        else:
+            bitmap = _bitmap(obj, layout)
+            if obj.extra:
+                bitmap |= 1 << len(layout)
+            bitmaps.append(bitmap)
+
+    plan = _plan(tuple(bitmaps))
+    values: List[Any] = []
+    strings: List[str] = []
+
+    for name, is_str in plan.fields:
+        _add(values, strings, getattr(init_data, name), is_str)
+
+    for name, _, fields, _, extra, is_raw in plan.objects:
+        if is_raw:
+            _add(values, strings, raw[name], True)
+            continue
+
+        obj = getattr(init_data, name)
+        for field, is_str in fields:
+            _add(values, strings, getattr(obj, field), is_str)
+        if extra:
+            _add(values, strings, json_backend.dumps(obj.extra), True)
+
+    try:
+        return b"".join(
+            (
+                _HEADER.pack(MAGIC, VERSION, *bitmaps),
+                plan.struct.pack(*values),
+                "".join(strings).encode("utf-8", "surrogatepass"),
+            )
+        )
+    except struct.error as e:
+        raise ValueError(f"init data can not be packed: {e}.") from None
+
+
+def unpack(data: Union[bytes, BytesLike]) -> Dict[str, Any]:
+    """Decode the fields of an `InitData` object, see `InitData.from_bytes`.
+
+    Objects stored as raw JSON are returned as that string, undecoded.
+
+    Raises:
+        `errors.UnexpectedFormatError`: In case the data is malformed, or of an unsupported version.
+    """
+    try:
+        magic, version, *bitmaps = _HEADER.unpack_from(data)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError("unsupported format.")
+
+        plan = _plan(tuple(bitmaps))
+        values = plan.struct.unpack_from(data, _HEADER.size)
+        text = str(
+            memoryview(data)[_HEADER.size + plan.struct.size :],
+            "utf-8",
+            "surrogatepass",
+        )
+
+        fields: Dict[str, Any] = {}
+        i = pos = 0
+        for name, is_str in plan.fields:
+            value = values[i]
+            i += 1
+            if is_str:
+                pos += value
+                value = text[pos - value : pos]
+            fields[name] = value
+
+        for name, cls, object_fields, absent, extra, is_raw in plan.objects:
+            if is_raw:
+                pos += values[i]
+                fields[name] = text[pos - values[i] : pos]
+                i += 1
+                continue
+
+            obj = cls.__new__(cls)
+            setters = cls._setters
+            for field in absent:
+                setters[field](obj, None)
+
+            for field, is_str in object_fields:
+                value = values[i]
+                i += 1
+                if is_str:
+                    pos += value
+                    value = text[pos - value : pos]
+                setters[field](obj, value)
+
+            if extra:
+                pos += values[i]
+                obj.extra = json_backend.loads(text[pos - values[i] : pos])
+                i += 1
+            else:
+                obj.extra = None
+            fields[name] = obj
+
+        if pos != len(text):
+            raise ValueError("unexpected length.")
+    except (struct.error, ValueError, TypeError):
+        raise errors.UnexpectedFormatError() from None
+
+    return fields
@@ -0,0 +1,272 @@
+import asyncio
+import collections.abc
+import concurrent.futures
+import functools
+import itertools
+from collections import deque
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from init_data_py import aio, errors
+from init_data_py.validator import Validator
+
+# NOTE: One validator per bot token and per process, so every worker of a
+# process pool derives the secret key only once. Validators are keyed by
+# their class and arguments, which are sent to the workers instead of the
+# validators themselves. The least recently used ones are dropped, so
+# long-lived workers serving many bots don't keep every token.
+_MAX_VALIDATORS = 64
+
+
+class ValidationResult(NamedTuple):
+    """The outcome of validating a single query string.
+
+    Parameters:
+        index (`int`):
+            Position of the query string in the input iterable.
+
+        error (`str`, optional):
+            Name of the `init_data_py.errors` class describing why the query string is invalid, or `None` if it is valid.
+    """
+
+    index: int
+    error: Optional[str]
+
+    @property
+    def valid(self) -> bool:
+        return self.error is None
+
+
+@functools.lru_cache(maxsize=_MAX_VALIDATORS)
+def _get_validator(factory: type, args: Tuple[Any, ...]) -> Any:
+    return factory(*args)
+
+
+def _validate_one(
+    validator: Any,
+    query_string: str,
+    lifetime: Optional[int],
+) -> Optional[str]:
+    try:
+        validator.validate_raw(query_string, lifetime)
+    except errors.InitDataPyError as e:
+        return type(e).__name__
+    except (TypeError, ValueError):
+        return errors.UnexpectedFormatError.__name__
+
+    return None
+
+
+def _validate_chunk(
+    start: int,
+    chunk: List[str],
+    factory: type,
+    args: Tuple[Any, ...],
+    lifetime: Optional[int],
+) -> List[ValidationResult]:
+    validator = _get_validator(factory, args)
+
+    return [
+        ValidationResult(start + i, _validate_one(validator, qs, lifetime))
+        for i, qs in enumerate(chunk)
+    ]
+
+
+def _chunked(iterable: Iterable[str], size: int) -> Iterator[List[str]]:
+    iterator = iter(iterable)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def validate_many(
+    query_strings: Iterable[str],
+    bot_token: str,
+    lifetime: Optional[int] = None,
+    executor: Optional[concurrent.futures.Executor] = None,
+    ordered: bool = True,
+    chunksize: int = 256,
+    prefetch: int = 16,
+) -> Iterator[ValidationResult]:
+    """Validate many query strings, reporting an error code per item.
+
+    Query strings are validated with `Validator.validate_raw`. Results are streamed back lazily, and only `prefetch` chunks are in flight at a time, so arbitrarily large iterables are processed in constant memory.
+
+    Parameters:
+        query_strings (`Iterable[str]`):
+            The query strings from `window.WebApp.initData` to validate.
+
+        bot_token (`str`):
+            The token associated with the bot, used to either launch the webapp or sign the init data.
+
+        lifetime (`int`, optional):
+            The maximum validity period of the init data in seconds.
+            Recommended for security. Default is `None`.
+
+        executor (`concurrent.futures.Executor`, optional):
+            A thread or process pool to dispatch chunks to. If not provided, query strings are validated in the calling thread.
+
+        ordered (`bool`, optional):
+            If True, results are yielded in input order; otherwise, chunks are yielded as they complete.
+
+        chunksize (`int`, optional):
+            Number of query strings sent to the executor in a single task.
+
+        prefetch (`int`, optional):
+            Maximum number of chunks submitted to the executor at a time.
+
+    Returns:
+        `Iterator[ValidationResult]`:
+            One result per query string.
+    """
+    return _validate_many(
+        query_strings,
+        Validator,
+        (bot_token,),
+        lifetime,
+        executor,
+        ordered,
+        chunksize,
+        prefetch,
+    )
+
+
+def _validate_many(
+    query_strings: Iterable[str],
+    factory: type,
+    args: Tuple[Any, ...],
+    lifetime: Optional[int],
+    executor: Optional[concurrent.futures.Executor],
+    ordered: bool,
+    chunksize: int,
+    prefetch: int,
+) -> Iterator[ValidationResult]:
+    """Validate many query strings with the validator `factory(*args)`."""
+    if executor is None:
+        validator = _get_validator(factory, args)
+        for i, query_string in enumerate(query_strings):
+            yield ValidationResult(
+                i, _validate_one(validator, query_string, lifetime)
+            )
+        return
+
+    chunks = _chunked(query_strings, chunksize)
+    start = 0
+
+    def submit(chunk: List[str]) -> concurrent.futures.Future:
+        nonlocal start
+        future = executor.submit(
+            _validate_chunk, start, chunk, factory, args, lifetime
+        )
+        start += len(chunk)
+        return future
+
+    if ordered:
+        queue: Deque[concurrent.futures.Future] = deque(
+            submit(chunk) for chunk in itertools.islice(chunks, prefetch)
+        )
+        while queue:
+            results = queue.popleft().result()
+            for chunk in itertools.islice(chunks, 1):
+                queue.append(submit(chunk))
+            yield from results
+        return
+
+    pending: Set[concurrent.futures.Future] = {
+        submit(chunk) for chunk in itertools.islice(chunks, prefetch)
+    }
+    while pending:
+        done, pending = concurrent.futures.wait(
+            pending, return_when=concurrent.futures.FIRST_COMPLETED
+        )
+        for future in done:
+            for chunk in itertools.islice(chunks, 1):
+                pending.add(submit(chunk))
+            yield from future.result()
+
+
+async def _aiter(
+    iterable: Union[Iterable[str], AsyncIterable[str]],
+) -> AsyncIterator[str]:
+    if isinstance(iterable, collections.abc.AsyncIterable):
+        async for item in iterable:
+            yield item
+    else:
+        for item in iterable:
+            yield item
+
+
+async def avalidate_many(
+    query_strings: Union[Iterable[str], AsyncIterable[str]],
+    bot_token: str,
+    lifetime: Optional[int] = None,
+    offloader: Optional[aio.Offloader] = None,
+    concurrency: int = 64,
+) -> AsyncIterator[ValidationResult]:
+    """Asynchronous counterpart of `validate_many`.
+
+    Query strings are validated concurrently, but at most `concurrency` of them are pulled from the input before their results are consumed, so a slow consumer applies backpressure to the producer.
+
+    Parameters:
+        query_strings (`Iterable[str]` | `AsyncIterable[str]`):
+            The query strings from `window.WebApp.initData` to validate.
+
+        bot_token (`str`):
+            The token associated with the bot, used to either launch the webapp or sign the init data.
+
+        lifetime (`int`, optional):
+            The maximum validity period of the init data in seconds.
+            Recommended for security. Default is `None`.
+
+        offloader (`aio.Offloader`, optional):
+            Decides where the work runs. Defaults to `aio.default_offloader`.
+
+        concurrency (`int`, optional):
+            Maximum number of query strings being validated at a time.
+
+    Returns:
+        `AsyncIterator[ValidationResult]`:
+            One result per query string, in input order.
+    """
+    validator = _get_validator(Validator, (bot_token,))
+    offloader = offloader or aio.default_offloader
+
+    async def run(index: int, query_string: str) -> ValidationResult:
+        size = (
+            len(query_string)
+            if isinstance(query_string, (str, bytes, bytearray, memoryview))
+            else 0
+        )
+        error = await offloader.run(
+            _validate_one, validator, query_string, lifetime, size=size
+        )
+        return ValidationResult(index, error)
+
+    pending: Deque[asyncio.Future] = deque()
+    index = 0
+    try:
+        async for query_string in _aiter(query_strings):
+            if len(pending) >= concurrency:
+                yield await pending.popleft()
+            pending.append(asyncio.ensure_future(run(index, query_string)))
+            index += 1
+
+        while pending:
+            yield await pending.popleft()
+    finally:
+        for future in pending:
+            future.cancel()
@@ -0,0 +1,99 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple, Union
+
+from init_data_py._query import BytesLike
+from init_data_py.init_data import InitData
+from init_data_py.validator import Validator
+
+
+class ValidationCache:
+    """Remember query strings that have been validated successfully.
+
+    Mini App clients send the same init data on every request of a session, so a repeated query string is answered with the `InitData` built the first time, without parsing or hashing it again. Entries expire at `auth_date + lifetime`, and the least recently used entry is evicted once `max_size` is reached. Invalid query strings are never cached.
+
+    A cache must not be used by several threads at once, see `concurrency.ConcurrentValidator` instead.
+
+    Parameters:
+        bot_token (`str`):
+            The token associated with the bot, used to either launch the webapp or sign the init data.
+
+        lifetime (`int`, optional):
+            The maximum validity period of the init data in seconds.
+            Recommended for security. Default is `None`.
+
+        max_size (`int`, optional):
+            Maximum number of cached query strings.
+    """
+
+    def __init__(
+        self,
+        bot_token: str,
+        lifetime: Optional[int] = None,
+        max_size: int = 10_000,
+    ) -> None:
+        self.validator = Validator(bot_token)
+        self.lifetime = lifetime
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[bytes, Tuple[InitData, float]]" = (
+            OrderedDict()
+        )
+
+    def validate(self, query_string: Union[str, BytesLike]) -> InitData:
+        """Validate a query string, reusing the result of a previous call.
+
+        The returned object is shared between calls with the same query string and should be treated as read-only.
+
+        Parameters:
+            query_string (`str` | `bytes` | `bytearray` | `memoryview`):
+                The query string from `window.WebApp.initData` to validate.
+
+        Returns:
+            `InitData`:
+                The validated init data, parsed lazily.
+
+        Raises:
+            The errors raised by `InitData.validate_raw`.
+        """
+        data = (
+            query_string.encode()
+            if isinstance(query_string, str)
+            else query_string
+        )
+        key = hashlib.blake2b(data, digest_size=16).digest()
+        entry = self._entries.get(key)
+
+        if entry is not None:
+            init_data, expires_at = entry
+            if time.time() <= expires_at:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return init_data
+            del self._entries[key]
+
+        self.misses += 1
+        parsed_qs = self.validator.validate_raw(query_string, self.lifetime)
+        init_data = InitData._from_pairs(parsed_qs, lazy=True)
+
+        if self.lifetime is None:
+            expires_at = float("inf")
+        else:
+            expires_at = init_data.auth_date + self.lifetime  # type: ignore
+
+        self._entries[key] = (init_data, expires_at)
+        if len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+        return init_data
+
+    def clear(self) -> None:
+        """Remove all entries and reset the counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,190 @@
+"""Audit init data from logs on the command line.
+
+Usage:
+    python -m init_data_py [FILE] [--bot-token TOKEN] [--lifetime SECONDS]
+        [--field NAME] [--workers N] [--only-invalid]
+"""
+
+import argparse
+import collections
+import concurrent.futures
+import mmap
+import os
+import sys
+from typing import BinaryIO, Counter, Iterator, List, Optional, TextIO
+
+from init_data_py import json_backend
+from init_data_py.bulk import validate_many
+
+
+def _read_lines(file: BinaryIO) -> Iterator[bytes]:
+    """Yield the lines of a file without their line endings.
+
+    Regular files are memory-mapped, so lines are sliced from the page cache instead of being copied through a read buffer; pipes fall back to buffered reads.
+    """
+    try:
+        lines = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except (OSError, ValueError):
+        # NOTE: Pipes can't be mapped, and empty files raise ValueError.
+        lines = None
+
+    if lines is None:
+        for line in file:
+            yield line.rstrip(b"\r\n")
+        return
+
+    with lines:
+        for line in iter(lines.readline, b""):
+            yield line.rstrip(b"\r\n")
+
+
+def _extract(lines: Iterator[bytes], field: str) -> Iterator[bytes]:
+    """Yield the value of a (dot separated) field of each JSON line."""
+    path = field.split(".")
+    for line in lines:
+        try:
+            value = json_backend.loads(line)
+            for key in path:
+                value = value[key]
+        except (TypeError, ValueError, KeyError, IndexError):
+            value = None
+
+        # NOTE: An empty query string fails as UnexpectedFormatError, which
+        # is the verdict for lines without usable init data.
+        yield value.encode() if isinstance(value, str) else b""
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m init_data_py",
+        description=(
+            "Validate newline-delimited init data and report a verdict per "
+            "line, followed by counts by error type."
+        ),
+    )
+    parser.add_argument(
+        "file",
+        nargs="?",
+        default="-",
+        help="the file to read, or - for stdin (default)",
+    )
+    # NOTE: An option rather than an optional positional, so a file is never
+    # mistaken for the token when it comes from the environment.
+    parser.add_argument(
+        "--bot-token",
+        help="the bot token, defaults to $INIT_DATA_BOT_TOKEN",
+    )
+    parser.add_argument(
+        "--lifetime",
+        type=int,
+        help="maximum validity period of the init data in seconds",
+    )
+    parser.add_argument(
+        "--field",
+        help="read JSON lines and validate this (dot separated) field",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count(),
+        help="number of worker processes, 0 to validate in-process",
+    )
+    parser.add_argument(
+        "--chunksize",
+        type=int,
+        default=256,
+        help="number of lines sent to a worker at a time",
+    )
+    parser.add_argument(
+        "--only-invalid",
+        action="store_true",
+        help="print verdicts for invalid lines only",
+    )
+
+    return parser
+
+
+def audit(
+    lines: Iterator[bytes],
+    bot_token: str,
+    lifetime: Optional[int] = None,
+    executor: Optional[concurrent.futures.Executor] = None,
+    chunksize: int = 256,
+    only_invalid: bool = False,
+    out: Optional[TextIO] = None,
+) -> Counter[str]:
+    """Write a verdict per line to `out` and return the counts by verdict.
+
+    Lines are numbered from 1. Valid lines are counted as `"valid"`, and invalid ones by the name of their `init_data_py.errors` class.
+    """
+    out = out or sys.stdout
+    counts: Counter[str] = collections.Counter()
+
+    results = validate_many(
+        lines,  # type: ignore
+        bot_token,
+        lifetime,
+        executor,
+        chunksize=chunksize,
+    )
+    for result in results:
+        verdict = result.error or "valid"
+        counts[verdict] += 1
+        if not only_invalid or result.error:
+            out.write(f"{result.index + 1}\t{verdict}\n")
+
+    return counts
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Run the auditor, returning 0 if every line is valid and 1 otherwise."""
+    parser = _parser()
+    args = parser.parse_args(argv)
+
+    if not args.bot_token:
+        args.bot_token = os.environ.get("INIT_DATA_BOT_TOKEN")
+    if not args.bot_token:
+        parser.error("--bot-token or $INIT_DATA_BOT_TOKEN is required")
+
+    if args.file == "-":
+        file = sys.stdin.buffer
+    else:
+        try:
+            file = open(args.file, "rb")
+        except OSError as e:
+            parser.error(str(e))
+
+    executor = None
+    if args.workers:
+        executor = concurrent.futures.ProcessPoolExecutor(args.workers)
+
+    try:
+        lines = _read_lines(file)
+        if args.field:
+            lines = _extract(lines, args.field)
+
+        counts = audit(
+            lines,
+            args.bot_token,
+            args.lifetime,
+            executor,
+            args.chunksize,
+            args.only_invalid,
+        )
+    except BrokenPipeError:
+        # NOTE: The reader went away, e.g. `| head`. Point stdout at devnull
+        # so the interpreter doesn't fail again flushing it on exit.
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        return 1
+    finally:
+        if executor is not None:
+            executor.shutdown()
+        if file is not sys.stdin.buffer:
+            file.close()
+
+    total = sum(counts.values())
+    sys.stderr.write(f"total\t{total}\n")
+    for verdict, count in counts.most_common():
+        sys.stderr.write(f"{verdict}\t{count}\n")
+
+    return 0 if counts["valid"] == total else 1
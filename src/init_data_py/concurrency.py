@@ -0,0 +1,245 @@
+"""Validation designed for many threads, including free-threaded CPython.
+
+Nothing here takes a lock on the hot path: HMAC states are kept per thread, cache lookups are plain dict reads, and only inserting an entry locks the one shard it belongs to.
+"""
+
+import hashlib
+import threading
+import time
+import weakref
+from typing import Any, Dict, Hashable, List, Optional, Tuple, Union
+
+from init_data_py import errors, instrumentation, interning, json_backend
+from init_data_py._query import BytesLike
+from init_data_py.init_data import FrozenInitData, InitData
+from init_data_py.validator import Validator
+
+
+class ShardedCache:
+    """A bounded mapping split into shards, each with its own lock.
+
+    Reads don't lock, as single dict operations are atomic, with the GIL and on free-threaded builds alike. Writes lock one shard, so threads inserting different keys rarely wait for each other. Each shard evicts its oldest entry once it is full, so hits never write.
+
+    Parameters:
+        max_size (`int`, optional):
+            Maximum number of entries, spread evenly across the shards.
+
+        shards (`int`, optional):
+            Number of shards.
+    """
+
+    def __init__(self, max_size: int = 10_000, shards: int = 16) -> None:
+        self.max_size = max_size
+        self._shard_size = max(1, max_size // shards)
+        self._shards: List[Dict[Hashable, Any]] = [{} for _ in range(shards)]
+        self._locks = [threading.Lock() for _ in range(shards)]
+
+    def get(self, key: Hashable) -> Any:
+        """Returns the value of `key`, or None."""
+        return self._shards[hash(key) % len(self._shards)].get(key)
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Set the value of `key`, evicting the oldest entry of its shard if needed."""
+        index = hash(key) % len(self._shards)
+        shard = self._shards[index]
+
+        with self._locks[index]:
+            if key not in shard and len(shard) >= self._shard_size:
+                del shard[next(iter(shard))]
+            shard[key] = value
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        for lock, shard in zip(self._locks, self._shards):
+            with lock:
+                shard.clear()
+
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+
+
+class _Owner:
+    """Lives as long as the thread-local data of one thread."""
+
+    __slots__ = ("__weakref__",)
+
+
+def _retire(
+    counters: Dict[int, List[int]],
+    totals: List[int],
+    lock: Any,
+    key: int,
+) -> None:
+    """Fold the counters of a finished thread into the totals."""
+    with lock:
+        hits, misses = counters.pop(key)
+        totals[0] += hits
+        totals[1] += misses
+
+
+class ConcurrentValidator(Validator):
+    """A `Validator` that can be shared by any number of threads.
+
+    Every thread keeps its own copy of the pre-keyed HMAC state, so threads never touch the same hash object, and `validate`, `validate_raw` and `sign` work as in `Validator`. `authenticate` additionally remembers validated query strings, and the `user`, `receiver` and `chat` objects decoded from them, in `ShardedCache`s.
+
+    Parameters:
+        bot_token (`str`):
+            The token associated with the bot, used to either launch the webapp or sign the init data.
+
+        lifetime (`int`, optional):
+            The maximum validity period of the init data in seconds, used by `authenticate`.
+            Recommended for security. Default is `None`.
+
+        cache_size (`int`, optional):
+            Maximum number of remembered query strings.
+
+        object_cache_size (`int`, optional):
+            Maximum number of remembered `user`, `receiver` and `chat` objects.
+
+        shards (`int`, optional):
+            Number of shards of each cache. More shards mean less contention between threads inserting entries.
+    """
+
+    def __init__(
+        self,
+        bot_token: str,
+        lifetime: Optional[int] = None,
+        cache_size: int = 10_000,
+        object_cache_size: int = 4096,
+        shards: int = 16,
+    ) -> None:
+        self._local = threading.local()
+        self._args = (
+            bot_token,
+            lifetime,
+            cache_size,
+            object_cache_size,
+            shards,
+        )
+        super().__init__(bot_token)
+        self.lifetime = lifetime
+        self.results = ShardedCache(cache_size, shards)
+        self.objects = ShardedCache(object_cache_size, shards)
+        # NOTE: Counters are per thread, so they are updated without locks,
+        # and summed up by `stats`. Those of finished threads are folded into
+        # the totals, so servers starting a thread per request don't leak.
+        # The lock is reentrant, as folding may run on garbage collection
+        # while the same thread holds it.
+        self._counters: Dict[int, List[int]] = {}
+        self._totals = [0, 0]
+        self._counters_lock = threading.RLock()
+
+    @property
+    def _hmac(self) -> Any:
+        local = self._local
+        try:
+            return local.hmac
+        except AttributeError:
+            local.hmac = self._shared_hmac.copy()
+            return local.hmac
+
+    @_hmac.setter
+    def _hmac(self, value: Any) -> None:
+        self._shared_hmac = value
+
+    def _thread_counters(self) -> List[int]:
+        local = self._local
+        try:
+            return local.counters
+        except AttributeError:
+            counters = [0, 0]
+            owner = _Owner()
+            with self._counters_lock:
+                key = id(owner)
+                self._counters[key] = counters
+            weakref.finalize(
+                owner,
+                _retire,
+                self._counters,
+                self._totals,
+                self._counters_lock,
+                key,
+            )
+            local.owner = owner
+            local.counters = counters
+            return counters
+
+    def authenticate(self, query_string: Union[str, BytesLike]) -> InitData:
+        """Validate a query string, reusing the result of a previous call by any thread.
+
+        The init data is decoded before it is cached, and returned as a `FrozenInitData` with read-only `user`, `receiver` and `chat`, so it can be shared between threads safely.
+
+        Parameters:
+            query_string (`str` | `bytes` | `bytearray` | `memoryview`):
+                The query string from `window.WebApp.initData` to validate.
+
+        Returns:
+            `FrozenInitData`:
+                The validated init data.
+
+        Raises:
+            The errors raised by `Validator.validate_raw`.
+        """
+        data = (
+            query_string.encode()
+            if isinstance(query_string, str)
+            else query_string
+        )
+        key = hashlib.blake2b(data, digest_size=16).digest()
+        counters = self._thread_counters()
+
+        entry = self.results.get(key)
+        if entry is not None and time.time() <= entry[1]:
+            counters[0] += 1
+            return entry[0]
+
+        counters[1] += 1
+        parsed_qs = self.validate_raw(query_string, self.lifetime)
+        init_data = self._decode(InitData._from_pairs(parsed_qs, lazy=True))
+
+        if self.lifetime is None:
+            expires_at = float("inf")
+        else:
+            expires_at = init_data.auth_date + self.lifetime  # type: ignore
+
+        self.results.set(key, (init_data, expires_at))
+
+        return init_data
+
+    def _decode(self, init_data: InitData) -> FrozenInitData:
+        """Decode the objects of lazily parsed init data, sharing them through the object cache."""
+        for field in InitData._object_fields.values():
+            raw = getattr(init_data, field.raw_attr)
+            if raw is None:
+                continue
+
+            key = (field.type, raw)
+            obj = self.objects.get(key)
+            if obj is None:
+                try:
+                    obj = field.type._from_dict(json_backend.loads(raw))
+                except (TypeError, ValueError):
+                    error = errors.UnexpectedFormatError()
+                    instrumentation.count_error(error)
+                    raise error
+                obj = interning.freeze(obj)
+                self.objects.set(key, obj)
+
+            # NOTE: The raw JSON is kept, so hashing and serializing the init
+            # data again gives the same result.
+            setattr(init_data, field.attr, obj)
+
+        return init_data.freeze()
+
+    def stats(self) -> Dict[str, int]:
+        """Returns the number of `authenticate` calls answered from the cache and validated, over all threads."""
+        with self._counters_lock:
+            counters = [self._totals, *self._counters.values()]
+
+        return {
+            "hits": sum(hits for hits, _ in counters),
+            "misses": sum(misses for _, misses in counters),
+        }
+
+    def __reduce__(self) -> Tuple[Any, Tuple[Any, ...]]:
+        return type(self), self._args
@@ -1,6 +1,8 @@
 from .errors import (
     AuthDateMissingError,
     ExpiredError,
+    InitDataPyError,
+    ReplayedError,
     SignInvalidError,
     SignMissingError,
     UnexpectedFormatError,
@@ -9,6 +11,8 @@ from .errors import (
 __all__ = [
     "AuthDateMissingError",
     "ExpiredError",
+    "InitDataPyError",
+    "ReplayedError",
     "SignInvalidError",
     "SignMissingError",
     "UnexpectedFormatError",
@@ -25,3 +25,8 @@ class SignMissingError(InitDataPyError):
 class UnexpectedFormatError(InitDataPyError):
     def __init__(self):
         super().__init__("the init data query string has unexpected format.")
+
+
+class ReplayedError(InitDataPyError):
+    def __init__(self):
+        super().__init__("init data has already been used.")
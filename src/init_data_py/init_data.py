@@ -1,13 +1,100 @@
-import hashlib
-import hmac
 import json
 import time
 import urllib.parse
 import warnings
-from datetime import datetime, timedelta
-from typing import Literal, Optional
+from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Union
 
-from init_data_py import errors, types
+from init_data_py import (
+    aio,
+    binary,
+    errors,
+    instrumentation,
+    json_backend,
+    types,
+)
+from init_data_py._query import BytesLike, decode_pairs, parse_qsl_bytes
+from init_data_py.screening import Prescreen
+from init_data_py.third_party import ThirdPartyValidator
+from init_data_py.validator import Validator
+
+_INT_FIELDS = frozenset(("auth_date", "can_send_after"))
+_CHUNK_SIZE = 4096
+
+
+class _ObjectField:
+    """An `InitData` attribute holding a `types.Object`.
+
+    When set from raw JSON, the object is decoded either right away or on first access. The raw JSON stays in use for hashing and serialization while the decoded object still matches it, so the result depends neither on whether the object was accessed nor on how Telegram ordered its fields. Once the object is changed in place, it is serialized again.
+    """
+
+    def __init__(self, type: "type[types.Object]") -> None:
+        self.type = type
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+        self.attr = f"_{name}"
+        self.raw_attr = f"_{name}_json"
+
+    def __get__(self, instance: object, owner: type):
+        if instance is None:
+            return self
+
+        value = getattr(instance, self.attr)
+        if value is None:
+            raw = getattr(instance, self.raw_attr)
+            if raw is not None:
+                instrument = instrumentation.active
+                if instrument is not None:
+                    start = time.perf_counter()
+
+                try:
+                    value = self.type.from_json(raw)
+                except (TypeError, ValueError):
+                    error = errors.UnexpectedFormatError()
+                    instrumentation.count_error(error)
+                    raise error
+
+                if instrument is not None:
+                    instrument.record("decode", time.perf_counter() - start)
+                setattr(instance, self.attr, value)
+
+        return value
+
+    def __set__(self, instance: object, value) -> None:
+        setattr(instance, self.attr, value)
+        setattr(instance, self.raw_attr, None)
+
+    def set_raw(self, instance: object, raw: str) -> None:
+        """Set the attribute from raw JSON, deferring decoding."""
+        setattr(instance, self.attr, None)
+        setattr(instance, self.raw_attr, raw)
+
+    def set_json(self, instance: object, raw: str) -> None:
+        """Set the attribute from raw JSON, decoding it right away."""
+        setattr(instance, self.attr, self.type.from_json(raw))
+        setattr(instance, self.raw_attr, raw)
+
+    def to_json(self, instance: object) -> Optional[str]:
+        """Returns the JSON the hash is calculated over, without decoding."""
+        raw = getattr(instance, self.raw_attr)
+        value = getattr(instance, self.attr)
+        if value is None:
+            return raw
+
+        # NOTE: Telegram escapes slashes in JSON, and the hash relies on it.
+        serialized = value.to_json().replace("/", r"\/")
+        if raw is None or serialized == raw:
+            return serialized
+
+        # NOTE: The raw JSON differs in the order or escaping of its fields,
+        # so it is only kept if the object was not changed since decoding.
+        try:
+            if json_backend.loads(raw) == value.to_dict():
+                return raw
+        except ValueError:
+            pass
+
+        return serialized
 
 
 class InitData:
@@ -48,6 +135,45 @@ class InitData:
             A signature of all passed parameters (except hash), which the third party can use to check their validity.
     """
 
+    user = _ObjectField(types.User)
+    receiver = _ObjectField(types.User)
+    chat = _ObjectField(types.Chat)
+
+    # NOTE: The order of the attributes is important.
+    _fields = (
+        "query_id",
+        "user",
+        "receiver",
+        "chat",
+        "chat_type",
+        "chat_instance",
+        "start_param",
+        "can_send_after",
+        "auth_date",
+        "hash",
+        "signature",
+    )
+    _object_fields = {"user": user, "receiver": receiver, "chat": chat}
+    _check_fields: Tuple[Tuple[str, bytes, bytes, Optional[_ObjectField]], ...]
+    _decoders: Dict[str, Callable[["InitData", str], None]]
+    _lazy_decoders: Dict[str, Callable[["InitData", str], None]]
+    __slots__ = (
+        "query_id",
+        "_user",
+        "_user_json",
+        "_receiver",
+        "_receiver_json",
+        "_chat",
+        "_chat_json",
+        "chat_type",
+        "chat_instance",
+        "start_param",
+        "can_send_after",
+        "auth_date",
+        "hash",
+        "signature",
+    )
+
     def __init__(
         self,
         *,
@@ -106,30 +232,46 @@ class InitData:
             `errors.ExpiredError`: In case the init data has expired based on the provided lifetime.
             `errors.SignInvalidError`: In case the signature (hash) is invalid.
         """
-        if self.hash is None:
-            if raise_error:
-                raise errors.SignMissingError()
-            return False
+        return Validator(bot_token).validate(self, lifetime, raise_error)
 
-        if self.auth_date is None:
-            if raise_error:
-                raise errors.AuthDateMissingError()
-            return False
+    def validate_third_party(
+        self,
+        bot_id: int,
+        lifetime: Optional[int] = None,
+        raise_error: bool = True,
+        test: bool = False,
+    ):
+        """Validates the init data `signature` without the bot token.
 
-        if lifetime is not None:
-            auth_date = datetime.fromtimestamp(self.auth_date)
-            expire_date = auth_date + timedelta(seconds=lifetime)
-            if datetime.now() > expire_date:
-                if raise_error:
-                    raise errors.ExpiredError()
-                return False
+        Requires the `cryptography` package, see `third_party.ThirdPartyValidator`.
 
-        if self.hash != self.calculate_hash(bot_token):
-            if raise_error:
-                raise errors.SignInvalidError()
-            return False
+        Parameters:
+            bot_id (`int`):
+                The id of the bot the init data was issued for, the part of its token before the colon.
 
-        return True
+            lifetime (`int`, optional):
+                The maximum validity period of the init data in seconds.
+                Recommended for security. Default is `None`.
+
+            raise_error (`bool`, optional):
+                In case True, raises an exception on invalid data, If False, returns False instead of raising an error.
+
+            test (`bool`, optional):
+                If True, the public key of the Telegram test environment is used.
+
+        Returns:
+            `bool`:
+                True if the data is valid; otherwise, returns False.
+
+        Raises:
+            `errors.SignMissingError`: In case the signature is missing.
+            `errors.AuthDateMissingError`: In case the auth_date is missing.
+            `errors.ExpiredError`: In case the init data has expired based on the provided lifetime.
+            `errors.SignInvalidError`: In case the signature is invalid.
+        """
+        validator = ThirdPartyValidator(bot_id, test)
+
+        return validator.validate(self, lifetime, raise_error)
 
     def sign(self, bot_token: str, auth_date: Optional[int] = None):
         """Sign the init data using the provided bot token.
@@ -145,12 +287,7 @@ class InitData:
             `InitData`:
                 This current updated init data by setting the `auth_date` and generated signature (`hash`) attributes.
         """
-        self.auth_date = (
-            auth_date if auth_date is not None else int(time.time())
-        )
-        self.hash = self.calculate_hash(bot_token)
-
-        return self
+        return Validator(bot_token).sign(self, auth_date)
 
     def calculate_hash(
         self,
@@ -166,21 +303,43 @@ class InitData:
             `str`:
                 The calculated hash, derived from the init data attributes and the generated secret key.
         """
-        init_data = self.to_dict(nested=False)
-        init_data.pop("hash", None)
-        sorted_attrs = sorted(init_data.items())
-        data_check_string = (
-            "\n".join(f"{k}={v}" for k, v in sorted_attrs)
-            .replace("/", r"\/")
-            .encode()
-        )
-        secret_key = hmac.new(
-            b"WebAppData", bot_token.encode(), hashlib.sha256
-        ).digest()
+        return Validator(bot_token).calculate_hash(self)
+
+    def _data_check_string(self) -> bytes:
+        """Returns the data-check string the hash is calculated over."""
+        pieces: List[bytes] = []
+        InitData._write_data_check_string(self, pieces.append)
 
-        return hmac.new(
-            secret_key, data_check_string, hashlib.sha256
-        ).hexdigest()
+        return b"".join(pieces)
+
+    def _write_data_check_string(self, write: Callable[[bytes], Any]) -> None:
+        """Pass the data-check string to `write` a field at a time, e.g. to the `update` of an HMAC, without building it.
+
+        Values longer than `_CHUNK_SIZE` are encoded in chunks, so the memory used does not grow with their size.
+        """
+        started = False
+        for name, first, prefix, field in InitData._check_fields:
+            if field is not None:
+                value = field.to_json(self)
+            else:
+                value = getattr(self, name)
+            if value is None:
+                continue
+
+            key = prefix if started else first
+            started = True
+            if name in _INT_FIELDS:
+                write(b"%b%d" % (key, int(value)))
+                continue
+
+            value = str(value)
+            if len(value) <= _CHUNK_SIZE:
+                write(key + value.encode())
+                continue
+
+            write(key)
+            for i in range(0, len(value), _CHUNK_SIZE):
+                write(value[i : i + _CHUNK_SIZE].encode())
 
     @classmethod
     def from_query_string(cls, query_string: str):
@@ -193,13 +352,24 @@ class InitData:
         return cls.parse(query_string)
 
     @classmethod
-    def parse(cls, query_string: str):
+    def parse(
+        cls,
+        query_string: Union[str, BytesLike],
+        lazy: bool = False,
+        prescreen: Optional[Prescreen] = None,
+    ):
         """Create an InitData object from a query string.
 
         Parameters:
-            query_string (`str`):
+            query_string (`str` | `bytes` | `bytearray` | `memoryview`):
                 The query string from `window.WebApp.initData` to parse and convert into an InitData object.
 
+            lazy (`bool`, optional):
+                If True, `user`, `receiver` and `chat` are kept as raw JSON and only decoded on first access. Validation and serialization use the raw JSON and never force decoding.
+
+            prescreen (`screening.Prescreen`, optional):
+                Checks run on the raw query string before it is parsed.
+
         Returns:
             `InitData`:
                 An object of InitData with attributes set according to the values in the query_string.
@@ -208,49 +378,131 @@ class InitData:
             `errors.SignMissingError`: In case the signature (hash) is missing.
             `errors.AuthDateMissingError`: In case the auth_date is missing.
             `errors.UnexpectedFormatError`: In case the the format of the query string is unexpected.
+            `errors.ExpiredError`: In case the prescreen has a lifetime and the init data has expired.
         """
-        parsed_qs = dict(urllib.parse.parse_qsl(query_string))
+        try:
+            if prescreen is not None:
+                prescreen.check(query_string)
 
-        if not parsed_qs:
-            raise errors.UnexpectedFormatError()
+            instrument = instrumentation.active
+            if instrument is not None:
+                start = time.perf_counter()
 
-        init_data = {}
+            if isinstance(query_string, str):
+                parsed_qs = dict(urllib.parse.parse_qsl(query_string))
+            else:
+                parsed_qs = decode_pairs(parse_qsl_bytes(query_string))
+
+            if instrument is not None:
+                instrument.record("parse_qsl", time.perf_counter() - start)
+
+            if not parsed_qs:
+                raise errors.UnexpectedFormatError()
+
+            if instrument is None or lazy:
+                return cls._from_pairs(parsed_qs, lazy)
+
+            start = time.perf_counter()
+            init_data = cls._from_pairs(parsed_qs, lazy)
+            instrument.record("decode", time.perf_counter() - start)
+
+            return init_data
+        except errors.InitDataPyError as e:
+            instrumentation.count_error(e)
+            raise
+
+    @classmethod
+    async def aparse(
+        cls,
+        query_string: Union[str, BytesLike],
+        offloader: Optional[aio.Offloader] = None,
+        lazy: bool = False,
+        prescreen: Optional[Prescreen] = None,
+    ):
+        """Asynchronous counterpart of `parse`.
+
+        Query strings above the offloader threshold are parsed in its executor.
+
+        Parameters:
+            query_string (`str` | `bytes` | `bytearray` | `memoryview`):
+                The query string from `window.WebApp.initData` to parse and convert into an InitData object.
+
+            offloader (`aio.Offloader`, optional):
+                Decides where the work runs. Defaults to `aio.default_offloader`.
+
+            lazy (`bool`, optional):
+                If True, `user`, `receiver` and `chat` are only decoded on first access.
+
+            prescreen (`screening.Prescreen`, optional):
+                Checks run on the raw query string before it is parsed.
+
+        Returns:
+            `InitData`:
+                An object of InitData with attributes set according to the values in the query_string.
+        """
+        offloader = offloader or aio.default_offloader
+
+        return await offloader.run(
+            cls.parse, query_string, lazy, prescreen, size=len(query_string)
+        )
+
+    @classmethod
+    def validate_raw(
+        cls,
+        query_string: Union[str, BytesLike],
+        bot_token: str,
+        lifetime: Optional[int] = None,
+    ):
+        """Validate a query string and create an InitData object from it.
+
+        Unlike `parse` followed by `validate`, the hash is checked against the original query string values before any JSON decoding takes place. The returned object is parsed lazily, see `parse`.
+
+        Parameters:
+            query_string (`str` | `bytes` | `bytearray` | `memoryview`):
+                The query string from `window.WebApp.initData` to validate.
+
+            bot_token (`str`):
+                The token associated with the bot, used to either launch the webapp or sign the init data.
+
+            lifetime (`int`, optional):
+                The maximum validity period of the init data in seconds.
+                Recommended for security. Default is `None`.
+
+        Returns:
+            `InitData`:
+                An object of InitData with attributes set according to the values in the query_string.
+
+        Raises:
+            `errors.SignMissingError`: In case the signature (hash) is missing.
+            `errors.AuthDateMissingError`: In case the auth_date is missing.
+            `errors.ExpiredError`: In case the init data has expired based on the provided lifetime.
+            `errors.SignInvalidError`: In case the signature (hash) is invalid.
+            `errors.UnexpectedFormatError`: In case the the format of the query string is unexpected.
+        """
+        parsed_qs = Validator(bot_token).validate_raw(query_string, lifetime)
+
+        return cls._from_pairs(parsed_qs, lazy=True)
+
+    @classmethod
+    def _from_pairs(cls, parsed_qs: Dict[str, str], lazy: bool = False):
+        """Create an InitData object from decoded query string pairs."""
+        decoders = cls._lazy_decoders if lazy else cls._decoders
+        init_data = cls()
 
         for k, v in parsed_qs.items():
-            if k in {
-                "hash",
-                "signature",
-                "query_id",
-                "chat_type",
-                "chat_instance",
-                "start_param",
-            }:
-                init_data[k] = v
-
-            elif k in {"auth_date", "can_send_after"}:
-                init_data[k] = int(v)  # type: ignore
-            elif k in {"user", "receiver"}:
-                try:
-                    init_data[k] = types.User.from_json(v)
-                except json.decoder.JSONDecodeError:
-                    raise errors.UnexpectedFormatError()
-            elif k == "chat":
-                try:
-                    init_data[k] = types.Chat.from_json(v)
-                except json.decoder.JSONDecodeError:
-                    raise errors.UnexpectedFormatError()
-            else:
+            decode = decoders.get(k)
+            if decode is None:
                 raise errors.UnexpectedFormatError()
 
-        hash = parsed_qs.get("hash")
-        if hash is None:
-            raise errors.UnexpectedFormatError()
+            try:
+                decode(init_data, v)
+            except (TypeError, ValueError):
+                raise errors.UnexpectedFormatError()
 
-        auth_date = parsed_qs.get("auth_date")
-        if auth_date is None:
+        if init_data.hash is None or init_data.auth_date is None:
             raise errors.UnexpectedFormatError()
 
-        return cls(**init_data)  # type: ignore
+        return init_data
 
     def to_json(self):
         """Returns a JSON serialized representation of the object."""
@@ -263,18 +515,24 @@ class InitData:
             nested (`bool`):
                 If True, nested objects will be converted to dictionaries; if False, nested objects will be represented as serialized JSON.
         """
-        init_data_attrs = {
-            k: v for k, v in self.__dict__.items() if v is not None
-        }
         init_data = {}
 
-        for k, v in init_data_attrs.items():
-            if isinstance(v, (types.User, types.Chat)):
+        for k in self._fields:
+            if k in self._object_fields:
                 if nested:
-                    init_data[k] = v.to_dict()
+                    v = getattr(self, k)
+                    if v is not None:
+                        init_data[k] = v.to_dict()
                     continue
-                init_data[k] = v.to_json()
-            elif k in {"auth_date", "can_send_after"}:
+                v = self._object_fields[k].to_json(self)
+                if v is not None:
+                    init_data[k] = v
+                continue
+
+            v = getattr(self, k)
+            if v is None:
+                continue
+            elif k in _INT_FIELDS:
                 init_data[k] = int(v)
             else:
                 init_data[k] = str(v)
@@ -287,6 +545,46 @@ class InitData:
 
         return urllib.parse.urlencode(init_data)
 
+    def to_bytes(self) -> bytes:
+        """Returns a compact binary representation of the object, for storing validated init data in a session store.
+
+        The layout is versioned and struct-packed, see `init_data_py.binary`. Decoding it with `from_bytes` needs neither query string parsing nor JSON, except for objects whose JSON as received can't be reproduced from their fields, which are stored as is and decoded on first access.
+
+        Raises:
+            `ValueError`: In case a string is longer than 65535 bytes, or an integer does not fit in 64 bits.
+        """
+        return binary.pack(self)
+
+    @classmethod
+    def from_bytes(cls, data: Union[bytes, BytesLike]):
+        """Create an InitData object from the output of `to_bytes`.
+
+        The data is not validated again, so it must come from a trusted store. The `hash`, `signature` and the JSON of objects as received are kept, so the result can still be validated.
+
+        Parameters:
+            data (`bytes` | `bytearray` | `memoryview`):
+                The binary representation to decode.
+
+        Returns:
+            `InitData`:
+                An object of InitData with the stored attributes.
+
+        Raises:
+            `errors.UnexpectedFormatError`: In case the data is malformed, or of an unsupported version.
+        """
+        fields = binary.unpack(data)
+        raw = {
+            name: fields.pop(name)
+            for name in cls._object_fields
+            if isinstance(fields.get(name), str)
+        }
+
+        init_data = cls(**fields)
+        for name, raw_json in raw.items():
+            cls._object_fields[name].set_raw(init_data, raw_json)
+
+        return init_data
+
     def __str__(self) -> str:
         return json.dumps(self.to_dict(nested=True), indent=4)
 
@@ -294,7 +592,7 @@ class InitData:
         if not isinstance(other, type(self)):
             return False
 
-        for attr in self.__dict__:
+        for attr in self._fields:
             try:
                 if getattr(self, attr) != getattr(other, attr):
                     return False
@@ -302,3 +600,171 @@ class InitData:
                 return False
 
         return True
+
+    def freeze(self) -> "FrozenInitData":
+        """Returns an immutable copy of the init data, see `FrozenInitData`."""
+        frozen = FrozenInitData.__new__(FrozenInitData)
+        frozen._copy_from(self)
+
+        return frozen
+
+
+class FrozenInitData(InitData):
+    """An immutable `InitData` that computes its serialized forms only once.
+
+    The data-check string, query string, JSON and binary forms are built on first use and cached, so validating and serializing the same init data repeatedly costs a single serialization. Instances are hashable and can be used as dict keys or set members; equality compares the `hash` attributes first, and only compares the data-check strings if they match.
+
+    Nested `user`, `receiver` and `chat` objects are shared, and must not be modified.
+
+    Create one with `InitData.freeze` or `FrozenInitData.parse`.
+    """
+
+    __slots__ = (
+        "_data_check_string_cache",
+        "_query_string",
+        "_json",
+        "_str",
+        "_bytes",
+    )
+
+    def __init__(self, **kwargs: Any) -> None:
+        self._copy_from(InitData(**kwargs))
+
+    def _copy_from(self, init_data: InitData) -> None:
+        for name in InitData.__slots__:
+            object.__setattr__(self, name, getattr(init_data, name))
+        for name in FrozenInitData.__slots__:
+            object.__setattr__(self, name, None)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in InitData._fields:
+            raise AttributeError(
+                f"cannot assign to field {name!r} of FrozenInitData."
+            )
+        object.__setattr__(self, name, value)
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(
+            f"cannot delete field {name!r} of FrozenInitData."
+        )
+
+    def __setstate__(self, state: Any) -> None:
+        _, slots = state if isinstance(state, tuple) else (None, state)
+        for name, value in (slots or {}).items():
+            object.__setattr__(self, name, value)
+
+    def thaw(self) -> InitData:
+        """Returns a mutable copy of the init data."""
+        init_data = InitData.__new__(InitData)
+        for name in InitData.__slots__:
+            setattr(init_data, name, getattr(self, name))
+
+        return init_data
+
+    def freeze(self) -> "FrozenInitData":
+        return self
+
+    def sign(self, bot_token: str, auth_date: Optional[int] = None):
+        """Returns a signed copy of the init data, see `InitData.sign`."""
+        return self.thaw().sign(bot_token, auth_date).freeze()
+
+    def _data_check_string(self) -> bytes:
+        if self._data_check_string_cache is None:
+            object.__setattr__(
+                self,
+                "_data_check_string_cache",
+                InitData._data_check_string(self),
+            )
+
+        return self._data_check_string_cache
+
+    def _write_data_check_string(self, write: Callable[[bytes], Any]) -> None:
+        write(self._data_check_string())
+
+    def to_query_string(self):
+        if self._query_string is None:
+            object.__setattr__(
+                self, "_query_string", InitData.to_query_string(self)
+            )
+
+        return self._query_string
+
+    def to_json(self):
+        if self._json is None:
+            object.__setattr__(self, "_json", InitData.to_json(self))
+
+        return self._json
+
+    def to_bytes(self) -> bytes:
+        if self._bytes is None:
+            object.__setattr__(self, "_bytes", InitData.to_bytes(self))
+
+        return self._bytes
+
+    def __str__(self) -> str:
+        if self._str is None:
+            object.__setattr__(self, "_str", InitData.__str__(self))
+
+        return self._str
+
+    def __hash__(self) -> int:
+        return hash(self.hash)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FrozenInitData):
+            return InitData.__eq__(self.thaw(), other)
+
+        return (
+            self.hash == other.hash
+            and self._data_check_string() == other._data_check_string()
+        )
+
+
+def _compile_decoders(
+    lazy: bool,
+) -> Dict[str, Callable[[InitData, str], None]]:
+    """Map each query string key to a function setting it on an `InitData`."""
+
+    def decoder(name: str, convert: Optional[Callable[[str], Any]] = None):
+        set_ = InitData.__dict__[name].__set__
+        if convert is None:
+            return set_
+
+        def decode(init_data: InitData, value: str) -> None:
+            set_(init_data, convert(value))
+
+        return decode
+
+    decoders = {
+        "query_id": decoder("query_id"),
+        "chat_type": decoder("chat_type"),
+        "chat_instance": decoder("chat_instance"),
+        "start_param": decoder("start_param"),
+        "can_send_after": decoder("can_send_after", int),
+        "auth_date": decoder("auth_date", int),
+        "hash": decoder("hash"),
+        "signature": decoder("signature"),
+    }
+    # NOTE: Objects keep their raw JSON either way, so hashing does not
+    # depend on how unknown fields are ordered when serialized again.
+    for name, field in InitData._object_fields.items():
+        decoders[name] = field.set_raw if lazy else field.set_json
+
+    return decoders
+
+
+# NOTE: The data-check string lists the fields sorted by key, so the order
+# and the `key=` prefixes, with and without a leading newline, are computed
+# once for all instances.
+InitData._check_fields = tuple(
+    (
+        name,
+        f"{name}=".encode(),
+        f"\n{name}=".encode(),
+        InitData._object_fields.get(name),
+    )
+    for name in sorted(InitData._fields)
+    if name != "hash"
+)
+InitData._decoders = _compile_decoders(lazy=False)
+InitData._lazy_decoders = _compile_decoders(lazy=True)
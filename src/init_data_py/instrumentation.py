@@ -0,0 +1,95 @@
+import threading
+from collections import defaultdict
+from typing import Any, Dict, Optional
+
+# NOTE: Instrumented code reads this once per call and skips all timing
+# when it is None, so disabled instrumentation costs a single `is None`
+# check per stage.
+active: Optional[Any] = None
+
+STAGES = ("parse_qsl", "decode", "serialize", "hmac")
+
+
+class Metrics:
+    """Collect per-stage durations and error counts of the validation pipeline.
+
+    Any object with the same `record` and `count_error` methods can be passed to `enable` instead, for example to forward measurements to an existing metrics client.
+
+    The stages are:
+        - `parse_qsl`: splitting and unquoting the query string.
+        - `decode`: decoding `user`, `receiver` and `chat` from JSON.
+        - `serialize`: building the data-check string from an `InitData`.
+        - `hmac`: calculating the hash.
+    """
+
+    def __init__(self) -> None:
+        self.seconds: Dict[str, float] = defaultdict(float)
+        self.calls: Dict[str, int] = defaultdict(int)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self._lock = threading.Lock()
+
+    def record(self, stage: str, seconds: float) -> None:
+        """Record the duration of a single run of a stage."""
+        with self._lock:
+            self.seconds[stage] += seconds
+            self.calls[stage] += 1
+
+    def count_error(self, name: str) -> None:
+        """Count an error by the name of its `init_data_py.errors` class."""
+        with self._lock:
+            self.errors[name] += 1
+
+    def to_prometheus(self, prefix: str = "init_data_py") -> str:
+        """Returns the metrics in the Prometheus text exposition format."""
+        with self._lock:
+            seconds = dict(self.seconds)
+            calls = dict(self.calls)
+            errors = dict(self.errors)
+
+        lines = [
+            f"# HELP {prefix}_stage_seconds Time spent in each validation stage.",
+            f"# TYPE {prefix}_stage_seconds summary",
+        ]
+        for stage in seconds:
+            lines.append(
+                f'{prefix}_stage_seconds_sum{{stage="{stage}"}} {seconds[stage]!r}'
+            )
+            lines.append(
+                f'{prefix}_stage_seconds_count{{stage="{stage}"}} {calls[stage]}'
+            )
+
+        lines += [
+            f"# HELP {prefix}_errors_total Init data rejected, by error.",
+            f"# TYPE {prefix}_errors_total counter",
+        ]
+        for name, count in errors.items():
+            lines.append(f'{prefix}_errors_total{{error="{name}"}} {count}')
+
+        return "\n".join(lines) + "\n"
+
+
+def enable(instrument: Optional[Any] = None) -> Any:
+    """Start recording measurements, returning the instrument in use.
+
+    Parameters:
+        instrument (`Metrics`, optional):
+            The object receiving measurements. Defaults to a new `Metrics`.
+    """
+    global active
+    active = instrument if instrument is not None else Metrics()
+
+    return active
+
+
+def disable() -> None:
+    """Stop recording measurements."""
+    global active
+    active = None
+
+
+def count_error(error: BaseException) -> None:
+    """Count an error with the active instrument, if any."""
+    # NOTE: Read once, as another thread may disable the instrument.
+    instrument = active
+    if instrument is not None:
+        instrument.count_error(type(error).__name__)
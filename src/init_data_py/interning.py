@@ -0,0 +1,150 @@
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import Any, Dict, Optional, Tuple, Type
+
+from init_data_py import json_backend
+
+# NOTE: `types.Object.from_json` reads this on every call and decodes as
+# usual when it is None, so a disabled pool costs a single `is None` check.
+active: Optional["InternPool"] = None
+
+_frozen_types: Dict[type, type] = {}
+
+
+def _readonly(self: Any, name: str, *args: Any) -> None:
+    raise AttributeError(
+        f"cannot modify {name!r} of an interned {type(self).__name__}."
+    )
+
+
+def _frozen_eq(self: Any, other: object) -> bool:
+    cls = type(self).__mro__[1]
+    if not isinstance(other, cls):
+        return False
+
+    for attr in cls._fields + ("extra",):
+        if getattr(self, attr) != getattr(other, attr):
+            return False
+
+    return True
+
+
+def _frozen_reduce(self: Any) -> Tuple[Any, Tuple[Any, ...]]:
+    return _freeze_from_dict, (type(self).__mro__[1], self.to_dict())
+
+
+def _frozen_type(cls: type) -> type:
+    """Returns a read-only subclass of a `types.Object` subclass."""
+    frozen = _frozen_types.get(cls)
+    if frozen is None:
+        frozen = _frozen_types[cls] = type(
+            cls.__name__,
+            (cls,),
+            {
+                "__slots__": (),
+                "__module__": cls.__module__,
+                "__qualname__": cls.__qualname__,
+                "__setattr__": _readonly,
+                "__delattr__": _readonly,
+                "__eq__": _frozen_eq,
+                "__hash__": None,
+                "__reduce__": _frozen_reduce,
+            },
+        )
+
+    return frozen
+
+
+def freeze(obj: Any) -> Any:
+    """Returns a read-only copy of a `types.Object`.
+
+    The copy is an instance of a subclass of the object's type, so `isinstance` checks keep working, but assigning to its attributes raises `AttributeError` and its `extra` is a read-only mapping.
+    """
+    cls = _frozen_type(type(obj))
+    frozen = cls.__new__(cls)
+    for name, set_ in cls._setters.items():
+        set_(frozen, getattr(obj, name))
+
+    extra = obj.extra
+    object.__setattr__(
+        frozen, "extra", MappingProxyType(extra) if extra else None
+    )
+
+    return frozen
+
+
+def _freeze_from_dict(cls: Any, data: Dict[str, Any]) -> Any:
+    return freeze(cls._from_dict(data))
+
+
+class InternPool:
+    """Share decoded `types.User` and `types.Chat` objects between init data.
+
+    In group chats the same `user` and `chat` JSON shows up in many sessions. While the pool is enabled, `from_json` returns one shared, read-only object per distinct JSON string instead of decoding it again. The least recently used object is evicted once `max_size` is reached.
+
+    The pool is not thread-safe, `concurrency.ConcurrentValidator` shares decoded objects between threads instead.
+
+    Parameters:
+        max_size (`int`, optional):
+            Maximum number of objects kept in the pool.
+    """
+
+    def __init__(self, max_size: int = 4096) -> None:
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._objects: "OrderedDict[Tuple[type, str], Any]" = OrderedDict()
+
+    def get(self, cls: Type[Any], json_string: str) -> Any:
+        """Returns the shared object decoded from `json_string`."""
+        key = (cls, json_string)
+        obj = self._objects.get(key)
+
+        if obj is not None:
+            self._objects.move_to_end(key)
+            self.hits += 1
+            return obj
+
+        self.misses += 1
+        obj = freeze(cls._from_dict(json_backend.loads(json_string)))
+
+        self._objects[key] = obj
+        if len(self._objects) > self.max_size:
+            self._objects.popitem(last=False)
+
+        return obj
+
+    @property
+    def hit_rate(self) -> float:
+        """The share of lookups answered from the pool."""
+        lookups = self.hits + self.misses
+
+        return self.hits / lookups if lookups else 0.0
+
+    def clear(self) -> None:
+        """Remove all objects and reset the statistics."""
+        self._objects.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+
+def enable(pool: Optional[InternPool] = None) -> InternPool:
+    """Start interning decoded objects, returning the pool in use.
+
+    Parameters:
+        pool (`InternPool`, optional):
+            The pool to use. Defaults to a new `InternPool`.
+    """
+    global active
+    active = pool if pool is not None else InternPool()
+
+    return active
+
+
+def disable() -> None:
+    """Stop interning decoded objects."""
+    global active
+    active = None
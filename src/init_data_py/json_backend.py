@@ -0,0 +1,138 @@
+import json
+from typing import Any, Callable, Dict, Optional, Tuple
+
+Backend = Tuple[Callable[[Any], str], Callable[[Any], Any]]
+
+# NOTE: A backend is only used if it serializes exactly like the standard
+# library with `separators=(",", ":")` and `ensure_ascii=False`, as the hash
+# relies on it. Values a fast backend can not handle, such as integers
+# beyond 64 bits, fall back to the standard library. So do floats, which
+# fast backends format differently (`1e-7` for `1e-07`, `null` for NaN).
+
+name = "json"
+
+
+def _json_dumps(obj: Any) -> str:
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False)
+
+
+def _has_float(obj: Any) -> bool:
+    if isinstance(obj, float):
+        return True
+    if isinstance(obj, dict):
+        return any(_has_float(value) for value in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return any(_has_float(value) for value in obj)
+
+    return False
+
+
+def _msgspec() -> Backend:
+    import msgspec
+
+    encode = msgspec.json.Encoder().encode
+    decode = msgspec.json.Decoder().decode
+
+    def dumps(obj: Any) -> str:
+        if _has_float(obj):
+            return _json_dumps(obj)
+        try:
+            return encode(obj).decode()
+        except (TypeError, ValueError, OverflowError):
+            return _json_dumps(obj)
+
+    def loads(s: Any) -> Any:
+        try:
+            return decode(s)
+        except msgspec.DecodeError:
+            # NOTE: Raises `json.JSONDecodeError` for invalid JSON, and
+            # accepts what only the standard library does, such as NaN.
+            return json.loads(s)
+
+    return dumps, loads
+
+
+def _orjson() -> Backend:
+    import orjson
+
+    def dumps(obj: Any) -> str:
+        if _has_float(obj):
+            return _json_dumps(obj)
+        try:
+            return orjson.dumps(obj).decode()
+        except TypeError:
+            return _json_dumps(obj)
+
+    def loads(s: Any) -> Any:
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            return json.loads(s)
+
+    return dumps, loads
+
+
+_backends: Dict[str, Callable[[], Backend]] = {
+    "msgspec": _msgspec,
+    "orjson": _orjson,
+    "json": lambda: (_json_dumps, json.loads),
+}
+
+_PROBE = {
+    "id": 2**53,
+    "is_bot": False,
+    "first_name": 'x/"\\\n\t\x00\x1f\x7f é 東 😀  ',
+    "last_name": None,
+    "allows_write_to_pm": True,
+    "extra": [1.5, 1e-07, 1e16, -0.0, float("nan"), float("inf")],
+}
+
+dumps: Callable[[Any], str] = _json_dumps
+loads: Callable[[Any], Any] = json.loads
+
+
+def _verify(backend: Backend) -> bool:
+    backend_dumps, backend_loads = backend
+    expected = _json_dumps(_PROBE)
+
+    # NOTE: NaN never equals itself, so decoding is compared by serializing.
+    return (
+        backend_dumps(_PROBE) == expected
+        and _json_dumps(backend_loads(expected)) == expected
+    )
+
+
+def set_backend(backend: Optional[str] = None) -> str:
+    """Select the JSON backend, returning the name of the one in use.
+
+    Parameters:
+        backend (`str`, optional):
+            Either "msgspec", "orjson" or "json". If not provided, the first installed backend in that order is used.
+
+    Raises:
+        `ImportError`: In case the requested backend is not installed.
+        `ValueError`: In case the requested backend is unknown or does not serialize like the standard library.
+    """
+    global dumps, loads, name
+
+    if backend is None:
+        for candidate in _backends:
+            try:
+                return set_backend(candidate)
+            except (ImportError, ValueError):
+                continue
+
+    if backend not in _backends:
+        raise ValueError(f"unknown JSON backend: {backend!r}")
+
+    functions = _backends[backend]()
+    if not _verify(functions):
+        raise ValueError(f"JSON backend {backend!r} is not compatible.")
+
+    dumps, loads = functions
+    name = backend
+
+    return name
+
+
+set_backend()
@@ -0,0 +1,224 @@
+"""Authenticate web requests by the init data in their `Authorization` header.
+
+Mini Apps send the init data as `Authorization: tma <initData>`. The middleware validates it before the wrapped application runs, and answers with `401 Unauthorized` or `403 Forbidden` instead when it is missing or invalid.
+"""
+
+from typing import Any, Callable, Collection, Iterable, List, Optional, Tuple
+
+from init_data_py import errors
+from init_data_py.cache import ValidationCache
+from init_data_py.concurrency import ConcurrentValidator
+from init_data_py.init_data import InitData
+
+_MISSING = "authorization header with the tma scheme is missing."
+
+# NOTE: Forged credentials are forbidden, everything else asks the client to
+# authenticate (again), e.g. with fresh init data once it has expired.
+_FORBIDDEN = (errors.SignInvalidError, errors.ReplayedError)
+
+
+def _credentials(value: Optional[bytes]) -> Optional[bytes]:
+    """Returns the init data of a `tma` Authorization header value."""
+    if value is None:
+        return None
+
+    scheme, _, credentials = value.strip().partition(b" ")
+    if scheme.lower() != b"tma" or not credentials:
+        return None
+
+    return credentials.lstrip()
+
+
+def _rejection(error: Optional[errors.InitDataPyError]) -> Tuple[int, bytes]:
+    """Returns the status code and body of the response to a rejection."""
+    if error is None:
+        return 401, _MISSING.encode()
+
+    status = 403 if isinstance(error, _FORBIDDEN) else 401
+
+    return status, str(error).encode()
+
+
+class _Authenticator:
+    def __init__(
+        self,
+        authenticate: Callable[[bytes], InitData],
+        exclude_paths: Collection[str],
+    ) -> None:
+        self.authenticate = authenticate
+        self.exclude_paths = frozenset(exclude_paths)
+
+
+class ASGIMiddleware(_Authenticator):
+    """ASGI middleware authenticating HTTP requests by their init data.
+
+    The validated `InitData` is stored in the request state, e.g. `request.state.init_data` in Starlette and FastAPI. It is parsed lazily, and shared between requests with the same init data, so it should be treated as read-only.
+
+    Lifespan and WebSocket connections are passed through unauthenticated.
+
+    Parameters:
+        app (ASGI application):
+            The application to wrap.
+
+        bot_token (`str`):
+            The token associated with the bot, used to either launch the webapp or sign the init data.
+
+        lifetime (`int`, optional):
+            The maximum validity period of the init data in seconds.
+            Recommended for security. Default is `None`.
+
+        cache_size (`int`, optional):
+            Maximum number of validated init data remembered by the worker.
+
+        exclude_paths (`Collection[str]`, optional):
+            Paths served without authentication, e.g. health checks.
+    """
+
+    def __init__(
+        self,
+        app: Callable[..., Any],
+        bot_token: str,
+        lifetime: Optional[int] = None,
+        cache_size: int = 10_000,
+        exclude_paths: Collection[str] = (),
+    ) -> None:
+        # NOTE: One cache, and so one precomputed secret key, per worker.
+        # Clients send the same init data on every request of a session,
+        # which is then answered without hashing it again.
+        cache = ValidationCache(bot_token, lifetime, cache_size)
+        super().__init__(cache.validate, exclude_paths)
+        self.app = app
+
+    async def __call__(
+        self,
+        scope: dict,
+        receive: Callable[..., Any],
+        send: Callable[..., Any],
+    ) -> None:
+        if scope["type"] != "http" or scope["path"] in self.exclude_paths:
+            return await self.app(scope, receive, send)
+
+        value = None
+        for name, header in scope["headers"]:
+            if name == b"authorization":
+                value = header
+                break
+
+        credentials = _credentials(value)
+        if credentials is None:
+            return await self._reject(send, None)
+
+        try:
+            init_data = self.authenticate(credentials)
+        except errors.InitDataPyError as e:
+            return await self._reject(send, e)
+
+        scope = dict(scope)
+        scope["state"] = {**scope.get("state", {}), "init_data": init_data}
+
+        await self.app(scope, receive, send)
+
+    @staticmethod
+    async def _reject(
+        send: Callable[..., Any],
+        error: Optional[errors.InitDataPyError],
+    ) -> None:
+        status, body = _rejection(error)
+        headers = [
+            (b"content-type", b"text/plain; charset=utf-8"),
+            (b"content-length", str(len(body)).encode()),
+        ]
+        if status == 401:
+            headers.append((b"www-authenticate", b"tma"))
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": headers,
+            }
+        )
+        await send({"type": "http.response.body", "body": body})
+
+
+class WSGIMiddleware(_Authenticator):
+    """WSGI middleware authenticating requests by their init data.
+
+    The validated init data is stored in the environ as `"init_data_py.init_data"`. It is a `FrozenInitData` shared between requests with the same init data, see `concurrency.ConcurrentValidator`, so requests can be served from any number of threads without a global lock.
+
+    Parameters:
+        app (WSGI application):
+            The application to wrap.
+
+        bot_token (`str`):
+            The token associated with the bot, used to either launch the webapp or sign the init data.
+
+        lifetime (`int`, optional):
+            The maximum validity period of the init data in seconds.
+            Recommended for security. Default is `None`.
+
+        cache_size (`int`, optional):
+            Maximum number of validated init data remembered by the worker.
+
+        exclude_paths (`Collection[str]`, optional):
+            Paths served without authentication, e.g. health checks.
+    """
+
+    environ_key = "init_data_py.init_data"
+
+    def __init__(
+        self,
+        app: Callable[..., Iterable[bytes]],
+        bot_token: str,
+        lifetime: Optional[int] = None,
+        cache_size: int = 10_000,
+        exclude_paths: Collection[str] = (),
+    ) -> None:
+        # NOTE: Threaded servers share the middleware between threads, so
+        # the validator keeps its HMAC states per thread and shards its cache.
+        validator = ConcurrentValidator(bot_token, lifetime, cache_size)
+        super().__init__(validator.authenticate, exclude_paths)
+        self.app = app
+
+    def __call__(
+        self,
+        environ: dict,
+        start_response: Callable[..., Any],
+    ) -> Iterable[bytes]:
+        if environ.get("PATH_INFO", "") in self.exclude_paths:
+            return self.app(environ, start_response)
+
+        value = environ.get("HTTP_AUTHORIZATION")
+        # NOTE: WSGI decodes header values as latin-1, which round-trips.
+        credentials = _credentials(
+            value.encode("latin-1") if value is not None else None
+        )
+        if credentials is None:
+            return self._reject(start_response, None)
+
+        try:
+            init_data = self.authenticate(credentials)
+        except errors.InitDataPyError as e:
+            return self._reject(start_response, e)
+
+        environ[self.environ_key] = init_data
+
+        return self.app(environ, start_response)
+
+    @staticmethod
+    def _reject(
+        start_response: Callable[..., Any],
+        error: Optional[errors.InitDataPyError],
+    ) -> List[bytes]:
+        status, body = _rejection(error)
+        headers = [
+            ("Content-Type", "text/plain; charset=utf-8"),
+            ("Content-Length", str(len(body))),
+        ]
+        if status == 401:
+            headers.append(("WWW-Authenticate", "tma"))
+
+        reason = "Unauthorized" if status == 401 else "Forbidden"
+        start_response(f"{status} {reason}", headers)
+
+        return [body]
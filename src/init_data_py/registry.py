@@ -0,0 +1,207 @@
+import hmac
+from typing import (
+    TYPE_CHECKING,
+    Dict,
+    Hashable,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from init_data_py import errors, instrumentation
+from init_data_py._query import BytesLike, decode_pairs
+from init_data_py.validator import Validator
+
+if TYPE_CHECKING:
+    from init_data_py.init_data import InitData
+
+
+class ValidatorRegistry:
+    """Validate init data that may belong to any of many bots.
+
+    Init data does not tell which bot it was issued for, so every candidate bot has to be tried. The data-check string is built only once and checked against the precomputed secret key of each bot, starting with the bots that matched most often recently, so the usual cost stays close to a single HMAC regardless of the number of bots.
+
+    Parameters:
+        bot_tokens (`Mapping[Hashable, str]` | `Iterable[str]`):
+            The bot tokens, either by a key of your choice, or as an iterable in which case each bot is keyed by its bot id (the part of the token before the colon).
+
+        decay_interval (`int`, optional):
+            Number of matches after which the hit counts are halved, so the order follows recent traffic.
+    """
+
+    def __init__(
+        self,
+        bot_tokens: Union[Mapping[Hashable, str], Iterable[str]] = (),
+        decay_interval: int = 1024,
+    ) -> None:
+        self.decay_interval = decay_interval
+        self._validators: Dict[Hashable, Validator] = {}
+        self._hits: Dict[Hashable, int] = {}
+        self._order: List[Hashable] = []
+        self._matches = 0
+
+        if isinstance(bot_tokens, Mapping):
+            for key, bot_token in bot_tokens.items():
+                self.add(bot_token, key)
+        else:
+            for bot_token in bot_tokens:
+                self.add(bot_token)
+
+    def add(self, bot_token: str, key: Optional[Hashable] = None) -> Hashable:
+        """Add a bot, returning its key.
+
+        Parameters:
+            bot_token (`str`):
+                The token of the bot.
+
+            key (`Hashable`, optional):
+                The key reported when init data matches this bot. Defaults to the bot id.
+        """
+        if key is None:
+            key = bot_token.split(":", 1)[0]
+
+        if key not in self._validators:
+            self._order.append(key)
+            self._hits[key] = 0
+        self._validators[key] = Validator(bot_token)
+
+        return key
+
+    def remove(self, key: Hashable) -> None:
+        """Remove a bot by its key."""
+        del self._validators[key]
+        del self._hits[key]
+        self._order.remove(key)
+
+    def validate(
+        self,
+        init_data: "InitData",
+        lifetime: Optional[int] = None,
+        hint: Optional[Hashable] = None,
+    ) -> Hashable:
+        """Validates the init data against every bot, returning the key of the bot it belongs to.
+
+        Parameters:
+            init_data (`InitData`):
+                The init data to validate.
+
+            lifetime (`int`, optional):
+                The maximum validity period of the init data in seconds.
+                Recommended for security. Default is `None`.
+
+            hint (`Hashable`, optional):
+                The key of the bot to try first, for example taken from the request route.
+
+        Returns:
+            `Hashable`:
+                The key of the matching bot.
+
+        Raises:
+            `errors.SignMissingError`: In case the signature (hash) is missing.
+            `errors.AuthDateMissingError`: In case the auth_date is missing.
+            `errors.ExpiredError`: In case the init data has expired based on the provided lifetime.
+            `errors.SignInvalidError`: In case the signature (hash) matches no bot.
+        """
+        try:
+            error = Validator._check(
+                init_data.hash, init_data.auth_date, lifetime
+            )
+            if error is not None:
+                raise error()
+
+            return self._match(
+                init_data.hash.encode(),  # type: ignore
+                init_data._data_check_string(),
+                hint,
+            )
+        except errors.InitDataPyError as e:
+            instrumentation.count_error(e)
+            raise
+
+    def validate_raw(
+        self,
+        query_string: Union[str, BytesLike],
+        lifetime: Optional[int] = None,
+        hint: Optional[Hashable] = None,
+    ) -> Tuple[Hashable, Dict[str, str]]:
+        """Validates a query string against every bot, see `Validator.validate_raw`.
+
+        Parameters:
+            query_string (`str` | `bytes` | `bytearray` | `memoryview`):
+                The query string from `window.WebApp.initData` to validate.
+
+            lifetime (`int`, optional):
+                The maximum validity period of the init data in seconds.
+                Recommended for security. Default is `None`.
+
+            hint (`Hashable`, optional):
+                The key of the bot to try first.
+
+        Returns:
+            `tuple`:
+                The key of the matching bot and the verified query string pairs.
+
+        Raises:
+            The errors raised by `Validator.validate_raw`.
+        """
+        try:
+            hash, data_check_string, parsed_qs = Validator._split_raw(
+                query_string, lifetime
+            )
+
+            return (
+                self._match(hash, data_check_string, hint),
+                decode_pairs(parsed_qs),
+            )
+        except errors.InitDataPyError as e:
+            instrumentation.count_error(e)
+            raise
+
+    def stats(self) -> Dict[Hashable, int]:
+        """Returns the recent hit counts of the bots, most frequent first."""
+        return {key: self._hits[key] for key in self._order}
+
+    def _match(
+        self,
+        hash: bytes,
+        data_check_string: bytes,
+        hint: Optional[Hashable],
+    ) -> Hashable:
+        if hint is not None:
+            validator = self._validators.get(hint)
+            if validator is not None and hmac.compare_digest(
+                hash, validator._hexdigest(data_check_string).encode()
+            ):
+                self._hit(hint)
+                return hint
+
+        for i, key in enumerate(self._order):
+            if key == hint:
+                continue
+            hexdigest = self._validators[key]._hexdigest(data_check_string)
+            if hmac.compare_digest(hash, hexdigest.encode()):
+                self._hit(key, i)
+                return key
+
+        raise errors.SignInvalidError()
+
+    def _hit(self, key: Hashable, index: Optional[int] = None) -> None:
+        hits = self._hits
+        hits[key] += 1
+
+        # NOTE: Keep the order sorted by hit count by moving the key towards
+        # the front past bots with fewer hits.
+        order = self._order
+        i = order.index(key) if index is None else index
+        while i > 0 and hits[order[i - 1]] < hits[key]:
+            order[i - 1], order[i] = order[i], order[i - 1]
+            i -= 1
+
+        self._matches += 1
+        if self._matches >= self.decay_interval:
+            self._matches = 0
+            for k in hits:
+                hits[k] //= 2
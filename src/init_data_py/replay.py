@@ -0,0 +1,199 @@
+import hashlib
+import multiprocessing
+import struct
+import sys
+import threading
+import time
+from collections import OrderedDict
+from multiprocessing import shared_memory
+from typing import TYPE_CHECKING, Any, Optional, Union
+
+from init_data_py import errors
+
+if TYPE_CHECKING:
+    from init_data_py.init_data import InitData
+
+
+class MemoryStorage:
+    """Keep seen keys in the memory of the current process.
+
+    Keys are kept in insertion order, so expired keys are dropped from the front, and the oldest key is evicted once `max_size` is reached. Adding a key takes a lock, so the storage can be shared by threads.
+
+    Parameters:
+        max_size (`int`, optional):
+            Maximum number of keys kept at a time.
+    """
+
+    def __init__(self, max_size: int = 100_000) -> None:
+        self.max_size = max_size
+        self._expires: "OrderedDict[bytes, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, key: bytes, expires_at: float, now: float) -> bool:
+        """Add a key, returning False if it is already present and unexpired."""
+        expires = self._expires
+        with self._lock:
+            if expires.get(key, 0.0) > now:
+                return False
+
+            expires[key] = expires_at
+            expires.move_to_end(key)
+
+            while expires:
+                oldest = next(iter(expires))
+                if expires[oldest] > now and len(expires) <= self.max_size:
+                    break
+                del expires[oldest]
+
+        return True
+
+    def __len__(self) -> int:
+        return len(self._expires)
+
+
+class SharedMemoryStorage:
+    """Keep seen keys in a fixed-size hash table in shared memory.
+
+    The table can be attached to from other processes by `name`, or by passing the storage object to a worker process when it is started. Each key may only land in a short window of slots, and when the window is full the key expiring first is evicted, so memory use is fixed at `capacity` slots.
+
+    Parameters:
+        capacity (`int`, optional):
+            Number of slots in the table.
+
+        name (`str`, optional):
+            Name of an existing shared memory block to attach to. If not provided, a new block is created. `ValueError` is raised if the block is too small for `capacity`.
+
+        lock (`multiprocessing.Lock`, optional):
+            Lock shared by all processes using the table. Required when attaching by `name`, otherwise `ValueError` is raised.
+    """
+
+    _slot = struct.Struct("16sd")
+    _window = 8
+
+    def __init__(
+        self,
+        capacity: int = 65_536,
+        name: Optional[str] = None,
+        lock: Optional[Any] = None,
+    ) -> None:
+        if name is not None and lock is None:
+            raise ValueError(
+                "a lock is required when attaching to a shared memory block."
+            )
+
+        self.capacity = capacity
+        self.lock = lock if lock is not None else multiprocessing.Lock()
+        size = capacity * self._slot.size
+
+        # NOTE: New shared memory blocks are zero-filled, which marks every
+        # slot as expired.
+        if name is None:
+            self._shm = shared_memory.SharedMemory(create=True, size=size)
+        elif sys.version_info >= (3, 13):
+            self._shm = shared_memory.SharedMemory(name, track=False)
+        else:
+            self._shm = shared_memory.SharedMemory(name)
+
+        # NOTE: Blocks are rounded up to whole pages, so only a smaller block
+        # than the capacity needs is a mismatch.
+        if self._shm.size < size:
+            self._shm.close()
+            raise ValueError(
+                f"shared memory block {name!r} is too small for a capacity "
+                f"of {capacity}."
+            )
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def add(self, key: bytes, expires_at: float, now: float) -> bool:
+        """Add a key, returning False if it is already present and unexpired."""
+        buf = self._shm.buf
+        slot = self._slot
+        start = int.from_bytes(key[:8], "little")
+        target = None
+        target_expires = float("inf")
+
+        with self.lock:
+            for i in range(self._window):
+                offset = (start + i) % self.capacity * slot.size
+                slot_key, slot_expires = slot.unpack_from(buf, offset)
+                if slot_expires > now and slot_key == key:
+                    return False
+                if slot_expires < target_expires:
+                    target, target_expires = offset, slot_expires
+
+            slot.pack_into(buf, target, key, expires_at)
+
+        return True
+
+    def close(self) -> None:
+        """Detach from the shared memory block."""
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Destroy the shared memory block. Call once, from its creator."""
+        self._shm.unlink()
+
+    def __reduce__(self):
+        return type(self), (self.capacity, self.name, self.lock)
+
+
+class ReplayGuard:
+    """Reject init data that has already been used within its lifetime.
+
+    Every init data is remembered by its `hash` (or `query_id`) until `auth_date + lifetime`. Only validated init data should be passed in, as anyone can otherwise fill the storage with made-up keys.
+
+    Parameters:
+        lifetime (`int`):
+            The maximum validity period of the init data in seconds, as passed to `validate`.
+
+        storage (`MemoryStorage` | `SharedMemoryStorage`, optional):
+            Where seen keys are kept. Defaults to a new `MemoryStorage`.
+
+        key (`str`, optional):
+            The init data attribute identifying it, either "hash" or "query_id".
+    """
+
+    def __init__(
+        self,
+        lifetime: int,
+        storage: Optional[Union[MemoryStorage, SharedMemoryStorage]] = None,
+        key: str = "hash",
+    ) -> None:
+        self.lifetime = lifetime
+        self.storage = storage if storage is not None else MemoryStorage()
+        self.key = key
+
+    def check(self, init_data: "InitData", raise_error: bool = True):
+        """Check that the init data is used for the first time, and remember it.
+
+        Parameters:
+            init_data (`InitData`):
+                The validated init data.
+
+            raise_error (`bool`, optional):
+                In case True, raises an exception on replayed data, If False, returns False instead of raising an error.
+
+        Returns:
+            `bool`:
+                True if the init data has not been used before; otherwise, returns False.
+
+        Raises:
+            `errors.UnexpectedFormatError`: In case the key attribute or auth_date is missing.
+            `errors.ReplayedError`: In case the init data has already been used.
+        """
+        value = getattr(init_data, self.key)
+        if value is None or init_data.auth_date is None:
+            raise errors.UnexpectedFormatError()
+
+        key = hashlib.blake2b(value.encode(), digest_size=16).digest()
+        expires_at = init_data.auth_date + self.lifetime
+
+        if not self.storage.add(key, expires_at, time.time()):
+            if raise_error:
+                raise errors.ReplayedError()
+            return False
+
+        return True
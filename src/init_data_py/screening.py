@@ -0,0 +1,86 @@
+import time
+from typing import Optional, Union
+
+from init_data_py import errors
+from init_data_py._query import BytesLike
+
+
+class Prescreen:
+    """Reject malformed, oversized or expired query strings before parsing them.
+
+    The checks only split the raw query string into its few fields, without unquoting or hashing it, so rejecting hostile input costs little more than reading it. Query strings with a repeated `hash` or `auth_date`, or with escaped field names, are rejected, as Telegram never sends them and parsing could otherwise see different values than the checks.
+
+    Parameters:
+        max_length (`int`, optional):
+            Maximum length of the query string.
+
+        max_fields (`int`, optional):
+            Maximum number of `&`-separated fields.
+
+        lifetime (`int`, optional):
+            The maximum validity period of the init data in seconds. If provided, expired init data is rejected.
+    """
+
+    def __init__(
+        self,
+        max_length: int = 8192,
+        max_fields: int = 16,
+        lifetime: Optional[int] = None,
+    ) -> None:
+        self.max_length = max_length
+        self.max_fields = max_fields
+        self.lifetime = lifetime
+
+    def check(self, query_string: Union[str, BytesLike]) -> None:
+        """Check a query string, raising an error if it should be rejected.
+
+        Parameters:
+            query_string (`str` | `bytes` | `bytearray` | `memoryview`):
+                The query string from `window.WebApp.initData` to check.
+
+        Raises:
+            `errors.UnexpectedFormatError`: In case the query string is too long, has too many fields, escaped field names, a repeated hash or auth_date, or a non-numeric auth_date.
+            `errors.SignMissingError`: In case the signature (hash) is missing.
+            `errors.AuthDateMissingError`: In case the auth_date is missing.
+            `errors.ExpiredError`: In case the init data has expired based on the lifetime.
+        """
+        if len(query_string) > self.max_length:
+            raise errors.UnexpectedFormatError()
+
+        if isinstance(query_string, memoryview):
+            query_string = query_string.tobytes()
+
+        if isinstance(query_string, str):
+            sep, eq, escape, names = "&", "=", "%", ("hash", "auth_date")
+        else:
+            sep, eq, escape, names = b"&", b"=", b"%", (b"hash", b"auth_date")
+
+        if query_string.count(sep) >= self.max_fields:  # type: ignore
+            raise errors.UnexpectedFormatError()
+
+        # NOTE: Parsing keeps the last of repeated keys and unquotes keys, so
+        # a repeated or escaped `hash` or `auth_date` could make the value
+        # checked here differ from the one validated later.
+        values = {}
+        for field in query_string.split(sep):  # type: ignore
+            key, _, value = field.partition(eq)
+            if escape in key or (key in names and key in values):
+                raise errors.UnexpectedFormatError()
+            values[key] = value
+
+        hash, auth_date = names
+        if hash not in values:
+            raise errors.SignMissingError()
+
+        value = values.get(auth_date)
+        if value is None:
+            raise errors.AuthDateMissingError()
+
+        if not (value.isascii() and value.isdigit()) or len(value) > 12:
+            raise errors.UnexpectedFormatError()
+
+        if (
+            self.lifetime is not None
+            and time.time() > int(value) + self.lifetime
+        ):
+            raise errors.ExpiredError()
@@ -0,0 +1,275 @@
+import base64
+import binascii
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from init_data_py import errors, instrumentation
+from init_data_py._query import BytesLike, decode_pairs
+from init_data_py.bulk import ValidationResult, _validate_many
+from init_data_py.validator import Validator
+
+if TYPE_CHECKING:
+    import concurrent.futures
+
+    from init_data_py.init_data import InitData
+
+# NOTE: Telegram's Ed25519 public keys, see
+# https://core.telegram.org/bots/webapps#validating-data-for-third-party-use
+PUBLIC_KEYS = {
+    "production": bytes.fromhex(
+        "e7bf03a2fa4602af4580703d88dda5bb59f32ed8b02a56c187fe7d34caed242d"
+    ),
+    "test": bytes.fromhex(
+        "40055058a4ee38156a06562e52eece92a771bcd8346a8c4615cb7376eddf72ec"
+    ),
+}
+
+# NOTE: Decoded key objects by raw public key, shared by all validators of
+# the process.
+_public_keys: Dict[bytes, Any] = {}
+
+
+def _cryptography() -> Tuple[Any, Any]:
+    try:
+        from cryptography.exceptions import InvalidSignature
+        from cryptography.hazmat.primitives.asymmetric.ed25519 import (
+            Ed25519PublicKey,
+        )
+    except ImportError:
+        raise ImportError(
+            "cryptography is required for third-party validation, install "
+            "it with `pip install init-data-py[cryptography]`."
+        ) from None
+
+    return Ed25519PublicKey, InvalidSignature
+
+
+def _load_public_key(raw: bytes) -> Any:
+    key = _public_keys.get(raw)
+    if key is None:
+        Ed25519PublicKey, _ = _cryptography()
+        key = _public_keys[raw] = Ed25519PublicKey.from_public_bytes(raw)
+
+    return key
+
+
+def _decode_signature(signature: Union[str, bytes]) -> bytes:
+    """Decode an unpadded base64url signature."""
+    if isinstance(signature, str):
+        signature = signature.encode()
+
+    try:
+        return base64.urlsafe_b64decode(
+            signature + b"=" * (-len(signature) % 4)
+        )
+    except (binascii.Error, ValueError):
+        raise errors.SignInvalidError()
+
+
+class ThirdPartyValidator:
+    """Validate the `signature` of init data without the bot token.
+
+    Telegram signs the init data with its Ed25519 key as well, so services that only know the bot id can check it. The public key object is decoded once per process, and the `bot_id:WebAppData` prefix of the data-check string is built once per validator.
+
+    Requires the `cryptography` package.
+
+    Parameters:
+        bot_id (`int`):
+            The id of the bot the init data was issued for, the part of its token before the colon.
+
+        test (`bool`, optional):
+            If True, the public key of the test environment is used.
+
+        public_key (`bytes`, optional):
+            A raw Ed25519 public key to use instead of Telegram's.
+    """
+
+    def __init__(
+        self,
+        bot_id: int,
+        test: bool = False,
+        public_key: Optional[bytes] = None,
+    ) -> None:
+        self.bot_id = bot_id
+        self.test = test
+        if public_key is None:
+            public_key = PUBLIC_KEYS["test" if test else "production"]
+        self.public_key = public_key
+        self._key = _load_public_key(public_key)
+        self._invalid_signature = _cryptography()[1]
+        self._prefix = f"{bot_id}:WebAppData\n".encode()
+
+    def validate(
+        self,
+        init_data: "InitData",
+        lifetime: Optional[int] = None,
+        raise_error: bool = True,
+    ):
+        """Validates the init data signature.
+
+        Parameters:
+            init_data (`InitData`):
+                The init data to validate.
+
+            lifetime (`int`, optional):
+                The maximum validity period of the init data in seconds.
+                Recommended for security. Default is `None`.
+
+            raise_error (`bool`, optional):
+                In case True, raises an exception on invalid data, If False, returns False instead of raising an error.
+
+        Returns:
+            `bool`:
+                True if the data is valid; otherwise, returns False.
+
+        Raises:
+            `errors.SignMissingError`: In case the signature is missing.
+            `errors.AuthDateMissingError`: In case the auth_date is missing.
+            `errors.ExpiredError`: In case the init data has expired based on the provided lifetime.
+            `errors.SignInvalidError`: In case the signature is invalid.
+        """
+        try:
+            error = Validator._check(
+                init_data.signature, init_data.auth_date, lifetime
+            )
+            if error is not None:
+                raise error()
+
+            pairs = init_data.to_dict(nested=False)
+            pairs.pop("hash", None)
+            pairs.pop("signature", None)
+            data_check_string = "\n".join(
+                f"{k}={v}" for k, v in sorted(pairs.items())
+            ).encode()
+
+            self._verify(init_data.signature, data_check_string)  # type: ignore
+        except errors.InitDataPyError as e:
+            instrumentation.count_error(e)
+            if raise_error:
+                raise
+            return False
+
+        return True
+
+    def validate_raw(
+        self,
+        query_string: Union[str, BytesLike],
+        lifetime: Optional[int] = None,
+    ) -> Dict[str, str]:
+        """Validates the signature of a query string without building an `InitData` object, see `Validator.validate_raw`.
+
+        Parameters:
+            query_string (`str` | `bytes` | `bytearray` | `memoryview`):
+                The query string from `window.WebApp.initData` to validate.
+
+            lifetime (`int`, optional):
+                The maximum validity period of the init data in seconds.
+                Recommended for security. Default is `None`.
+
+        Returns:
+            `dict`:
+                The verified query string pairs.
+
+        Raises:
+            `errors.UnexpectedFormatError`: In case the the format of the query string is unexpected.
+            `errors.SignMissingError`: In case the signature is missing.
+            `errors.AuthDateMissingError`: In case the auth_date is missing.
+            `errors.ExpiredError`: In case the init data has expired based on the provided lifetime.
+            `errors.SignInvalidError`: In case the signature is invalid.
+        """
+        try:
+            signature, data_check_string, parsed_qs = Validator._split_raw(
+                query_string,
+                lifetime,
+                sign_key=b"signature",
+                exclude=(b"hash", b"signature"),
+            )
+            self._verify(signature, data_check_string)
+
+            return decode_pairs(parsed_qs)
+        except errors.InitDataPyError as e:
+            instrumentation.count_error(e)
+            raise
+
+    def _verify(
+        self,
+        signature: Union[str, bytes],
+        data_check_string: bytes,
+    ) -> None:
+        try:
+            self._key.verify(
+                _decode_signature(signature), self._prefix + data_check_string
+            )
+        except self._invalid_signature:
+            raise errors.SignInvalidError()
+
+    def __reduce__(self) -> Tuple[Any, Tuple[Any, ...]]:
+        return type(self), (self.bot_id, self.test, self.public_key)
+
+
+def validate_many(
+    query_strings: Iterable[str],
+    bot_id: int,
+    lifetime: Optional[int] = None,
+    executor: Optional["concurrent.futures.Executor"] = None,
+    ordered: bool = True,
+    chunksize: int = 256,
+    prefetch: int = 16,
+    test: bool = False,
+    public_key: Optional[bytes] = None,
+) -> Iterator[ValidationResult]:
+    """Validate the signatures of many query strings, see `init_data_py.validate_many`.
+
+    Ed25519 verification costs more than an HMAC, so pass a process pool as `executor` to spread large batches across cores. Every worker decodes the public key once.
+
+    Parameters:
+        query_strings (`Iterable[str]`):
+            The query strings from `window.WebApp.initData` to validate.
+
+        bot_id (`int`):
+            The id of the bot the init data was issued for.
+
+        lifetime (`int`, optional):
+            The maximum validity period of the init data in seconds.
+            Recommended for security. Default is `None`.
+
+        executor (`concurrent.futures.Executor`, optional):
+            A thread or process pool to dispatch chunks to. If not provided, query strings are validated in the calling thread.
+
+        ordered (`bool`, optional):
+            If True, results are yielded in input order; otherwise, chunks are yielded as they complete.
+
+        chunksize (`int`, optional):
+            Number of query strings sent to the executor in a single task.
+
+        prefetch (`int`, optional):
+            Maximum number of chunks submitted to the executor at a time.
+
+        test (`bool`, optional):
+            If True, the public key of the test environment is used.
+
+        public_key (`bytes`, optional):
+            A raw Ed25519 public key to use instead of Telegram's.
+
+    Returns:
+        `Iterator[ValidationResult]`:
+            One result per query string.
+    """
+    return _validate_many(
+        query_strings,
+        ThirdPartyValidator,
+        (bot_id, test, public_key),
+        lifetime,
+        executor,
+        ordered,
+        chunksize,
+        prefetch,
+    )
@@ -24,6 +24,11 @@ class Chat(Object):
             URL of the chat's photo. The photo can be in .jpeg or .svg formats. Only returned for Mini Apps launched from the attachment menu.
     """
 
+    # NOTE: The order of the attributes is important.
+    _fields = ("id", "type", "title", "username", "photo_url")
+    _required = ("id", "type", "title")
+    __slots__ = _fields
+
     def __init__(
         self,
         *,
@@ -38,4 +43,4 @@ class Chat(Object):
         self.title = title
         self.username = username
         self.photo_url = photo_url
-        # NOTE: The order of the attributes is important.
+        self.extra = None
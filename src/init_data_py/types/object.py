@@ -1,21 +1,79 @@
 import json
+from typing import Any, Callable, Dict, FrozenSet, Optional, Tuple
+
+from init_data_py import interning, json_backend
 
 
 class Object:
+    __slots__ = ("extra",)
+    extra: Optional[Dict[str, Any]]
+
+    # NOTE: The order of the attributes is important.
+    _fields: Tuple[str, ...] = ()
+    _required: Tuple[str, ...] = ()
+
+    _setters: Dict[str, Callable[[Any, Any], None]] = {}
+    _field_set: FrozenSet[str] = frozenset()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        # NOTE: Compiled once per class, so decoding dispatches on the slot
+        # descriptors instead of splatting keyword arguments into __init__.
+        cls._setters = {
+            name: getattr(cls, name).__set__ for name in cls._fields
+        }
+        cls._field_set = frozenset(cls._fields)
+
     def to_json(self):
         """Returns a JSON serialized representation of the object."""
-        return json.dumps(
-            self.to_dict(), separators=(",", ":"), ensure_ascii=False
-        )
+        return json_backend.dumps(self.to_dict())
 
     def to_dict(self):
         """Returns a dictionary representation of the object."""
-        return {k: v for k, v in self.__dict__.items() if v is not None}
+        obj = {
+            k: v for k in self._fields if (v := getattr(self, k)) is not None
+        }
+        if self.extra:
+            obj.update(self.extra)
+
+        return obj
 
     @classmethod
     def from_json(cls, json_string):
-        """Create an object from JSON serialized string."""
-        return cls(**json.loads(json_string))
+        """Create an object from JSON serialized string.
+
+        Fields unknown to this version of the library are kept in `extra`, in the order they were received.
+
+        While an `interning.InternPool` is enabled, a shared, read-only object is returned for JSON decoded before.
+        """
+        pool = interning.active
+        if pool is not None:
+            return pool.get(cls, json_string)
+
+        return cls._from_dict(json_backend.loads(json_string))
+
+    @classmethod
+    def _from_dict(cls, data: Dict[str, Any]):
+        if not isinstance(data, dict):
+            raise TypeError(f"expected a JSON object, got {type(data)}.")
+
+        obj = cls.__new__(cls)
+        get = data.get
+        for name, set_ in cls._setters.items():
+            set_(obj, get(name))
+
+        for name in cls._required:
+            if name not in data:
+                raise TypeError(f"missing required field {name!r}.")
+
+        if data.keys() <= cls._field_set:
+            obj.extra = None
+        else:
+            obj.extra = {
+                k: v for k, v in data.items() if k not in cls._field_set
+            }
+
+        return obj
 
     def __str__(self) -> str:
         return json.dumps(self.to_dict(), indent=4)
@@ -24,7 +82,7 @@ class Object:
         if not isinstance(other, type(self)):
             return False
 
-        for attr in self.__dict__:
+        for attr in self._fields + ("extra",):
             try:
                 if getattr(self, attr) != getattr(other, attr):
                     return False
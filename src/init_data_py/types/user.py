@@ -38,6 +38,22 @@ class User(Object):
             URL of the user's profile photo. The photo can be in .jpeg or .svg formats. Only returned for Mini Apps launched from the attachment menu.
     """
 
+    # NOTE: The order of the attributes is important.
+    _fields = (
+        "id",
+        "is_bot",
+        "first_name",
+        "last_name",
+        "username",
+        "language_code",
+        "is_premium",
+        "added_to_attachment_menu",
+        "allows_write_to_pm",
+        "photo_url",
+    )
+    _required = ("id", "first_name")
+    __slots__ = _fields
+
     def __init__(
         self,
         *,
@@ -62,4 +78,4 @@ class User(Object):
         self.added_to_attachment_menu = added_to_attachment_menu
         self.allows_write_to_pm = allows_write_to_pm
         self.photo_url = photo_url
-        # NOTE: The order of the attributes is important.
+        self.extra = None
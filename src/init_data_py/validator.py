@@ -0,0 +1,348 @@
+import hashlib
+import hmac
+import time
+from typing import TYPE_CHECKING, Dict, Optional, Tuple, Type, Union
+
+from init_data_py import aio, errors, instrumentation
+from init_data_py._query import BytesLike, decode_pairs, parse_qsl_bytes
+
+if TYPE_CHECKING:
+    from init_data_py.init_data import InitData
+    from init_data_py.screening import Prescreen
+
+
+class Validator:
+    """Validate and sign init data on behalf of a single bot.
+
+    The secret key is derived from the bot token once, and a pre-keyed HMAC
+    state is copied for every call instead of being rebuilt from scratch.
+
+    Parameters:
+        bot_token (`str`):
+            The token associated with the bot, used to either launch the webapp or sign the init data.
+
+        prescreen (`screening.Prescreen`, optional):
+            Checks run on raw query strings by `validate_raw` before they are parsed.
+    """
+
+    def __init__(
+        self,
+        bot_token: str,
+        prescreen: Optional["Prescreen"] = None,
+    ) -> None:
+        self.prescreen = prescreen
+        self.secret_key = hmac.new(
+            b"WebAppData", bot_token.encode(), hashlib.sha256
+        ).digest()
+        self._hmac = hmac.new(self.secret_key, digestmod=hashlib.sha256)
+
+    def calculate_hash(self, init_data: "InitData") -> str:
+        """Calculates a hash of the given `InitData` object.
+
+        Parameters:
+            init_data (`InitData`):
+                The init data to calculate the hash for.
+
+        Returns:
+            `str`:
+                The calculated hash, derived from the init data attributes and the secret key.
+        """
+        instrument = instrumentation.active
+        if instrument is None:
+            # NOTE: The fields are fed to the HMAC one by one, so no copy of
+            # the whole data-check string is made.
+            mac = self._hmac.copy()
+            init_data._write_data_check_string(mac.update)
+
+            return mac.hexdigest()
+
+        # NOTE: Building the data-check string first keeps the serialize and
+        # hmac stages apart.
+
+        start = time.perf_counter()
+        data_check_string = init_data._data_check_string()
+        instrument.record("serialize", time.perf_counter() - start)
+
+        start = time.perf_counter()
+        hexdigest = self._hexdigest(data_check_string)
+        instrument.record("hmac", time.perf_counter() - start)
+
+        return hexdigest
+
+    def validate(
+        self,
+        init_data: "InitData",
+        lifetime: Optional[int] = None,
+        raise_error: bool = True,
+    ):
+        """Validates the init data authenticity.
+
+        Parameters:
+            init_data (`InitData`):
+                The init data to validate.
+
+            lifetime (`int`, optional):
+                The maximum validity period of the init data in seconds.
+                Recommended for security. Default is `None`.
+
+            raise_error (`bool`, optional):
+                In case True, raises an exception on invalid data, If False, returns False instead of raising an error.
+
+        Returns:
+            `bool`:
+                True if the data is valid; otherwise, returns False.
+
+        Raises:
+            `errors.SignMissingError`: In case the signature (hash) is missing.
+            `errors.AuthDateMissingError`: In case the auth_date is missing.
+            `errors.ExpiredError`: In case the init data has expired based on the provided lifetime.
+            `errors.SignInvalidError`: In case the signature (hash) is invalid.
+        """
+        error = self._check(init_data.hash, init_data.auth_date, lifetime)
+
+        if error is None and not self._matches(
+            init_data.hash, self.calculate_hash(init_data)
+        ):
+            error = errors.SignInvalidError
+
+        if error is not None:
+            instrument = instrumentation.active
+            if instrument is not None:
+                instrument.count_error(error.__name__)
+            if raise_error:
+                raise error()
+            return False
+
+        return True
+
+    async def avalidate(
+        self,
+        init_data: "InitData",
+        lifetime: Optional[int] = None,
+        raise_error: bool = True,
+        offloader: Optional[aio.Offloader] = None,
+    ):
+        """Asynchronous counterpart of `validate`.
+
+        The HMAC of data-check strings above the offloader threshold runs in its executor, where hashlib releases the GIL.
+
+        Parameters:
+            init_data (`InitData`):
+                The init data to validate.
+
+            lifetime (`int`, optional):
+                The maximum validity period of the init data in seconds.
+
+            raise_error (`bool`, optional):
+                In case True, raises an exception on invalid data, If False, returns False instead of raising an error.
+
+            offloader (`aio.Offloader`, optional):
+                Decides where the work runs. Defaults to `aio.default_offloader`.
+
+        Returns:
+            `bool`:
+                True if the data is valid; otherwise, returns False.
+        """
+        offloader = offloader or aio.default_offloader
+        error = self._check(init_data.hash, init_data.auth_date, lifetime)
+
+        if error is None:
+            data_check_string = init_data._data_check_string()
+            hexdigest = await offloader.run(
+                self._hexdigest,
+                data_check_string,
+                size=len(data_check_string),
+            )
+            if not self._matches(init_data.hash, hexdigest):
+                error = errors.SignInvalidError
+
+        if error is not None:
+            instrument = instrumentation.active
+            if instrument is not None:
+                instrument.count_error(error.__name__)
+            if raise_error:
+                raise error()
+            return False
+
+        return True
+
+    def sign(self, init_data: "InitData", auth_date: Optional[int] = None):
+        """Sign the init data.
+
+        Parameters:
+            init_data (`InitData`):
+                The init data to sign.
+
+            auth_date (`int`, optional):
+                The timestamp (without timezone) representing the authorization date. If not provided, the current timestamp will be used.
+
+        Returns:
+            `InitData`:
+                The given init data updated by setting the `auth_date` and generated signature (`hash`) attributes.
+        """
+        init_data.auth_date = (
+            auth_date if auth_date is not None else int(time.time())
+        )
+        init_data.hash = self.calculate_hash(init_data)
+
+        return init_data
+
+    def validate_raw(
+        self,
+        query_string: Union[str, BytesLike],
+        lifetime: Optional[int] = None,
+    ) -> Dict[str, str]:
+        """Validates a query string without building an `InitData` object.
+
+        The data-check string is built from the decoded query string pairs as they were received, so no JSON is decoded or re-serialized. `bytes`, `bytearray` and `memoryview` input is hashed without being decoded to `str` first.
+
+        Parameters:
+            query_string (`str` | `bytes` | `bytearray` | `memoryview`):
+                The query string from `window.WebApp.initData` to validate.
+
+            lifetime (`int`, optional):
+                The maximum validity period of the init data in seconds.
+                Recommended for security. Default is `None`.
+
+        Returns:
+            `dict`:
+                The verified query string pairs.
+
+        Raises:
+            `errors.UnexpectedFormatError`: In case the the format of the query string is unexpected.
+            `errors.SignMissingError`: In case the signature (hash) is missing.
+            `errors.AuthDateMissingError`: In case the auth_date is missing.
+            `errors.ExpiredError`: In case the init data has expired based on the provided lifetime.
+            `errors.SignInvalidError`: In case the signature (hash) is invalid.
+        """
+        try:
+            if self.prescreen is not None:
+                self.prescreen.check(query_string)
+
+            hash, data_check_string, parsed_qs = self._split_raw(
+                query_string, lifetime
+            )
+
+            instrument = instrumentation.active
+            if instrument is not None:
+                start = time.perf_counter()
+
+            hexdigest = self._hexdigest(data_check_string)
+
+            if instrument is not None:
+                instrument.record("hmac", time.perf_counter() - start)
+
+            if not hmac.compare_digest(hash, hexdigest.encode()):
+                raise errors.SignInvalidError()
+
+            return decode_pairs(parsed_qs)
+        except errors.InitDataPyError as e:
+            instrumentation.count_error(e)
+            raise
+
+    async def avalidate_raw(
+        self,
+        query_string: Union[str, BytesLike],
+        lifetime: Optional[int] = None,
+        offloader: Optional[aio.Offloader] = None,
+    ) -> Dict[str, str]:
+        """Asynchronous counterpart of `validate_raw`.
+
+        Query strings above the offloader threshold are validated in its executor.
+
+        Parameters:
+            query_string (`str` | `bytes` | `bytearray` | `memoryview`):
+                The query string from `window.WebApp.initData` to validate.
+
+            lifetime (`int`, optional):
+                The maximum validity period of the init data in seconds.
+
+            offloader (`aio.Offloader`, optional):
+                Decides where the work runs. Defaults to `aio.default_offloader`.
+
+        Returns:
+            `dict`:
+                The verified query string pairs.
+        """
+        offloader = offloader or aio.default_offloader
+
+        return await offloader.run(
+            self.validate_raw, query_string, lifetime, size=len(query_string)
+        )
+
+    @staticmethod
+    def _split_raw(
+        query_string: Union[str, BytesLike],
+        lifetime: Optional[int],
+        sign_key: bytes = b"hash",
+        exclude: Tuple[bytes, ...] = (b"hash",),
+    ) -> Tuple[bytes, bytes, Dict[bytes, bytes]]:
+        """Split a query string into its signature, data-check string and pairs.
+
+        The signature is the value of `sign_key`, and the keys in `exclude` are left out of the data-check string.
+        """
+        instrument = instrumentation.active
+        if instrument is not None:
+            start = time.perf_counter()
+
+        if isinstance(query_string, str):
+            query_string = query_string.encode()
+
+        parsed_qs = parse_qsl_bytes(query_string, keep_blank_values=True)
+
+        if instrument is not None:
+            instrument.record("parse_qsl", time.perf_counter() - start)
+
+        if not parsed_qs:
+            raise errors.UnexpectedFormatError()
+
+        sign = parsed_qs.get(sign_key)
+        auth_date = parsed_qs.get(b"auth_date")
+
+        if auth_date is not None:
+            try:
+                auth_date = int(auth_date)
+            except ValueError:
+                raise errors.UnexpectedFormatError()
+
+        error = Validator._check(sign, auth_date, lifetime)
+        if error is not None:
+            raise error()
+
+        data_check_string = b"\n".join(
+            [
+                b"%b=%b" % (k, v)
+                for k, v in sorted(parsed_qs.items())
+                if k not in exclude
+            ]
+        )
+
+        return sign, data_check_string, parsed_qs  # type: ignore
+
+    def _hexdigest(self, data_check_string: bytes) -> str:
+        mac = self._hmac.copy()
+        mac.update(data_check_string)
+
+        return mac.hexdigest()
+
+    @staticmethod
+    def _check(
+        hash: Optional[str],
+        auth_date: Optional[int],
+        lifetime: Optional[int],
+    ) -> Optional[Type[errors.InitDataPyError]]:
+        """Returns the error class for init data that fails before hashing."""
+        if hash is None:
+            return errors.SignMissingError
+
+        if auth_date is None:
+            return errors.AuthDateMissingError
+
+        if lifetime is not None and time.time() > auth_date + lifetime:
+            return errors.ExpiredError
+
+        return None
+
+    @staticmethod
+    def _matches(hash: str, hexdigest: str) -> bool:
+        return hmac.compare_digest(hash.encode(), hexdigest.encode())
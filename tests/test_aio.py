@@ -0,0 +1,116 @@
+import asyncio
+import concurrent.futures
+import unittest
+
+from init_data_py import InitData, Validator, aio, avalidate_many, errors
+
+
+class TestAsyncio(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.query_string = "query_id=AAF03wc0AgAAAHTfBzROOCVW&user=%7B%22id%22%3A5167898484%2C%22first_name%22%3A%22xin%22%2C%22last_name%22%3A%22%22%2C%22username%22%3A%22pvnimaxin%22%2C%22language_code%22%3A%22en%22%2C%22allows_write_to_pm%22%3Atrue%7D&auth_date=1722938610&hash=8654c8c617c143abf656f4f159be2539880a56f58c2d9be622f90c0346aa162b"
+        self.validator = Validator(
+            "7244657541:AAEgqk0HDC3WD5cdbnGMdd6L0TJ74FDp97Y"
+        )
+        self.executor = concurrent.futures.ThreadPoolExecutor(2)
+        # NOTE: A zero threshold forces every call through the executor.
+        self.offloader = aio.Offloader(
+            self.executor, threshold=0, concurrency=1
+        )
+
+    def tearDown(self) -> None:
+        self.executor.shutdown()
+
+    async def test_aparse(self):
+        for offloader in (None, self.offloader):
+            init_data = await InitData.aparse(self.query_string, offloader)
+            self.assertEqual(init_data, InitData.parse(self.query_string))
+
+        # NOTE: The offloader is the second positional parameter.
+        used = []
+
+        class Recorder(aio.Offloader):
+            async def run(self, func, *args, size):
+                used.append(self)
+                return await super().run(func, *args, size=size)
+
+        offloader = Recorder(self.executor, threshold=0)
+        init_data = await InitData.aparse(self.query_string, offloader)
+        self.assertEqual(used, [offloader])
+        self.assertIsNotNone(init_data._user)
+
+        init_data = await InitData.aparse(self.query_string, lazy=True)
+        self.assertIsNone(init_data._user)
+
+    async def test_avalidate(self):
+        init_data = InitData.parse(self.query_string)
+        for offloader in (None, self.offloader):
+            self.assertTrue(
+                await self.validator.avalidate(init_data, offloader=offloader)
+            )
+
+        init_data.hash = "invalid hash"
+        with self.assertRaises(errors.SignInvalidError):
+            await self.validator.avalidate(init_data, offloader=self.offloader)
+
+    async def test_avalidate_raw(self):
+        pairs = await self.validator.avalidate_raw(
+            self.query_string, offloader=self.offloader
+        )
+        self.assertEqual(pairs["auth_date"], "1722938610")
+
+    async def test_avalidate_many(self):
+        async def query_strings():
+            for i in range(20):
+                yield self.query_string if i % 2 else ""
+
+        results = [
+            result
+            async for result in avalidate_many(
+                query_strings(),
+                "7244657541:AAEgqk0HDC3WD5cdbnGMdd6L0TJ74FDp97Y",
+                offloader=self.offloader,
+                concurrency=4,
+            )
+        ]
+        self.assertEqual([r.index for r in results], list(range(20)))
+        self.assertEqual(
+            [r.valid for r in results], [bool(i % 2) for i in range(20)]
+        )
+
+    async def test_avalidate_many_bytes_offloaded(self):
+        sizes = []
+
+        class Recorder(aio.Offloader):
+            async def run(self, func, *args, size):
+                sizes.append(size)
+                return await super().run(func, *args, size=size)
+
+        query_string = self.query_string.encode()
+        items = [
+            query_string,
+            bytearray(query_string),
+            memoryview(query_string),
+        ]
+        results = [
+            result
+            async for result in avalidate_many(
+                items,
+                "7244657541:AAEgqk0HDC3WD5cdbnGMdd6L0TJ74FDp97Y",
+                offloader=Recorder(self.executor, threshold=0),
+            )
+        ]
+        self.assertTrue(all(result.valid for result in results))
+        self.assertEqual(sizes, [len(query_string)] * 3)
+
+
+class TestOffloader(unittest.TestCase):
+    def test_event_loops(self):
+        offloader = aio.Offloader(threshold=0, concurrency=1)
+
+        async def run() -> None:
+            calls = [offloader.run(sum, [1, 2], size=1) for _ in range(4)]
+            self.assertEqual(await asyncio.gather(*calls), [3] * 4)
+
+        for _ in range(3):
+            asyncio.run(run())
+        self.assertEqual(len(offloader._semaphores), 1)
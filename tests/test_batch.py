@@ -0,0 +1,129 @@
+import unittest
+
+from init_data_py import InitData, errors, types
+from init_data_py.batch import Column, InitDataBatch
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class TestInitDataBatch(unittest.TestCase):
+    def setUp(self) -> None:
+        self.bot_token = "7244657541:AAEgqk0HDC3WD5cdbnGMdd6L0TJ74FDp97Y"
+        self.query_strings = [
+            InitData(
+                query_id=f"AAF03wc0AgAAAHTfBzROOCV{i}",
+                user=types.User(
+                    id=5167898484 + i,
+                    first_name="xin",
+                    language_code="en" if i % 2 else "fa",
+                    allows_write_to_pm=True if i % 3 else None,
+                ),
+                chat=types.Chat(id=-100 - i, type="group", title="xin")
+                if i == 2
+                else None,
+                chat_type="sender",
+            )
+            .sign(self.bot_token, auth_date=1722938610 + i)
+            .to_query_string()
+            for i in range(4)
+        ]
+
+    def test_columns(self):
+        batch = InitDataBatch.parse(self.query_strings)
+        self.assertEqual(len(batch), 4)
+        self.assertEqual(
+            batch["user.id"].to_list(),
+            [5167898484, 5167898485, 5167898486, 5167898487],
+        )
+        self.assertEqual(
+            batch["auth_date"].to_list(),
+            [1722938610, 1722938611, 1722938612, 1722938613],
+        )
+        self.assertEqual(
+            batch["user.language_code"].to_list(), ["fa", "en", "fa", "en"]
+        )
+        self.assertEqual(batch["user.language_code"].categories, ["fa", "en"])
+        self.assertEqual(
+            batch["user.allows_write_to_pm"].to_list(),
+            [None, True, True, None],
+        )
+        self.assertEqual(batch["chat.id"].to_list(), [None, None, -102, None])
+        self.assertEqual(batch["receiver.id"].to_list(), [None] * 4)
+
+    def test_interned_categories(self):
+        batch = InitDataBatch.parse(self.query_strings)
+        column = batch["chat_type"]
+        self.assertIs(column[0], column[3])
+
+    def test_rows(self):
+        batch = InitDataBatch.parse(self.query_strings)
+        row = batch.row(-2)
+        self.assertEqual(row["chat.type"], "group")
+        self.assertEqual(row.to_dict()["user.first_name"], "xin")
+        self.assertNotIn("receiver.id", row.to_dict())
+        self.assertEqual([row["user.id"] for row in batch][0], 5167898484)
+        with self.assertRaises(IndexError):
+            batch.row(4)
+
+    def test_selected_columns(self):
+        batch = InitDataBatch.parse(
+            self.query_strings, columns=["user.id", "auth_date"]
+        )
+        self.assertEqual(list(batch.columns), ["user.id", "auth_date"])
+        with self.assertRaises(ValueError):
+            InitDataBatch(columns=["user.age"])
+
+    def test_invalid(self):
+        query_strings = [
+            self.query_strings[0],
+            "auth_date=1&hash=x&user=%7B%22id%22%3A%22x%22%7D",
+            "auth_date=1&hash=x&user=%7B%22id%22%3A1%7D",
+            "query_id=1",
+            f"auth_date={2**63}&hash=x",
+        ]
+        for query_string in query_strings[1:]:
+            with self.assertRaises(errors.UnexpectedFormatError):
+                InitDataBatch.parse([query_string])
+
+        batch = InitDataBatch.parse(query_strings, raise_error=False)
+        self.assertEqual(len(batch), 5)
+        self.assertEqual(batch["hash"].to_list()[1:], [None] * 4)
+        self.assertEqual(batch["user.id"][0], 5167898484)
+
+    def test_bytes_input(self):
+        batch = InitDataBatch.parse(qs.encode() for qs in self.query_strings)
+        self.assertEqual(batch["user.first_name"].to_list(), ["xin"] * 4)
+
+    def test_incomplete_column(self):
+        class Incomplete(Column):
+            def append(self, value):
+                pass
+
+        with self.assertRaises(TypeError):
+            Incomplete()
+
+    @unittest.skipIf(numpy is None, "NumPy is not installed")
+    def test_to_numpy(self):
+        batch = InitDataBatch.parse(self.query_strings)
+        ids = batch["user.id"].to_numpy()
+        self.assertEqual(ids.dtype, numpy.int64)
+        self.assertEqual(ids.tolist(), batch["user.id"].to_list())
+        self.assertEqual(
+            batch["chat.id"].validity.to_numpy().tolist(),
+            [False, False, True, False],
+        )
+        self.assertEqual(
+            batch["user.language_code"].to_numpy().tolist(), [0, 1, 0, 1]
+        )
+        # NOTE: The array shares memory with the column.
+        with self.assertRaises(BufferError):
+            batch.append(self.query_strings[0])
+        self.assertEqual(
+            {len(column) for column in batch.columns.values()}, {4}
+        )
+        del ids
+        batch.append(self.query_strings[0])
+        self.assertEqual(batch["user.id"][-1], 5167898484)
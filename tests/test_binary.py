@@ -0,0 +1,113 @@
+import pickle
+import unittest
+
+from init_data_py import FrozenInitData, InitData, errors, types
+
+
+class TestBinary(unittest.TestCase):
+    def setUp(self) -> None:
+        self.bot_token = "7244657541:AAEgqk0HDC3WD5cdbnGMdd6L0TJ74FDp97Y"
+        self.query_string = "query_id=AAF03wc0AgAAAHTfBzROOCVW&user=%7B%22id%22%3A5167898484%2C%22first_name%22%3A%22xin%22%2C%22last_name%22%3A%22%22%2C%22username%22%3A%22pvnimaxin%22%2C%22language_code%22%3A%22en%22%2C%22allows_write_to_pm%22%3Atrue%7D&auth_date=1722938610&hash=8654c8c617c143abf656f4f159be2539880a56f58c2d9be622f90c0346aa162b"
+
+    def test_round_trip(self):
+        for lazy in (False, True):
+            init_data = InitData.parse(self.query_string, lazy=lazy)
+            data = init_data.to_bytes()
+            self.assertLess(len(data), len(init_data.to_json().encode()))
+
+            restored = InitData.from_bytes(data)
+            self.assertEqual(restored, InitData.parse(self.query_string))
+            self.assertTrue(restored.validate(self.bot_token))
+
+    def test_all_fields(self):
+        user = types.User._from_dict(
+            {
+                "id": 2**52,
+                "is_bot": False,
+                "first_name": "Артём 🚀",
+                "is_premium": True,
+                "photo_url": "https://t.me/i/userpic/320/x.svg",
+                "new_field": {"nested": [1, "/"]},
+            }
+        )
+        init_data = InitData(
+            query_id="",
+            user=user,
+            receiver=types.User(id=1, first_name="bot", is_bot=True),
+            chat=types.Chat(id=-(2**52), type="group", title="東京"),
+            chat_type="group",
+            chat_instance="-7372855463629395234",
+            start_param="s" * 512,
+            can_send_after=-1,
+            signature="f" * 86,
+        ).sign(self.bot_token, 1722938610)
+
+        restored = InitData.from_bytes(bytearray(init_data.to_bytes()))
+        self.assertEqual(restored, init_data)
+        self.assertIs(restored.user.is_bot, False)  # type: ignore
+        self.assertEqual(restored.user.extra, user.extra)  # type: ignore
+        self.assertIsNone(restored.chat.extra)  # type: ignore
+        self.assertTrue(restored.validate(self.bot_token))
+
+        # NOTE: JSON may hold lone surrogates, which UTF-8 can't encode.
+        init_data = InitData(start_param="\ud800", auth_date=1)
+        restored = InitData.from_bytes(init_data.to_bytes())
+        self.assertEqual(restored.start_param, "\ud800")
+
+    def test_frozen(self):
+        frozen = FrozenInitData.parse(self.query_string)
+        self.assertIs(frozen.to_bytes(), frozen.to_bytes())
+
+        restored = FrozenInitData.from_bytes(memoryview(frozen.to_bytes()))
+        self.assertIsInstance(restored, FrozenInitData)
+        self.assertEqual(restored, frozen)
+
+    def test_raw_json(self):
+        init_data = InitData(
+            chat=types.Chat(id=1, type="group", title="a/b"),
+            auth_date=1722938610,
+        )
+        InitData.user.set_raw(
+            init_data, '{"id":5167898484,"new_field":1,"first_name":"xin"}'
+        )
+        InitData.receiver.set_raw(init_data, '{"first_name":"bot","id":1}')
+        query_string = init_data.sign(
+            self.bot_token, 1722938610
+        ).to_query_string()
+
+        for cls in (InitData, FrozenInitData):
+            for lazy in (False, True):
+                with self.subTest(cls=cls, lazy=lazy):
+                    parsed = cls.parse(query_string, lazy=lazy)
+                    self.assertTrue(parsed.validate(self.bot_token))
+
+                    restored = cls.from_bytes(parsed.to_bytes())
+                    self.assertIsInstance(restored, cls)
+                    self.assertEqual(restored, parsed)
+                    self.assertEqual(restored.user.extra, {"new_field": 1})  # type: ignore
+                    self.assertEqual(restored.receiver.id, 1)  # type: ignore
+                    self.assertTrue(restored.validate(self.bot_token))
+                    self.assertEqual(restored.to_query_string(), query_string)
+
+    def test_malformed(self):
+        data = InitData.parse(self.query_string).to_bytes()
+        cases = [b"", data[:3], data[:-1], data + b"x", b"XX" + data[2:]]
+        cases.append(data[:2] + b"\x02" + data[3:])
+
+        for case in cases:
+            with self.assertRaises(errors.UnexpectedFormatError):
+                InitData.from_bytes(case)
+
+    def test_too_large(self):
+        init_data = InitData(start_param="s" * 65536, auth_date=1)
+        with self.assertRaises(ValueError):
+            init_data.to_bytes()
+
+        with self.assertRaises(ValueError):
+            InitData(auth_date=2**63).to_bytes()
+
+    def test_smaller_than_pickle(self):
+        init_data = InitData.parse(self.query_string)
+        self.assertLess(
+            len(init_data.to_bytes()), len(pickle.dumps(init_data))
+        )
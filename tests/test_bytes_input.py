@@ -0,0 +1,30 @@
+import unittest
+
+from init_data_py import InitData, Validator, errors
+
+
+class TestBytesInput(unittest.TestCase):
+    def setUp(self) -> None:
+        self.query_string = "query_id=AAF2GVE4AwAAAHYZUTgHczdc&user=%7B%22id%22%3A7387289974%2C%22first_name%22%3A%22%D0%90%D1%80%D1%82%D1%91%D0%BC%22%2C%22last_name%22%3A%22%D0%9E%D0%BD%D1%83%D1%84%D1%80%D0%B8%D0%B9%22%2C%22username%22%3A%22typexin%22%2C%22language_code%22%3A%22en%22%2C%22allows_write_to_pm%22%3Atrue%7D&auth_date=1724048856&hash=53b22bc70a748dae613a5aa91890b387b9cc0356c5dcffca173816b6e40a17e5"
+        self.validator = Validator(
+            "7244657541:AAHAJP25XehV6N02kiLLAEi2el-xLsSw29w"
+        )
+        data = self.query_string.encode()
+        self.inputs = [data, bytearray(data), memoryview(b"tma " + data)[4:]]
+
+    def test_parse(self):
+        expected = InitData.parse(self.query_string)
+        for query_string in self.inputs:
+            self.assertEqual(InitData.parse(query_string), expected)
+
+    def test_validate_raw(self):
+        expected = self.validator.validate_raw(self.query_string)
+        for query_string in self.inputs:
+            self.assertEqual(
+                self.validator.validate_raw(query_string), expected
+            )
+
+    def test_invalid(self):
+        query_string = self.query_string.replace("typexin", "nixepyt")
+        with self.assertRaises(errors.SignInvalidError):
+            self.validator.validate_raw(query_string.encode())
@@ -0,0 +1,53 @@
+import time
+import unittest
+from unittest import mock
+
+from init_data_py import InitData, errors, types
+from init_data_py.cache import ValidationCache
+
+
+class TestValidationCache(unittest.TestCase):
+    def setUp(self) -> None:
+        self.bot_token = "7244657541:AAEgqk0HDC3WD5cdbnGMdd6L0TJ74FDp97Y"
+        self.init_data = InitData(
+            user=types.User(id=5167898484, first_name="xin"),
+        )
+
+    def query_string(self, auth_date=None, query_id=None):
+        self.init_data.query_id = query_id
+        return self.init_data.sign(self.bot_token, auth_date).to_query_string()
+
+    def test_hit(self):
+        cache = ValidationCache(self.bot_token, lifetime=3600)
+        query_string = self.query_string()
+        init_data = cache.validate(query_string)
+        self.assertIs(cache.validate(query_string), init_data)
+        self.assertEqual(init_data.user.id, 5167898484)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+
+    def test_expired_entry(self):
+        cache = ValidationCache(self.bot_token, lifetime=10)
+        now = int(time.time())
+        query_string = self.query_string(now)
+        cache.validate(query_string)
+        with mock.patch("time.time", return_value=now + 11):
+            with self.assertRaises(errors.ExpiredError):
+                cache.validate(query_string)
+        self.assertEqual(len(cache), 0)
+
+    def test_invalid_not_cached(self):
+        cache = ValidationCache(self.bot_token)
+        query_string = self.query_string().replace("xin", "nix")
+        for _ in range(2):
+            with self.assertRaises(errors.SignInvalidError):
+                cache.validate(query_string)
+        self.assertEqual((len(cache), cache.misses), (0, 2))
+
+    def test_max_size(self):
+        cache = ValidationCache(self.bot_token, max_size=3)
+        query_strings = [self.query_string(query_id=str(i)) for i in range(5)]
+        for query_string in query_strings:
+            cache.validate(query_string)
+        self.assertEqual(len(cache), 3)
+        cache.validate(query_strings[-1])
+        self.assertEqual(cache.hits, 1)
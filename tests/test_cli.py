@@ -0,0 +1,118 @@
+import contextlib
+import io
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from init_data_py import InitData, cli, types
+
+
+class TestCli(unittest.TestCase):
+    def setUp(self) -> None:
+        self.bot_token = "7244657541:AAEgqk0HDC3WD5cdbnGMdd6L0TJ74FDp97Y"
+        init_data = InitData(
+            user=types.User(id=5167898484, first_name="xin"),
+        ).sign(self.bot_token, auth_date=1722938610)
+        self.valid = init_data.to_query_string()
+        self.invalid = self.valid.replace("xin", "nix")
+        self.lines = [self.valid, self.invalid, "", "query_id=1", self.valid]
+
+    def run_cli(self, content, *args, bot_token=True):
+        with tempfile.NamedTemporaryFile("w", delete=False) as file:
+            file.write(content)
+        self.addCleanup(os.unlink, file.name)
+
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with contextlib.redirect_stdout(stdout):
+            with contextlib.redirect_stderr(stderr):
+                if bot_token:
+                    args += ("--bot-token", self.bot_token)
+                status = cli.main([file.name, *args])
+
+        return status, stdout.getvalue(), stderr.getvalue()
+
+    def test_verdicts(self):
+        status, stdout, stderr = self.run_cli(
+            "\n".join(self.lines) + "\n", "--workers", "0"
+        )
+        self.assertEqual(status, 1)
+        self.assertEqual(
+            stdout.splitlines(),
+            [
+                "1\tvalid",
+                "2\tSignInvalidError",
+                "3\tUnexpectedFormatError",
+                "4\tSignMissingError",
+                "5\tvalid",
+            ],
+        )
+        self.assertIn("total\t5", stderr)
+        self.assertIn("valid\t2", stderr)
+        self.assertIn("SignInvalidError\t1", stderr)
+
+    def test_process_pool(self):
+        lines = [self.valid, self.invalid] * 300
+        status, stdout, stderr = self.run_cli(
+            "\r\n".join(lines),
+            "--workers",
+            "2",
+            "--chunksize",
+            "64",
+            "--only-invalid",
+        )
+        self.assertEqual(
+            stdout.splitlines(),
+            [f"{i}\tSignInvalidError" for i in range(2, 601, 2)],
+        )
+        self.assertIn("valid\t300", stderr)
+
+    def test_field(self):
+        content = "\n".join(
+            [
+                json.dumps({"request": {"tma": self.valid}}),
+                json.dumps({"request": {}}),
+                "not json",
+            ]
+        )
+        status, stdout, _ = self.run_cli(
+            content, "--field", "request.tma", "--workers", "0"
+        )
+        self.assertEqual(
+            stdout.splitlines(),
+            [
+                "1\tvalid",
+                "2\tUnexpectedFormatError",
+                "3\tUnexpectedFormatError",
+            ],
+        )
+
+    def test_expired(self):
+        status, stdout, _ = self.run_cli(
+            self.valid, "--lifetime", "3600", "--workers", "0"
+        )
+        self.assertEqual(stdout, "1\tExpiredError\n")
+
+    def test_all_valid(self):
+        status, _, stderr = self.run_cli(self.valid, "--workers", "0")
+        self.assertEqual(status, 0)
+        self.assertEqual(stderr, "total\t1\nvalid\t1\n")
+
+    def test_empty(self):
+        status, stdout, stderr = self.run_cli("", "--workers", "0")
+        self.assertEqual((status, stdout), (0, ""))
+        self.assertEqual(stderr, "total\t0\n")
+
+    def test_bot_token_from_environment(self):
+        environ = {"INIT_DATA_BOT_TOKEN": self.bot_token}
+        with mock.patch.dict(os.environ, environ):
+            status, stdout, _ = self.run_cli(
+                self.valid, "--workers", "0", bot_token=False
+            )
+        self.assertEqual((status, stdout), (0, "1\tvalid\n"))
+
+    def test_missing_bot_token(self):
+        with mock.patch.dict(os.environ, clear=True):
+            with self.assertRaises(SystemExit):
+                self.run_cli(self.valid, "--workers", "0", bot_token=False)
@@ -0,0 +1,123 @@
+import pickle
+import sys
+import threading
+import unittest
+
+from init_data_py import FrozenInitData, InitData, Validator, errors, types
+from init_data_py.concurrency import ConcurrentValidator, ShardedCache
+
+
+class TestShardedCache(unittest.TestCase):
+    def test_bounded(self):
+        cache = ShardedCache(max_size=64, shards=4)
+        for i in range(1000):
+            cache.set(i, str(i))
+            self.assertEqual(cache.get(i), str(i))
+        self.assertLessEqual(len(cache), 64)
+        self.assertIsNone(cache.get(0))
+
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+
+class TestConcurrentValidator(unittest.TestCase):
+    def setUp(self) -> None:
+        self.bot_token = "7244657541:AAEgqk0HDC3WD5cdbnGMdd6L0TJ74FDp97Y"
+        self.query_string = "query_id=AAF03wc0AgAAAHTfBzROOCVW&user=%7B%22id%22%3A5167898484%2C%22first_name%22%3A%22xin%22%2C%22last_name%22%3A%22%22%2C%22username%22%3A%22pvnimaxin%22%2C%22language_code%22%3A%22en%22%2C%22allows_write_to_pm%22%3Atrue%7D&auth_date=1722938610&hash=8654c8c617c143abf656f4f159be2539880a56f58c2d9be622f90c0346aa162b"
+
+    def test_authenticate(self):
+        validator = ConcurrentValidator(self.bot_token)
+        init_data = validator.authenticate(self.query_string)
+
+        self.assertIsInstance(init_data, FrozenInitData)
+        self.assertEqual(init_data, InitData.parse(self.query_string))
+        self.assertTrue(init_data.validate(self.bot_token))
+        self.assertIs(validator.authenticate(self.query_string), init_data)
+        self.assertEqual(validator.stats(), {"hits": 1, "misses": 1})
+
+        with self.assertRaises(AttributeError):
+            init_data.user.id = 1  # type: ignore
+
+        with self.assertRaises(errors.SignInvalidError):
+            validator.authenticate(self.query_string.replace("xin", "nix"))
+
+    def test_expired(self):
+        validator = ConcurrentValidator(self.bot_token, lifetime=3600)
+        with self.assertRaises(errors.ExpiredError):
+            validator.authenticate(self.query_string)
+
+    def test_validator_methods(self):
+        validator = ConcurrentValidator(self.bot_token)
+        init_data = InitData.parse(self.query_string)
+        self.assertTrue(validator.validate(init_data))
+
+        expected = Validator(self.bot_token).calculate_hash(init_data)
+        self.assertEqual(validator.calculate_hash(init_data), expected)
+
+        copy = pickle.loads(pickle.dumps(validator))
+        self.assertTrue(copy.validate(init_data))
+
+    def test_threads(self):
+        validator = ConcurrentValidator(
+            self.bot_token, cache_size=32, shards=4
+        )
+        template = InitData(user=types.User(id=0, first_name="xin"))
+        query_strings = []
+        for i in range(100):
+            template.user.id = i % 10  # type: ignore
+            template.query_id = str(i)
+            query_strings.append(
+                template.sign(self.bot_token, 1722938610).to_query_string()
+            )
+        invalid = self.query_string.replace("xin", "nix")
+
+        failures = []
+        barrier = threading.Barrier(8)
+
+        def work(offset: int) -> None:
+            barrier.wait()
+            try:
+                for i in range(500):
+                    index = (i * 7 + offset) % len(query_strings)
+                    init_data = validator.authenticate(query_strings[index])
+                    if init_data.query_id != str(index):
+                        failures.append(index)
+                    if init_data.user.id != index % 10:  # type: ignore
+                        failures.append(index)
+                    with self.assertRaises(errors.SignInvalidError):
+                        validator.authenticate(invalid)
+            except Exception as e:
+                failures.append(e)
+
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            threads = [
+                threading.Thread(target=work, args=(n,)) for n in range(8)
+            ]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        finally:
+            sys.setswitchinterval(interval)
+
+        self.assertEqual(failures, [])
+        stats = validator.stats()
+        self.assertEqual(stats["hits"] + stats["misses"], 8 * 500 * 2)
+        self.assertLessEqual(len(validator.results), 32)
+        self.assertLessEqual(len(validator.objects), 4096)
+
+    def test_short_lived_threads(self):
+        validator = ConcurrentValidator(self.bot_token)
+        validator.authenticate(self.query_string)
+
+        for _ in range(1000):
+            thread = threading.Thread(
+                target=validator.authenticate, args=(self.query_string,)
+            )
+            thread.start()
+            thread.join()
+
+        self.assertLessEqual(len(validator._counters), 1)
+        self.assertEqual(validator.stats(), {"hits": 1000, "misses": 1})
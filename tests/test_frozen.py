@@ -0,0 +1,72 @@
+import pickle
+import unittest
+
+from init_data_py import FrozenInitData, InitData, Validator, types
+
+
+class TestFrozenInitData(unittest.TestCase):
+    def setUp(self) -> None:
+        self.bot_token = "7244657541:AAEgqk0HDC3WD5cdbnGMdd6L0TJ74FDp97Y"
+        self.query_string = "query_id=AAF03wc0AgAAAHTfBzROOCVW&user=%7B%22id%22%3A5167898484%2C%22first_name%22%3A%22xin%22%2C%22last_name%22%3A%22%22%2C%22username%22%3A%22pvnimaxin%22%2C%22language_code%22%3A%22en%22%2C%22allows_write_to_pm%22%3Atrue%7D&auth_date=1722938610&hash=8654c8c617c143abf656f4f159be2539880a56f58c2d9be622f90c0346aa162b"
+
+    def test_parse(self):
+        for lazy in (False, True):
+            frozen = FrozenInitData.parse(self.query_string, lazy=lazy)
+            self.assertIsInstance(frozen, FrozenInitData)
+            self.assertTrue(frozen.validate(self.bot_token))
+            self.assertEqual(frozen.user.username, "pvnimaxin")
+
+    def test_immutable(self):
+        frozen = FrozenInitData.parse(self.query_string)
+        for name in ("hash", "user", "auth_date"):
+            with self.assertRaises(AttributeError):
+                setattr(frozen, name, None)
+        with self.assertRaises(AttributeError):
+            del frozen.hash
+
+    def test_cached_forms(self):
+        frozen = InitData.parse(self.query_string).freeze()
+        self.assertIs(frozen._data_check_string(), frozen._data_check_string())
+        self.assertIs(frozen.to_query_string(), frozen.to_query_string())
+        self.assertIs(frozen.to_json(), frozen.to_json())
+        self.assertIs(str(frozen), str(frozen))
+
+        init_data = frozen.thaw()
+        self.assertEqual(frozen.to_query_string(), init_data.to_query_string())
+        self.assertEqual(frozen.to_json(), init_data.to_json())
+        self.assertEqual(str(frozen), str(init_data))
+
+    def test_hashable(self):
+        a = FrozenInitData.parse(self.query_string)
+        b = FrozenInitData.parse(self.query_string, lazy=True)
+        self.assertEqual(a, b)
+        self.assertEqual(len({a, b}), 1)
+        self.assertEqual({a: 1}[b], 1)
+
+        forged = a.thaw()
+        forged.query_id = "forged"
+        self.assertNotEqual(a, forged.freeze())
+
+    def test_sign(self):
+        frozen = FrozenInitData(
+            user=types.User(id=5167898484, first_name="xin")
+        )
+        signed = frozen.sign(self.bot_token, auth_date=1722938610)
+        self.assertIsNone(frozen.hash)
+        self.assertIsInstance(signed, FrozenInitData)
+        self.assertTrue(Validator(self.bot_token).validate(signed))
+
+    def test_thaw(self):
+        init_data = FrozenInitData.parse(self.query_string).thaw()
+        self.assertIs(type(init_data), InitData)
+        init_data.query_id = "query_id"
+        self.assertEqual(init_data.query_id, "query_id")
+
+    def test_pickle(self):
+        frozen = FrozenInitData.parse(self.query_string, lazy=True)
+        frozen.to_query_string()
+        copy = pickle.loads(pickle.dumps(frozen))
+        self.assertEqual(copy, frozen)
+        self.assertEqual(copy.to_query_string(), frozen.to_query_string())
+        with self.assertRaises(AttributeError):
+            copy.hash = None
@@ -0,0 +1,80 @@
+import io
+import itertools
+import unittest
+
+from init_data_py import InitData, Validator, types
+from init_data_py.generator import InitDataGenerator
+
+
+class TestInitDataGenerator(unittest.TestCase):
+    def setUp(self) -> None:
+        self.bot_token = "7244657541:AAEgqk0HDC3WD5cdbnGMdd6L0TJ74FDp97Y"
+        self.fields = {
+            "chat": types.Chat(id=-100, type="group", title="100% & more"),
+            "chat_type": "group",
+            "start_param": "a b/c",
+            "can_send_after": 5,
+        }
+        self.user = {
+            "first_name": "xin",
+            "photo_url": "https://t.me/i/userpic/320/x y.svg",
+            "language_code": "en",
+        }
+        self.template = InitData(
+            user=types.User(id=1, **self.user), **self.fields
+        )
+
+    def expected(self, query_id, user_id, auth_date):
+        return (
+            InitData(
+                query_id=query_id,
+                user=types.User(id=user_id, **self.user),
+                **self.fields,
+            )
+            .sign(self.bot_token, auth_date)
+            .to_query_string()
+        )
+
+    def test_stream(self):
+        generator = InitDataGenerator(self.bot_token, self.template)
+        values = [("q 1", 10, 1722938610), ("q/%2", 5167898484, 1722938611)]
+        query_ids, user_ids, auth_dates = zip(*values)
+
+        lines = generator.stream(query_ids, user_ids, auth_dates)
+        for line, args in itertools.zip_longest(lines, values):
+            self.assertEqual(line.decode(), self.expected(*args))
+            Validator(self.bot_token).validate_raw(line)
+
+    def test_template_values(self):
+        generator = InitDataGenerator(self.bot_token, self.template)
+        line = next(generator.stream(auth_dates=[1722938610]))
+        self.assertEqual(line.decode(), self.expected(None, 1, 1722938610))
+
+        template = InitData(query_id="AAF03wc0", auth_date=1722938610)
+        line = next(InitDataGenerator(self.bot_token, template).stream())
+        self.assertEqual(
+            line.decode(),
+            template.sign(self.bot_token, 1722938610).to_query_string(),
+        )
+
+    def test_without_user(self):
+        generator = InitDataGenerator(self.bot_token, InitData())
+        with self.assertRaises(ValueError):
+            generator.stream(user_ids=[1])
+
+        line = next(generator.stream(query_ids=["q"], auth_dates=[10]))
+        init_data = InitData.validate_raw(line, self.bot_token)
+        self.assertEqual(init_data.query_id, "q")
+        self.assertIsNone(init_data.user)
+
+    def test_write(self):
+        generator = InitDataGenerator(self.bot_token, self.template)
+        file = io.BytesIO()
+        count = generator.write(file, user_ids=range(10), batch_size=3)
+
+        lines = file.getvalue().split(b"\n")
+        self.assertEqual(count, 10)
+        self.assertEqual(lines[-1], b"")
+        for user_id, line in enumerate(lines[:-1]):
+            init_data = InitData.validate_raw(line, self.bot_token)
+            self.assertEqual(init_data.user.id, user_id)  # type: ignore
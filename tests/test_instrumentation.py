@@ -0,0 +1,59 @@
+import unittest
+
+from init_data_py import InitData, Validator, errors, instrumentation
+
+
+class TestInstrumentation(unittest.TestCase):
+    def setUp(self) -> None:
+        self.query_string = "query_id=AAF03wc0AgAAAHTfBzROOCVW&user=%7B%22id%22%3A5167898484%2C%22first_name%22%3A%22xin%22%2C%22last_name%22%3A%22%22%2C%22username%22%3A%22pvnimaxin%22%2C%22language_code%22%3A%22en%22%2C%22allows_write_to_pm%22%3Atrue%7D&auth_date=1722938610&hash=8654c8c617c143abf656f4f159be2539880a56f58c2d9be622f90c0346aa162b"
+        self.validator = Validator(
+            "7244657541:AAEgqk0HDC3WD5cdbnGMdd6L0TJ74FDp97Y"
+        )
+        self.metrics = instrumentation.enable()
+        self.addCleanup(instrumentation.disable)
+
+    def test_stages(self):
+        init_data = InitData.parse(self.query_string)
+        self.validator.validate(init_data)
+        self.validator.validate_raw(self.query_string)
+
+        self.assertEqual(
+            dict(self.metrics.calls),
+            {"parse_qsl": 2, "decode": 1, "serialize": 1, "hmac": 2},
+        )
+
+    def test_errors(self):
+        with self.assertRaises(errors.ExpiredError):
+            self.validator.validate_raw(self.query_string, lifetime=10)
+        with self.assertRaises(errors.UnexpectedFormatError):
+            InitData.parse("")
+        init_data = InitData.parse(self.query_string)
+        init_data.hash = "invalid hash"
+        self.assertFalse(self.validator.validate(init_data, raise_error=False))
+
+        self.assertEqual(
+            dict(self.metrics.errors),
+            {
+                "ExpiredError": 1,
+                "UnexpectedFormatError": 1,
+                "SignInvalidError": 1,
+            },
+        )
+
+    def test_prometheus(self):
+        self.validator.validate_raw(self.query_string)
+        with self.assertRaises(errors.SignMissingError):
+            self.validator.validate_raw("auth_date=1")
+
+        text = self.metrics.to_prometheus()
+        self.assertIn(
+            'init_data_py_stage_seconds_count{stage="hmac"} 1\n', text
+        )
+        self.assertIn(
+            'init_data_py_errors_total{error="SignMissingError"} 1\n', text
+        )
+
+    def test_disabled(self):
+        instrumentation.disable()
+        self.validator.validate_raw(self.query_string)
+        self.assertEqual(dict(self.metrics.calls), {})
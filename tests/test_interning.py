@@ -0,0 +1,70 @@
+import pickle
+import unittest
+
+from init_data_py import InitData, interning, types
+
+
+class TestInterning(unittest.TestCase):
+    def setUp(self) -> None:
+        self.pool = interning.enable(interning.InternPool(max_size=2))
+        self.addCleanup(interning.disable)
+        self.query_string = "query_id=AAF03wc0AgAAAHTfBzROOCVW&user=%7B%22id%22%3A5167898484%2C%22first_name%22%3A%22xin%22%2C%22last_name%22%3A%22%22%2C%22username%22%3A%22pvnimaxin%22%2C%22language_code%22%3A%22en%22%2C%22allows_write_to_pm%22%3Atrue%7D&auth_date=1722938610&hash=8654c8c617c143abf656f4f159be2539880a56f58c2d9be622f90c0346aa162b"
+        self.bot_token = "7244657541:AAEgqk0HDC3WD5cdbnGMdd6L0TJ74FDp97Y"
+
+    def test_shared(self):
+        a = InitData.parse(self.query_string)
+        b = InitData.parse(self.query_string, lazy=True)
+        self.assertIs(a.user, b.user)
+        self.assertEqual((self.pool.hits, self.pool.misses), (1, 1))
+        self.assertEqual(self.pool.hit_rate, 0.5)
+        self.assertTrue(b.validate(self.bot_token))
+
+    def test_read_only(self):
+        user = InitData.parse(self.query_string).user
+        self.assertIsInstance(user, types.User)
+        with self.assertRaises(AttributeError):
+            user.first_name = "nix"
+        with self.assertRaises(AttributeError):
+            del user.id
+
+    def test_extra(self):
+        user = types.User.from_json('{"id":1,"first_name":"xin","age":1}')
+        with self.assertRaises(TypeError):
+            user.extra["age"] = 2
+        self.assertEqual(user.to_json(), '{"id":1,"first_name":"xin","age":1}')
+
+    def test_equality(self):
+        interned = types.User.from_json('{"id":1,"first_name":"xin"}')
+        user = types.User(id=1, first_name="xin")
+        self.assertEqual(interned, user)
+        self.assertEqual(user, interned)
+        self.assertNotEqual(interned, types.User(id=2, first_name="xin"))
+
+    def test_keyed_by_type(self):
+        user = types.User.from_json('{"id":1,"first_name":"x","title":"x"}')
+        chat = types.Chat.from_json('{"id":1,"type":"group","title":"x"}')
+        self.assertIsInstance(user, types.User)
+        self.assertIsInstance(chat, types.Chat)
+        self.assertEqual(len(self.pool), 2)
+
+    def test_max_size(self):
+        for i in range(3):
+            types.User.from_json(f'{{"id":{i},"first_name":"xin"}}')
+        self.assertEqual(len(self.pool), 2)
+        types.User.from_json('{"id":0,"first_name":"xin"}')
+        self.assertEqual(self.pool.misses, 4)
+
+    def test_pickle(self):
+        user = types.User.from_json('{"id":1,"first_name":"xin","age":1}')
+        copy = pickle.loads(pickle.dumps(user))
+        self.assertEqual(copy, user)
+        with self.assertRaises(AttributeError):
+            copy.id = 2
+
+    def test_disabled(self):
+        interning.disable()
+        a = types.User.from_json('{"id":1,"first_name":"xin"}')
+        b = types.User.from_json('{"id":1,"first_name":"xin"}')
+        self.assertIsNot(a, b)
+        a.id = 2
+        self.assertEqual(self.pool.misses, 0)
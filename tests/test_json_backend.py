@@ -0,0 +1,56 @@
+import unittest
+
+from init_data_py import InitData, json_backend, types
+
+
+class TestJSONBackend(unittest.TestCase):
+    def setUp(self) -> None:
+        self.query_string = "query_id=AAF03wc0AgAAAHTfBzTtHPDB&user=%7B%22id%22%3A5167898484%2C%22first_name%22%3A%22xin%22%2C%22last_name%22%3A%22%22%2C%22username%22%3A%22pvnimaxin%22%2C%22language_code%22%3A%22en%22%2C%22allows_write_to_pm%22%3Atrue%2C%22photo_url%22%3A%22https%3A%5C%2F%5C%2Ft.me%5C%2Fi%5C%2Fuserpic%5C%2F320%5C%2FYpcdHFmoxukmQ537mOZhe-Woot_k2xrmbdAIrGK1zFgIVth6Wzacz7P2nGNCcp9j.svg%22%7D&auth_date=1731441609&hash=f4bac82fe8f20abdc03126af489751752e830227b58241ec2f9dd67913909ee0"
+        self.bot_token = "7244657541:AAFMjYH4kc3U9zG0GWnxYfW-QKICVzDwvEw"
+        self.user = types.User(
+            id=2**70,
+            first_name='Артём 😀 "x"\n\x00',
+            allows_write_to_pm=True,
+        )
+        self.addCleanup(json_backend.set_backend, json_backend.name)
+
+    def _backends(self):
+        """Yields the name of each installed backend, after selecting it."""
+        for backend in ("json", "orjson", "msgspec"):
+            try:
+                json_backend.set_backend(backend)
+            except ImportError:
+                continue
+
+            yield backend
+
+    def test_backends(self):
+        json_backend.set_backend("json")
+        expected_json = self.user.to_json()
+
+        for backend in self._backends():
+            with self.subTest(backend=backend):
+                self.assertEqual(self.user.to_json(), expected_json)
+                self.assertEqual(
+                    types.User.from_json(expected_json), self.user
+                )
+                init_data = InitData.parse(self.query_string)
+                self.assertTrue(init_data.validate(self.bot_token))
+
+    def test_floats(self):
+        user = types.User(id=1, first_name="xin")
+        user.extra = {"score": [1.5, 1e-07, 1e16, 1e22, float("nan")]}
+        json_backend.set_backend("json")
+        expected_json = user.to_json()
+
+        for backend in self._backends():
+            with self.subTest(backend=backend):
+                self.assertEqual(user.to_json(), expected_json)
+                self.assertEqual(
+                    types.User.from_json(expected_json).to_json(),
+                    expected_json,
+                )
+
+    def test_unknown_backend(self):
+        with self.assertRaises(ValueError):
+            json_backend.set_backend("simplejson")
@@ -0,0 +1,107 @@
+import unittest
+from wsgiref.util import setup_testing_defaults
+
+from init_data_py import InitData
+from init_data_py.middleware import ASGIMiddleware, WSGIMiddleware
+
+
+class TestMiddleware(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.bot_token = "7244657541:AAEgqk0HDC3WD5cdbnGMdd6L0TJ74FDp97Y"
+        self.query_string = "query_id=AAF03wc0AgAAAHTfBzROOCVW&user=%7B%22id%22%3A5167898484%2C%22first_name%22%3A%22xin%22%2C%22last_name%22%3A%22%22%2C%22username%22%3A%22pvnimaxin%22%2C%22language_code%22%3A%22en%22%2C%22allows_write_to_pm%22%3Atrue%7D&auth_date=1722938610&hash=8654c8c617c143abf656f4f159be2539880a56f58c2d9be622f90c0346aa162b"
+        self.forged = self.query_string.replace("xin", "nix")
+
+    async def asgi(self, authorization=None, path="/", **kwargs):
+        seen = {}
+
+        async def app(scope, receive, send):
+            seen["init_data"] = scope.get("state", {}).get("init_data")
+            await send({"type": "http.response.start", "status": 200})
+            await send({"type": "http.response.body", "body": b"ok"})
+
+        async def send(message):
+            messages.append(message)
+
+        messages = []
+        headers = [(b"host", b"localhost")]
+        if authorization is not None:
+            headers.append((b"authorization", authorization.encode()))
+        scope = {"type": "http", "path": path, "headers": headers}
+
+        middleware = ASGIMiddleware(app, self.bot_token, **kwargs)
+        await middleware(scope, None, send)
+
+        return (
+            messages[0]["status"],
+            dict(messages[0].get("headers", [])),
+            seen,
+        )
+
+    def wsgi(self, authorization=None, path="/", **kwargs):
+        seen = {}
+
+        def app(environ, start_response):
+            seen["init_data"] = environ.get("init_data_py.init_data")
+            start_response("200 OK", [])
+            return [b"ok"]
+
+        def start_response(status, headers):
+            response.extend([int(status.split()[0]), dict(headers)])
+
+        response = []
+        environ = {"PATH_INFO": path}
+        setup_testing_defaults(environ)
+        if authorization is not None:
+            environ["HTTP_AUTHORIZATION"] = authorization
+
+        middleware = WSGIMiddleware(app, self.bot_token, **kwargs)
+        middleware(environ, start_response)
+
+        return response[0], response[1], seen
+
+    async def test_asgi(self):
+        status, _, seen = await self.asgi(f"tma {self.query_string}")
+        self.assertEqual(status, 200)
+        self.assertEqual(seen["init_data"], InitData.parse(self.query_string))
+
+        status, headers, _ = await self.asgi()
+        self.assertEqual((status, headers[b"www-authenticate"]), (401, b"tma"))
+        status, _, _ = await self.asgi(f"Bearer {self.query_string}")
+        self.assertEqual(status, 401)
+        status, _, _ = await self.asgi(f"tma {self.query_string}", lifetime=1)
+        self.assertEqual(status, 401)
+        status, _, _ = await self.asgi(f"tma {self.forged}")
+        self.assertEqual(status, 403)
+        status, _, _ = await self.asgi("tma query_id=1")
+        self.assertEqual(status, 401)
+
+    async def test_asgi_passthrough(self):
+        status, _, seen = await self.asgi(
+            path="/health", exclude_paths={"/health"}
+        )
+        self.assertEqual(status, 200)
+        self.assertIsNone(seen["init_data"])
+
+        async def app(scope, receive, send):
+            seen["scope"] = scope
+
+        middleware = ASGIMiddleware(app, self.bot_token)
+        await middleware({"type": "lifespan"}, None, None)
+        self.assertEqual(seen["scope"], {"type": "lifespan"})
+
+    def test_wsgi(self):
+        status, _, seen = self.wsgi(f"tma {self.query_string}")
+        self.assertEqual(status, 200)
+        self.assertEqual(seen["init_data"], InitData.parse(self.query_string))
+
+        status, headers, _ = self.wsgi()
+        self.assertEqual((status, headers["WWW-Authenticate"]), (401, "tma"))
+        status, _, _ = self.wsgi(f"TMA  {self.query_string}")
+        self.assertEqual(status, 200)
+        status, _, _ = self.wsgi(f"tma {self.forged}")
+        self.assertEqual(status, 403)
+
+    def test_wsgi_exclude_paths(self):
+        status, _, seen = self.wsgi(path="/health", exclude_paths={"/health"})
+        self.assertEqual(status, 200)
+        self.assertIsNone(seen["init_data"])
@@ -27,3 +27,82 @@ class TestParseInitData(unittest.TestCase):
     def test_invalid_query_string(self):
         with self.assertRaises(errors.UnexpectedFormatError):
             InitData.parse(self.query_string.upper())
+
+    def test_lazy_query_string(self):
+        init_data = InitData.parse(self.query_string, lazy=True)
+        self.assertEqual(init_data, self.expected_init_data)
+
+    def test_lazy_decoding_is_deferred(self):
+        query_string = self.query_string.replace("%7B", "%5B", 1)
+        init_data = InitData.parse(query_string, lazy=True)
+        self.assertEqual(init_data.to_query_string(), query_string)
+        with self.assertRaises(errors.UnexpectedFormatError):
+            init_data.user
+
+    def test_lazy_validation_after_access(self):
+        # NOTE: Key order differing from `User._fields`, and an unknown field
+        # in the middle, can't be reproduced by serializing the object.
+        raw = '{"first_name":"xin","new_field":1,"id":5167898484}'
+        bot_token = "7244657541:AAEgqk0HDC3WD5cdbnGMdd6L0TJ74FDp97Y"
+        init_data = InitData(auth_date=1722938610)
+        InitData.user.set_raw(init_data, raw)
+        query_string = init_data.sign(bot_token, 1722938610).to_query_string()
+
+        init_data = InitData.parse(query_string, lazy=True)
+        self.assertTrue(init_data.validate(bot_token))
+        self.assertEqual(init_data.user.id, 5167898484)  # type: ignore
+        self.assertTrue(init_data.validate(bot_token))
+        self.assertEqual(init_data.to_query_string(), query_string)
+
+        init_data.user = types.User(id=1, first_name="xin")
+        self.assertFalse(init_data.validate(bot_token, raise_error=False))
+
+    def test_unknown_field_in_the_middle(self):
+        raw = '{"id":5167898484,"new_field":1,"first_name":"xin"}'
+        bot_token = "7244657541:AAEgqk0HDC3WD5cdbnGMdd6L0TJ74FDp97Y"
+        init_data = InitData(auth_date=1722938610)
+        InitData.user.set_raw(init_data, raw)
+        query_string = init_data.sign(bot_token, 1722938610).to_query_string()
+
+        init_data = InitData.parse(query_string)
+        self.assertEqual(init_data.user.extra, {"new_field": 1})  # type: ignore
+        self.assertTrue(init_data.validate(bot_token))
+        self.assertEqual(init_data.to_query_string(), query_string)
+
+    def test_edit_after_parse(self):
+        raw = '{"id":5167898484,"new_field":1,"first_name":"xin"}'
+        bot_token = "7244657541:AAEgqk0HDC3WD5cdbnGMdd6L0TJ74FDp97Y"
+        init_data = InitData(auth_date=1722938610)
+        InitData.user.set_raw(init_data, raw)
+        query_string = init_data.sign(bot_token, 1722938610).to_query_string()
+
+        for lazy in (False, True):
+            with self.subTest(lazy=lazy):
+                init_data = InitData.parse(query_string, lazy=lazy)
+                init_data.user.first_name = "CHANGED"  # type: ignore
+                self.assertFalse(
+                    init_data.validate(bot_token, raise_error=False)
+                )
+
+                init_data.sign(bot_token, 1722938610)
+                parsed = InitData.parse(init_data.to_query_string())
+                self.assertEqual(parsed.user.first_name, "CHANGED")  # type: ignore
+                self.assertEqual(parsed.user.extra, {"new_field": 1})  # type: ignore
+                self.assertTrue(parsed.validate(bot_token))
+
+    def test_unknown_object_fields(self):
+        user_json = '{"id":5167898484,"first_name":"xin","new_field":[1,2]}'
+        user = types.User.from_json(user_json)
+        self.assertEqual(user.extra, {"new_field": [1, 2]})
+        self.assertEqual(user.to_json(), user_json)
+
+        bot_token = "7244657541:AAEgqk0HDC3WD5cdbnGMdd6L0TJ74FDp97Y"
+        query_string = InitData(user=user).sign(bot_token).to_query_string()
+        init_data = InitData.parse(query_string)
+        self.assertEqual(init_data.user, user)
+        self.assertTrue(init_data.validate(bot_token))
+
+    def test_missing_object_fields(self):
+        query_string = self.query_string.replace("%22id%22", "%22uid%22")
+        with self.assertRaises(errors.UnexpectedFormatError):
+            InitData.parse(query_string)
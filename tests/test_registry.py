@@ -0,0 +1,82 @@
+import unittest
+
+from init_data_py import InitData, errors, types
+from init_data_py.registry import ValidatorRegistry
+
+
+class TestValidatorRegistry(unittest.TestCase):
+    def setUp(self) -> None:
+        self.bot_tokens = [
+            f"72446575{i}:AAEgqk0HDC3WD5cdbnGMdd6L0TJ74FDp97Y"
+            for i in range(10, 15)
+        ]
+        self.registry = ValidatorRegistry(self.bot_tokens)
+
+    def signed(self, bot_token, query_id="AAF03wc0AgAAAHTfBzROOCVW"):
+        return InitData(
+            query_id=query_id,
+            user=types.User(id=5167898484, first_name="xin"),
+        ).sign(bot_token)
+
+    def test_validate(self):
+        for bot_token in self.bot_tokens:
+            init_data = self.signed(bot_token)
+            key = self.registry.validate(init_data, lifetime=3600)
+            self.assertEqual(key, bot_token.split(":")[0])
+
+    def test_validate_raw(self):
+        query_string = self.signed(self.bot_tokens[2]).to_query_string()
+        key, pairs = self.registry.validate_raw(query_string, 3600)
+        self.assertEqual(key, "7244657512")
+        self.assertEqual(pairs["query_id"], "AAF03wc0AgAAAHTfBzROOCVW")
+
+    def test_mapping_keys(self):
+        registry = ValidatorRegistry({"shop": self.bot_tokens[0]})
+        init_data = self.signed(self.bot_tokens[0])
+        self.assertEqual(registry.validate(init_data), "shop")
+
+    def test_unknown_bot(self):
+        init_data = self.signed("1:unknown")
+        with self.assertRaises(errors.SignInvalidError):
+            self.registry.validate(init_data)
+        with self.assertRaises(errors.SignInvalidError):
+            self.registry.validate_raw(init_data.to_query_string())
+
+    def test_checks_before_hashing(self):
+        init_data = self.signed(self.bot_tokens[0])
+        init_data.auth_date = 0
+        with self.assertRaises(errors.ExpiredError):
+            self.registry.validate(init_data, lifetime=3600)
+        init_data.hash = None
+        with self.assertRaises(errors.SignMissingError):
+            self.registry.validate(init_data)
+
+    def test_adaptive_order(self):
+        init_data = self.signed(self.bot_tokens[-1])
+        for _ in range(3):
+            self.registry.validate(init_data)
+        stats = self.registry.stats()
+        self.assertEqual(next(iter(stats)), "7244657514")
+        self.assertEqual(stats["7244657514"], 3)
+
+    def test_hint(self):
+        init_data = self.signed(self.bot_tokens[3])
+        key = self.registry.validate(init_data, hint="7244657513")
+        self.assertEqual(key, "7244657513")
+        key = self.registry.validate(init_data, hint="7244657510")
+        self.assertEqual(key, "7244657513")
+
+    def test_decay(self):
+        registry = ValidatorRegistry(self.bot_tokens, decay_interval=4)
+        init_data = self.signed(self.bot_tokens[0])
+        for _ in range(4):
+            registry.validate(init_data)
+        self.assertEqual(registry.stats()["7244657510"], 2)
+
+    def test_add_remove(self):
+        init_data = self.signed("1:new")
+        self.assertEqual(self.registry.add("1:new"), "1")
+        self.assertEqual(self.registry.validate(init_data), "1")
+        self.registry.remove("1")
+        with self.assertRaises(errors.SignInvalidError):
+            self.registry.validate(init_data)
@@ -0,0 +1,102 @@
+import concurrent.futures
+import time
+import unittest
+
+from init_data_py import InitData, errors, replay, types
+
+
+class TestReplayGuard(unittest.TestCase):
+    def setUp(self) -> None:
+        self.init_data = InitData(
+            user=types.User(id=5167898484, first_name="xin"),
+        ).sign("7244657541:AAEgqk0HDC3WD5cdbnGMdd6L0TJ74FDp97Y")
+
+    def test_replayed_init_data(self):
+        guard = replay.ReplayGuard(lifetime=3600)
+        self.assertTrue(guard.check(self.init_data))
+        with self.assertRaises(errors.ReplayedError):
+            guard.check(self.init_data)
+        self.assertFalse(guard.check(self.init_data, raise_error=False))
+
+    def test_expired_entries_are_dropped(self):
+        guard = replay.ReplayGuard(lifetime=10)
+        self.init_data.auth_date = int(time.time()) - 20
+        self.assertTrue(guard.check(self.init_data))
+        self.assertTrue(guard.check(self.init_data))
+
+    def test_max_size(self):
+        storage = replay.MemoryStorage(max_size=10)
+        guard = replay.ReplayGuard(lifetime=3600, storage=storage)
+        for i in range(100):
+            self.init_data.hash = str(i)
+            guard.check(self.init_data)
+        self.assertEqual(len(storage), 10)
+
+    def test_memory_storage_threads(self):
+        storage = replay.MemoryStorage(max_size=64)
+        now = time.time()
+
+        def add(i: int) -> bool:
+            return storage.add(str(i % 256).encode(), now + 3600, now)
+
+        with concurrent.futures.ThreadPoolExecutor(8) as executor:
+            accepted = list(executor.map(add, range(256 * 8)))
+
+        # NOTE: Each key is accepted once, then evicted by later keys.
+        self.assertLessEqual(len(storage), 64)
+        self.assertGreaterEqual(sum(accepted), 256)
+
+        storage = replay.MemoryStorage()
+        with concurrent.futures.ThreadPoolExecutor(8) as executor:
+            accepted = list(executor.map(lambda _: add(0), range(1000)))
+        self.assertEqual(sum(accepted), 1)
+
+    def test_query_id_key(self):
+        guard = replay.ReplayGuard(lifetime=3600, key="query_id")
+        with self.assertRaises(errors.UnexpectedFormatError):
+            guard.check(self.init_data)
+
+    def test_shared_memory_storage(self):
+        storage = replay.SharedMemoryStorage(capacity=64)
+        self.addCleanup(storage.unlink)
+        self.addCleanup(storage.close)
+        guard = replay.ReplayGuard(lifetime=3600, storage=storage)
+
+        attached = replay.SharedMemoryStorage(
+            capacity=64, name=storage.name, lock=storage.lock
+        )
+        self.addCleanup(attached.close)
+        other = replay.ReplayGuard(lifetime=3600, storage=attached)
+
+        self.assertTrue(guard.check(self.init_data))
+        self.assertFalse(other.check(self.init_data, raise_error=False))
+
+        for i in range(1000):
+            self.init_data.hash = str(i)
+            self.assertTrue(guard.check(self.init_data))
+
+    def test_shared_memory_storage_attach_errors(self):
+        storage = replay.SharedMemoryStorage(capacity=64)
+        self.addCleanup(storage.unlink)
+        self.addCleanup(storage.close)
+
+        with self.assertRaises(ValueError):
+            replay.SharedMemoryStorage(capacity=64, name=storage.name)
+
+        with self.assertRaises(ValueError):
+            replay.SharedMemoryStorage(
+                capacity=1_000_000, name=storage.name, lock=storage.lock
+            )
+
+    def test_shared_memory_storage_across_processes(self):
+        storage = replay.SharedMemoryStorage(capacity=64)
+        self.addCleanup(storage.unlink)
+        self.addCleanup(storage.close)
+        guard = replay.ReplayGuard(lifetime=3600, storage=storage)
+
+        with concurrent.futures.ProcessPoolExecutor(
+            1, initializer=guard.check, initargs=(self.init_data,)
+        ) as executor:
+            executor.submit(time.sleep, 0).result()
+
+        self.assertFalse(guard.check(self.init_data, raise_error=False))
@@ -0,0 +1,81 @@
+import time
+import unittest
+
+from init_data_py import InitData, Validator, errors
+from init_data_py.screening import Prescreen
+
+
+class TestPrescreen(unittest.TestCase):
+    def setUp(self) -> None:
+        self.query_string = "query_id=AAF03wc0AgAAAHTfBzROOCVW&user=%7B%22id%22%3A5167898484%2C%22first_name%22%3A%22xin%22%2C%22last_name%22%3A%22%22%2C%22username%22%3A%22pvnimaxin%22%2C%22language_code%22%3A%22en%22%2C%22allows_write_to_pm%22%3Atrue%7D&auth_date=1722938610&hash=8654c8c617c143abf656f4f159be2539880a56f58c2d9be622f90c0346aa162b"
+        self.prescreen = Prescreen()
+
+    def test_valid_query_string(self):
+        for query_string in (
+            self.query_string,
+            self.query_string.encode(),
+            memoryview(self.query_string.encode()),
+        ):
+            self.prescreen.check(query_string)
+
+    def test_too_long(self):
+        with self.assertRaises(errors.UnexpectedFormatError):
+            Prescreen(max_length=100).check(self.query_string)
+
+    def test_too_many_fields(self):
+        with self.assertRaises(errors.UnexpectedFormatError):
+            self.prescreen.check(self.query_string + "&a=1" * 16)
+
+    def test_missing_fields(self):
+        with self.assertRaises(errors.SignMissingError):
+            self.prescreen.check(self.query_string.replace("&hash=", "&h="))
+        with self.assertRaises(errors.AuthDateMissingError):
+            self.prescreen.check(self.query_string.replace("auth_date", "a"))
+        with self.assertRaises(errors.AuthDateMissingError):
+            self.prescreen.check(self.query_string.replace("&auth", "&xauth"))
+
+    def test_invalid_auth_date(self):
+        with self.assertRaises(errors.UnexpectedFormatError):
+            self.prescreen.check(
+                self.query_string.replace("=1722938610", "=1722938610x")
+            )
+
+    def test_expired(self):
+        prescreen = Prescreen(lifetime=3600)
+        with self.assertRaises(errors.ExpiredError):
+            prescreen.check(self.query_string)
+        prescreen.check(
+            self.query_string.replace("1722938610", str(int(time.time())))
+        )
+
+    def test_parse_and_validate_raw(self):
+        prescreen = Prescreen(lifetime=3600)
+        with self.assertRaises(errors.ExpiredError):
+            InitData.parse(self.query_string, prescreen=prescreen)
+
+        validator = Validator(
+            "7244657541:AAEgqk0HDC3WD5cdbnGMdd6L0TJ74FDp97Y",
+            prescreen=Prescreen(max_length=10),
+        )
+        with self.assertRaises(errors.UnexpectedFormatError):
+            validator.validate_raw(self.query_string)
+
+    def test_repeated_and_escaped_fields(self):
+        validator = Validator(
+            "7244657541:AAEgqk0HDC3WD5cdbnGMdd6L0TJ74FDp97Y",
+            prescreen=Prescreen(lifetime=3600),
+        )
+        now = str(int(time.time()))
+        for forged in (
+            f"auth_date={now}&" + self.query_string,
+            f"auth%5Fdate={now}&" + self.query_string,
+            self.query_string.replace(
+                "auth_date=", f"auth_date={now}&a%75th_date="
+            ),
+            "hash=&" + self.query_string,
+        ):
+            with self.subTest(forged=forged):
+                with self.assertRaises(errors.UnexpectedFormatError):
+                    validator.prescreen.check(forged)
+                with self.assertRaises(errors.UnexpectedFormatError):
+                    validator.validate_raw(forged)
@@ -0,0 +1,28 @@
+import unittest
+
+from init_data_py import InitData, types
+
+
+class TestSlots(unittest.TestCase):
+    def test_no_instance_dict(self):
+        user = types.User(id=5167898484, first_name="xin")
+        chat = types.Chat(id=1, type="group", title="xin")
+        init_data = InitData(user=user, chat=chat, auth_date=1722938610)
+        for obj in (user, chat, init_data):
+            self.assertFalse(hasattr(obj, "__dict__"))
+
+    def test_attribute_order(self):
+        user = types.User(
+            first_name="xin",
+            allows_write_to_pm=True,
+            id=5167898484,
+            is_bot=False,
+        )
+        self.assertEqual(
+            user.to_json(),
+            '{"id":5167898484,"is_bot":false,"first_name":"xin","allows_write_to_pm":true}',
+        )
+        init_data = InitData(hash="hash", auth_date=1, query_id="query_id")
+        self.assertEqual(
+            list(init_data.to_dict()), ["query_id", "auth_date", "hash"]
+        )
@@ -0,0 +1,112 @@
+import base64
+import concurrent.futures
+import unittest
+
+from init_data_py import InitData, errors, third_party, types
+
+try:
+    from cryptography.hazmat.primitives.asymmetric.ed25519 import (
+        Ed25519PrivateKey,
+    )
+    from cryptography.hazmat.primitives.serialization import (
+        Encoding,
+        PublicFormat,
+    )
+except ImportError:
+    Ed25519PrivateKey = None
+
+
+@unittest.skipIf(Ed25519PrivateKey is None, "cryptography is not installed")
+class TestThirdParty(unittest.TestCase):
+    def setUp(self) -> None:
+        self.bot_id = 7244657541
+        private_key = Ed25519PrivateKey.generate()
+        self.public_key = private_key.public_key().public_bytes(
+            Encoding.Raw, PublicFormat.Raw
+        )
+        self.validator = third_party.ThirdPartyValidator(
+            self.bot_id, public_key=self.public_key
+        )
+
+        init_data = InitData(
+            query_id="AAF03wc0AgAAAHTfBzROOCVW",
+            user=types.User(id=5167898484, first_name="xin"),
+            auth_date=1722938610,
+            hash="8654c8c617c143abf656f4f159be2539880a56f58c2d9be622f90c0346aa162b",
+        )
+        pairs = init_data.to_dict(nested=False)
+        del pairs["hash"]
+        data_check_string = f"{self.bot_id}:WebAppData\n" + "\n".join(
+            f"{k}={v}" for k, v in sorted(pairs.items())
+        )
+        signature = private_key.sign(data_check_string.encode())
+        init_data.signature = (
+            base64.urlsafe_b64encode(signature).rstrip(b"=").decode()
+        )
+        self.init_data = init_data
+        self.query_string = init_data.to_query_string()
+
+    def test_validate(self):
+        self.assertTrue(self.validator.validate(self.init_data))
+        parsed = InitData.parse(self.query_string, lazy=True)
+        self.assertTrue(self.validator.validate(parsed))
+
+    def test_validate_raw(self):
+        pairs = self.validator.validate_raw(self.query_string.encode())
+        self.assertEqual(pairs["query_id"], "AAF03wc0AgAAAHTfBzROOCVW")
+
+    def test_invalid(self):
+        forged = self.query_string.replace("xin", "nix")
+        with self.assertRaises(errors.SignInvalidError):
+            self.validator.validate_raw(forged)
+
+        other_bot = third_party.ThirdPartyValidator(
+            1, public_key=self.public_key
+        )
+        self.assertFalse(other_bot.validate(self.init_data, raise_error=False))
+
+        # NOTE: Signed by a different key.
+        with self.assertRaises(errors.SignInvalidError):
+            self.init_data.validate_third_party(self.bot_id)
+
+    def test_missing_signature(self):
+        self.init_data.signature = None
+        with self.assertRaises(errors.SignMissingError):
+            self.validator.validate(self.init_data)
+        with self.assertRaises(errors.SignMissingError):
+            self.validator.validate_raw(self.init_data.to_query_string())
+
+    def test_malformed_signature(self):
+        self.init_data.signature = "not base64!"
+        with self.assertRaises(errors.SignInvalidError):
+            self.validator.validate(self.init_data)
+
+    def test_expired(self):
+        with self.assertRaises(errors.ExpiredError):
+            self.validator.validate_raw(self.query_string, lifetime=3600)
+
+    def test_cached_public_keys(self):
+        a = third_party.ThirdPartyValidator(self.bot_id)
+        b = third_party.ThirdPartyValidator(self.bot_id)
+        test = third_party.ThirdPartyValidator(self.bot_id, test=True)
+        self.assertIs(a._key, b._key)
+        self.assertIsNot(a._key, test._key)
+
+    def test_validate_many(self):
+        forged = self.query_string.replace("xin", "nix")
+        query_strings = [self.query_string, forged] * 100
+        with concurrent.futures.ProcessPoolExecutor(2) as executor:
+            for executor in (None, executor):
+                results = list(
+                    third_party.validate_many(
+                        query_strings,
+                        self.bot_id,
+                        executor=executor,
+                        chunksize=16,
+                        public_key=self.public_key,
+                    )
+                )
+                self.assertEqual(
+                    [result.error for result in results],
+                    [None, "SignInvalidError"] * 100,
+                )
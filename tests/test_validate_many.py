@@ -0,0 +1,63 @@
+import concurrent.futures
+import unittest
+
+from init_data_py import bulk, validate_many
+
+
+class TestValidateMany(unittest.TestCase):
+    def setUp(self) -> None:
+        valid = "query_id=AAF03wc0AgAAAHTfBzROOCVW&user=%7B%22id%22%3A5167898484%2C%22first_name%22%3A%22xin%22%2C%22last_name%22%3A%22%22%2C%22username%22%3A%22pvnimaxin%22%2C%22language_code%22%3A%22en%22%2C%22allows_write_to_pm%22%3Atrue%7D&auth_date=1722938610&hash=8654c8c617c143abf656f4f159be2539880a56f58c2d9be622f90c0346aa162b"
+        self.bot_token = "7244657541:AAEgqk0HDC3WD5cdbnGMdd6L0TJ74FDp97Y"
+        self.query_strings = [
+            valid,
+            valid.replace("xin", "nix"),
+            valid.split("&hash=")[0],
+            "",
+        ] * 25
+        self.expected_errors = [
+            None,
+            "SignInvalidError",
+            "SignMissingError",
+            "UnexpectedFormatError",
+        ] * 25
+
+    def test_sequential(self):
+        results = list(validate_many(self.query_strings, self.bot_token))
+        self.assertEqual([r.index for r in results], list(range(100)))
+        self.assertEqual([r.error for r in results], self.expected_errors)
+        self.assertTrue(results[0].valid)
+
+    def test_bounded_validators(self):
+        for i in range(bulk._MAX_VALIDATORS * 2):
+            list(validate_many(self.query_strings[:1], f"{i}:token"))
+        self.assertEqual(
+            bulk._get_validator.cache_info().currsize, bulk._MAX_VALIDATORS
+        )
+
+    def test_thread_pool_unordered(self):
+        with concurrent.futures.ThreadPoolExecutor(4) as executor:
+            results = validate_many(
+                self.query_strings,
+                self.bot_token,
+                executor=executor,
+                ordered=False,
+                chunksize=7,
+                prefetch=2,
+            )
+            results = sorted(results)
+        self.assertEqual([r.index for r in results], list(range(100)))
+        self.assertEqual([r.error for r in results], self.expected_errors)
+
+    def test_process_pool(self):
+        with concurrent.futures.ProcessPoolExecutor(2) as executor:
+            results = list(
+                validate_many(
+                    self.query_strings,
+                    self.bot_token,
+                    lifetime=3600,
+                    executor=executor,
+                    chunksize=16,
+                )
+            )
+        self.assertEqual([r.index for r in results], list(range(100)))
+        self.assertEqual(results[0].error, "ExpiredError")
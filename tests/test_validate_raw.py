@@ -0,0 +1,42 @@
+import unittest
+
+from init_data_py import InitData, Validator, errors
+
+
+class TestValidateRaw(unittest.TestCase):
+    def setUp(self) -> None:
+        self.query_string = "query_id=AAF03wc0AgAAAHTfBzROOCVW&user=%7B%22id%22%3A5167898484%2C%22first_name%22%3A%22xin%22%2C%22last_name%22%3A%22%22%2C%22username%22%3A%22pvnimaxin%22%2C%22language_code%22%3A%22en%22%2C%22allows_write_to_pm%22%3Atrue%7D&auth_date=1722938610&hash=8654c8c617c143abf656f4f159be2539880a56f58c2d9be622f90c0346aa162b"
+        self.bot_token = "7244657541:AAEgqk0HDC3WD5cdbnGMdd6L0TJ74FDp97Y"
+
+    def test_valid_query_string(self):
+        init_data = InitData.validate_raw(self.query_string, self.bot_token)
+        self.assertEqual(init_data, InitData.parse(self.query_string))
+
+    def test_returns_verified_pairs(self):
+        pairs = Validator(self.bot_token).validate_raw(self.query_string)
+        self.assertEqual(pairs["auth_date"], "1722938610")
+        self.assertTrue(pairs["user"].startswith('{"id":5167898484,'))
+
+    def test_escape_character(self):
+        query_string = "query_id=AAF03wc0AgAAAHTfBzTtHPDB&user=%7B%22id%22%3A5167898484%2C%22first_name%22%3A%22xin%22%2C%22last_name%22%3A%22%22%2C%22username%22%3A%22pvnimaxin%22%2C%22language_code%22%3A%22en%22%2C%22allows_write_to_pm%22%3Atrue%2C%22photo_url%22%3A%22https%3A%5C%2F%5C%2Ft.me%5C%2Fi%5C%2Fuserpic%5C%2F320%5C%2FYpcdHFmoxukmQ537mOZhe-Woot_k2xrmbdAIrGK1zFgIVth6Wzacz7P2nGNCcp9j.svg%22%7D&auth_date=1731441609&hash=f4bac82fe8f20abdc03126af489751752e830227b58241ec2f9dd67913909ee0"
+        bot_token = "7244657541:AAFMjYH4kc3U9zG0GWnxYfW-QKICVzDwvEw"
+        init_data = InitData.validate_raw(query_string, bot_token)
+        self.assertEqual(init_data.user.id, 5167898484)
+
+    def test_invalid_query_string(self):
+        query_string = self.query_string.replace("xin", "nix")
+        with self.assertRaises(errors.SignInvalidError):
+            InitData.validate_raw(query_string, self.bot_token)
+
+    def test_sign_missing(self):
+        query_string = self.query_string.split("&hash=")[0]
+        with self.assertRaises(errors.SignMissingError):
+            InitData.validate_raw(query_string, self.bot_token)
+
+    def test_expired(self):
+        with self.assertRaises(errors.ExpiredError):
+            InitData.validate_raw(self.query_string, self.bot_token, 3600)
+
+    def test_unexpected_format(self):
+        with self.assertRaises(errors.UnexpectedFormatError):
+            InitData.validate_raw("", self.bot_token)
@@ -0,0 +1,71 @@
+import time
+import unittest
+
+from init_data_py import InitData, Validator, errors, types
+
+
+class TestValidator(unittest.TestCase):
+    def setUp(self) -> None:
+        self.init_data = InitData(
+            query_id="AAF03wc0AgAAAHTfBzROOCVW",
+            user=types.User(
+                id=5167898484,
+                first_name="xin",
+                last_name="",
+                username="pvnimaxin",
+                language_code="en",
+                allows_write_to_pm=True,
+            ),
+            auth_date=1722938610,
+            hash="8654c8c617c143abf656f4f159be2539880a56f58c2d9be622f90c0346aa162b",
+        )
+        self.validator = Validator(
+            "7244657541:AAEgqk0HDC3WD5cdbnGMdd6L0TJ74FDp97Y"
+        )
+
+    def test_valid_init_data(self):
+        self.assertTrue(self.validator.validate(self.init_data))
+
+    def test_reused_for_many_calls(self):
+        for _ in range(3):
+            self.assertTrue(self.validator.validate(self.init_data))
+
+    def test_invalid_init_data(self):
+        self.init_data.hash = "invalid hash"
+        with self.assertRaises(errors.SignInvalidError):
+            self.validator.validate(self.init_data)
+        self.assertFalse(
+            self.validator.validate(self.init_data, raise_error=False)
+        )
+
+    def test_expired_init_data(self):
+        lifetime = 10
+        self.init_data.auth_date = int(time.time()) - lifetime - 1
+        with self.assertRaises(errors.ExpiredError):
+            self.validator.validate(self.init_data, lifetime)
+
+    def test_sign(self):
+        expected_hash = self.init_data.hash
+        self.init_data.hash = None
+        self.validator.sign(self.init_data, auth_date=1722938610)
+        self.assertEqual(self.init_data.hash, expected_hash)
+
+    def test_streamed_hash(self):
+        # NOTE: Values around the chunk size are fed to the HMAC in pieces.
+        for size in (0, 4095, 4096, 4097, 10_000):
+            self.init_data.start_param = "/é" * (size // 2) + "x" * (size % 2)
+            self.init_data.can_send_after = size
+
+            pairs = self.init_data.to_dict(nested=False)
+            pairs.pop("hash")
+            data_check_string = "\n".join(
+                f"{k}={v}" for k, v in sorted(pairs.items())
+            ).encode()
+
+            self.assertEqual(
+                self.init_data._data_check_string(), data_check_string
+            )
+            self.assertEqual(
+                self.validator.calculate_hash(self.init_data),
+                self.validator._hexdigest(data_check_string),
+            )